@@ -0,0 +1,280 @@
+"""
+In-memory columnar snapshot of RESULT and its dimensions for the Analytics page
+
+RESULT is held as NumPy column arrays with its foreign keys coded as dense
+indexes into small dimension arrays, so each Analytics aggregation is a few
+np.bincount() calls instead of a join + GROUP BY on the OLTP database. The
+snapshot follows new Result_IDs incrementally and reloads fully only when
+rows were deleted or rewritten, which it learns from the RESULT edits the
+LogResultUpdate/LogResultDelete triggers write to AUDIT_LOG (bulk loads skip
+those triggers: use a forced refresh after reloading history over old rows).
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+
+from columnar_fetch import fetch_frame
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+# Minimum seconds between watermark checks against MySQL
+REFRESH_INTERVAL = float(os.environ.get('F1_ANALYTICS_REFRESH_INTERVAL', 30))
+# Rows per keyset chunk when pulling RESULT
+CHUNK_ROWS = 50_000
+# Backend the Analytics page starts on: 'mysql', 'memory' or 'duckdb'
+DEFAULT_BACKEND = os.environ.get('F1_ANALYTICS_BACKEND', 'mysql')
+
+# (query, ID column) per dimension; rows are kept sorted by ID for searchsorted coding
+DIMENSION_QUERIES = {
+    'race': ("SELECT Race_ID, Circuit_ID, Year FROM RACE", 'Race_ID'),
+    'circuit': ("SELECT Circuit_ID, Circuit_Name, Location FROM CIRCUIT", 'Circuit_ID'),
+    'team': ("SELECT Team_ID, Team_Name FROM TEAM", 'Team_ID'),
+    'driver': ("SELECT Driver_ID, CONCAT(First_Name, ' ', Last_Name) AS Driver_Name FROM DRIVER", 'Driver_ID'),
+    'status': ("SELECT Status_ID, Status_description FROM STATUS", 'Status_ID'),
+}
+
+RESULT_QUERY = """
+SELECT Result_ID, Race_ID, Driver_ID, Team_ID, Status_ID, Position, Points
+FROM RESULT
+WHERE Result_ID > %s
+ORDER BY Result_ID
+LIMIT %s
+"""
+
+RESULT_DTYPES = {
+    'Result_ID': 'int32', 'Race_ID': 'int32', 'Driver_ID': 'int32', 'Team_ID': 'int32',
+    'Status_ID': 'int32', 'Position': 'Int32', 'Points': 'float32',
+}
+
+# One round trip tells whether anything changed since the last refresh: new rows move the
+# count and max ID, edits and deletes of existing rows move the last RESULT audit entry
+WATERMARK_QUERY = """
+SELECT
+    (SELECT COUNT(*) FROM RESULT) AS Results,
+    (SELECT COALESCE(MAX(Result_ID), 0) FROM RESULT) AS Max_Result_ID,
+    (SELECT COALESCE(SUM(Version), 0) FROM DIMENSION_VERSION) AS Dimension_Version,
+    (SELECT COALESCE(MAX(Log_ID), 0) FROM AUDIT_LOG
+     WHERE Table_Name = 'RESULT' AND Action IN ('UPDATE', 'DELETE')) AS Result_Edits
+"""
+
+# Foreign key column -> dimension it codes into
+FOREIGN_KEYS = {'Race_ID': 'race', 'Driver_ID': 'driver', 'Team_ID': 'team', 'Status_ID': 'status'}
+
+
+class Dimension:
+    """A small lookup table sorted by ID, able to turn raw IDs into dense row codes"""
+
+    __slots__ = ('frame', 'ids')
+
+    def __init__(self, frame, id_column):
+        self.frame = frame.sort_values(id_column).reset_index(drop=True)
+        self.ids = self.frame[id_column].to_numpy(dtype=np.int64)
+
+    def encode(self, raw_ids):
+        """Row code for each raw ID (-1 where the ID is not in the table)"""
+        if len(self.ids) == 0:
+            return np.full(len(raw_ids), -1, dtype=np.int32)
+        codes = np.minimum(np.searchsorted(self.ids, raw_ids), len(self.ids) - 1)
+        return np.where(self.ids[codes] == raw_ids, codes, -1).astype(np.int32)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class ResultSnapshot:
+    """Immutable RESULT columns plus dimension-coded foreign keys"""
+
+    def __init__(self, dimensions, columns, watermark):
+        self.dimensions = dimensions
+        self.columns = columns  # raw RESULT columns: Result_ID, *_ID, Position (-1 = NULL), Points
+        self.watermark = watermark
+        self.codes = {fk: dimensions[dim].encode(columns[fk]) for fk, dim in FOREIGN_KEYS.items()}
+        self.built_at = time.time()
+
+    @property
+    def rows(self):
+        return len(self.columns['Result_ID'])
+
+    @property
+    def max_result_id(self):
+        return int(self.columns['Result_ID'][-1]) if self.rows else 0
+
+    def nbytes(self):
+        arrays = list(self.columns.values()) + list(self.codes.values())
+        return sum(array.nbytes for array in arrays)
+
+    # =============================================================
+    # AGGREGATIONS (same columns as the Analytics page's SQL)
+    # =============================================================
+    def circuit_stats(self):
+        """Races held and average points per result, per circuit that hosted a race"""
+        races = self.dimensions['race'].frame
+        circuits = self.dimensions['circuit']
+        race_circuit = circuits.encode(races['Circuit_ID'].to_numpy(dtype=np.int64))
+        n = len(circuits)
+
+        held = np.bincount(race_circuit[race_circuit >= 0], minlength=n)
+        race_code = self.codes['Race_ID']
+        known = race_code >= 0
+        result_circuit = race_circuit[race_code[known]]
+        valid = result_circuit >= 0
+        counts = np.bincount(result_circuit[valid], minlength=n)
+        points = np.bincount(result_circuit[valid], weights=self.columns['Points'][known][valid], minlength=n)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg = np.where(counts > 0, points / counts, np.nan)
+        df = circuits.frame.assign(Races_Held=held, Avg_Points=np.round(avg, 2))
+        df = df[df['Races_Held'] > 0]
+        return (df[['Circuit_Name', 'Location', 'Races_Held', 'Avg_Points']]
+                .sort_values('Races_Held', ascending=False, kind='stable').reset_index(drop=True))
+
+    def team_reliability(self):
+        """Finished vs DNF results per team"""
+        teams = self.dimensions['team']
+        statuses = self.dimensions['status'].frame
+        finished_status = (statuses['Status_description'] == 'Finished').to_numpy()
+
+        team = self.codes['Team_ID']
+        status = self.codes['Status_ID']
+        valid = (team >= 0) & (status >= 0)
+        team, status = team[valid], status[valid]
+
+        total = np.bincount(team, minlength=len(teams))
+        finished = np.bincount(team, weights=finished_status[status], minlength=len(teams)).astype(np.int64)
+        df = teams.frame.assign(Total_Results=total, Finished=finished, DNF=total - finished)
+        df = df[df['Total_Results'] > 0]
+        df = df.assign(Reliability_Percentage=(df['Finished'] * 100.0 / df['Total_Results']).round(2))
+        return (df[['Team_Name', 'Total_Results', 'Finished', 'DNF', 'Reliability_Percentage']]
+                .sort_values('Reliability_Percentage', ascending=False, kind='stable').reset_index(drop=True))
+
+    def driver_points(self):
+        """Career points per driver with any points, highest first"""
+        drivers = self.dimensions['driver']
+        driver = self.codes['Driver_ID']
+        valid = driver >= 0
+        points = np.bincount(driver[valid], weights=self.columns['Points'][valid], minlength=len(drivers))
+        df = drivers.frame.assign(Total_Points=points)
+        df = df[df['Total_Points'] > 0]
+        return (df[['Driver_Name', 'Total_Points']]
+                .sort_values('Total_Points', ascending=False, kind='stable').reset_index(drop=True))
+
+
+def _result_columns(frame):
+    """RESULT chunk -> plain NumPy columns (NULL positions become -1)"""
+    columns = {name: frame[name].to_numpy(dtype=RESULT_DTYPES[name]) for name in
+               ('Result_ID', 'Race_ID', 'Driver_ID', 'Team_ID', 'Status_ID', 'Points')}
+    columns['Position'] = frame['Position'].fillna(-1).to_numpy(dtype=np.int16)
+    return columns
+
+
+def _empty_columns():
+    columns = {name: np.empty(0, dtype=RESULT_DTYPES[name]) for name in
+               ('Result_ID', 'Race_ID', 'Driver_ID', 'Team_ID', 'Status_ID', 'Points')}
+    columns['Position'] = np.empty(0, dtype=np.int16)
+    return columns
+
+
+class AnalyticsEngine:
+    """Keeps a ResultSnapshot current with as little MySQL work as possible"""
+
+    def __init__(self, pool, refresh_interval=REFRESH_INTERVAL):
+        self._pool = pool
+        self._refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._checked_at = None
+        self.full_loads = 0
+        self.incremental_loads = 0
+        self.last_refresh = 0.0
+
+    def snapshot(self, force=False):
+        """Current snapshot, refreshed first if the refresh interval has passed (or `force`)"""
+        with self._lock:
+            now = time.monotonic()
+            due = self._checked_at is None or now - self._checked_at >= self._refresh_interval
+            if force or due or self._snapshot is None:
+                self._refresh(full=force)
+                self._checked_at = now
+            return self._snapshot
+
+    def _refresh(self, full=False):
+        started = time.perf_counter()
+        with self._pool.connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(WATERMARK_QUERY)
+            row = cursor.fetchone()
+            cursor.close()
+            watermark = (int(row['Results']), int(row['Max_Result_ID']), int(row['Dimension_Version']),
+                         int(row['Result_Edits']))
+
+            current = self._snapshot
+            if not full and current is not None and current.watermark == watermark:
+                return
+
+            dimensions = current.dimensions if current is not None else None
+            if full or current is None or current.watermark[2] != watermark[2]:
+                dimensions = self._load_dimensions(conn)
+
+            if full or current is None or current.watermark[3] != watermark[3]:
+                # Existing rows were edited or deleted: only a reload can see which
+                columns = self._load_results(conn, 0, _empty_columns())
+                self.full_loads += 1
+            else:
+                columns = self._load_results(conn, current.max_result_id, current.columns)
+                if len(columns['Result_ID']) != watermark[0]:
+                    # Rows changed below the old watermark without an audit entry: start over
+                    columns = self._load_results(conn, 0, _empty_columns())
+                    self.full_loads += 1
+                else:
+                    self.incremental_loads += 1
+
+        self._snapshot = ResultSnapshot(dimensions, columns, watermark)
+        self.last_refresh = time.perf_counter() - started
+
+    @staticmethod
+    def _load_dimensions(conn):
+        dimensions = {}
+        cursor = conn.cursor()
+        for name, (query, id_column) in DIMENSION_QUERIES.items():
+            cursor.execute(query)
+            dimensions[name] = Dimension(fetch_frame(cursor), id_column)
+        cursor.close()
+        return dimensions
+
+    @staticmethod
+    def _load_results(conn, after_id, columns):
+        """Append every RESULT row with Result_ID > after_id to `columns`, in keyset chunks"""
+        chunks = [columns]
+        cursor = conn.cursor()
+        while True:
+            cursor.execute(RESULT_QUERY, (after_id, CHUNK_ROWS))
+            frame = fetch_frame(cursor, RESULT_DTYPES)
+            if frame.empty:
+                break
+            chunks.append(_result_columns(frame))
+            after_id = int(frame['Result_ID'].iloc[-1])
+        cursor.close()
+        if len(chunks) == 1:
+            return columns
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in columns}
+
+    def invalidate(self):
+        """Check the watermark on next use instead of waiting out the refresh interval"""
+        with self._lock:
+            self._checked_at = None
+
+    def stats(self):
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                'rows': snapshot.rows if snapshot else 0,
+                'bytes': snapshot.nbytes() if snapshot else 0,
+                'built_at': snapshot.built_at if snapshot else None,
+                'full_loads': self.full_loads,
+                'incremental_loads': self.incremental_loads,
+                'last_refresh': self.last_refresh,
+            }
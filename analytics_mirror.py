@@ -0,0 +1,466 @@
+"""
+Parquet mirror of f1_db for the read-only analytics pages, queried through embedded DuckDB
+
+The lookup and standings tables are copied whole on every sync. RESULT is
+partitioned by season under RESULT/Year=<year>/ and kept current
+incrementally: rows above the Result_ID high-water mark are appended as new
+files, and a season is rewritten only when the audit log reports an update or
+delete of one of its results, one of its races moved, its row count no longer
+matches MySQL, or it has collected too many small append files.
+
+Usage:
+    python analytics_mirror.py [--out-dir f1_mirror] [--full] [--every SECONDS]
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from datetime import datetime
+
+import mysql.connector
+import pandas as pd
+from mysql.connector import Error
+
+from columnar_fetch import fetch_frame
+from db_pool import DB_CONFIG
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+MIRROR_DIR = os.environ.get('F1_MIRROR_DIR', 'f1_mirror')
+# Rows per keyset SELECT / Parquet file while copying RESULT
+SYNC_CHUNK = 100_000
+# A season with this many append files is compacted back into one
+COMPACT_FILES = 16
+
+MANIFEST = 'manifest.json'
+
+# Tables small enough to copy whole on every sync
+FULL_COPY_TABLES = {
+    'TEAM': "SELECT Team_ID, Team_Name, Nationality FROM TEAM",
+    'DRIVER': "SELECT Driver_ID, First_Name, Last_Name, DOB, Team_ID FROM DRIVER",
+    'CIRCUIT': "SELECT Circuit_ID, Circuit_Name, Location FROM CIRCUIT",
+    'RACE': "SELECT Race_ID, Race_Name, Venue, Year, Round, Circuit_ID FROM RACE",
+    'STATUS': "SELECT Status_ID, Status_description FROM STATUS",
+    'DRIVER_SEASON_STANDINGS': "SELECT Year, Driver_ID, Team_ID, Points, Wins, Podiums, Races FROM DRIVER_SEASON_STANDINGS",
+    'TEAM_SEASON_STANDINGS': "SELECT Year, Team_ID, Points, Wins, Podiums, Races FROM TEAM_SEASON_STANDINGS",
+}
+
+# Plain dtypes for the copies: names stay strings rather than categories so
+# every file of a table has the same Parquet schema
+FULL_COPY_DTYPES = {
+    'Team_Name': None, 'Nationality': None, 'Circuit_Name': None, 'Location': None,
+    'Year': 'Int32', 'Round': 'Int32', 'Team_ID': 'Int32', 'Points': 'float64',
+}
+
+RESULT_SELECT = """
+SELECT RES.Result_ID, RES.Position, RES.Grid, RES.Points, RES.Race_ID,
+       RES.Driver_ID, RES.Team_ID, RES.Status_ID, RA.Year
+FROM RESULT RES
+JOIN RACE RA ON RA.Race_ID = RES.Race_ID
+"""
+
+NEW_RESULTS_QUERY = RESULT_SELECT + "WHERE RES.Result_ID > %s ORDER BY RES.Result_ID LIMIT %s"
+
+# <=> so the NULL-year bucket can be rebuilt too
+YEAR_RESULTS_QUERY = RESULT_SELECT + "WHERE RA.Year <=> %s AND RES.Result_ID > %s ORDER BY RES.Result_ID LIMIT %s"
+
+YEAR_COUNTS_QUERY = """
+SELECT RA.Year, COUNT(*) AS Results
+FROM RESULT RES
+JOIN RACE RA ON RA.Race_ID = RES.Race_ID
+GROUP BY RA.Year
+"""
+
+# Written by the LogResultUpdate / LogResultDelete triggers
+RESULT_CHANGES_QUERY = """
+SELECT Log_ID, Old_Value, New_Value
+FROM AUDIT_LOG
+WHERE Table_Name = 'RESULT' AND Log_ID > %s
+ORDER BY Log_ID
+"""
+
+AUDIT_HIGH_WATER_QUERY = "SELECT COALESCE(MAX(Log_ID), 0) AS Log_ID FROM AUDIT_LOG"
+
+RESULT_DTYPES = {
+    'Result_ID': 'int32', 'Position': 'Int32', 'Grid': 'Int32', 'Points': 'float32', 'Race_ID': 'int32',
+    'Driver_ID': 'int32', 'Team_ID': 'int32', 'Status_ID': 'int32', 'Year': 'Int32',
+}
+
+_RACE_ID_RE = re.compile(r'Race_ID: (\d+)')
+_PART_RE = re.compile(r'^part-(\d+)-(\d+)\.parquet$')
+
+
+class MirrorError(Exception):
+    """The mirror is missing, DuckDB is not installed, or a mirror query failed"""
+
+
+# =============================================================
+# SYNC (MySQL -> Parquet)
+# =============================================================
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise MirrorError("The analytics mirror needs pyarrow: pip install pyarrow duckdb")
+    return pa, pq
+
+
+def _result_schema():
+    pa, _ = _pyarrow()
+    return pa.schema([
+        ('Result_ID', pa.int32()),
+        ('Position', pa.int32()),
+        ('Grid', pa.int32()),
+        ('Points', pa.float32()),
+        ('Race_ID', pa.int32()),
+        ('Driver_ID', pa.int32()),
+        ('Team_ID', pa.int32()),
+        ('Status_ID', pa.int32()),
+        ('Year', pa.int32()),
+    ])
+
+
+def _write_parquet(df, path, schema=None):
+    """Write a DataFrame to `path` atomically (readers never see a half-written file)"""
+    pa, pq = _pyarrow()
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    partial = path + '.partial'
+    pq.write_table(table, partial, compression='zstd')
+    os.replace(partial, path)
+
+
+def _year_key(year):
+    return 'NULL' if pd.isna(year) else str(int(year))
+
+
+def _year_param(key):
+    return None if key == 'NULL' else int(key)
+
+
+def _year_dir(out_dir, key):
+    return os.path.join(out_dir, 'RESULT', f"Year={key}")
+
+
+def _part_name(df):
+    return f"part-{int(df['Result_ID'].iloc[0]):010d}-{int(df['Result_ID'].iloc[-1]):010d}.parquet"
+
+
+def load_manifest(out_dir):
+    """Sync state of a mirror directory ({} if it has never been synced)"""
+    try:
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST)
+    with open(path + '.partial', 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(path + '.partial', path)
+
+
+def _race_years(out_dir):
+    """Race_ID -> year key from the RACE copy of the previous sync"""
+    path = os.path.join(out_dir, 'RACE.parquet')
+    if not os.path.exists(path):
+        return {}
+    _, pq = _pyarrow()
+    races = pq.read_table(path, columns=['Race_ID', 'Year']).to_pydict()
+    return {race: _year_key(year) for race, year in zip(races['Race_ID'], races['Year'])}
+
+
+def _interrupted_years(out_dir, high_water):
+    """Year keys holding files with Result_IDs above the manifest's high-water mark
+
+    Only a sync that stopped before saving its manifest leaves those behind;
+    appending the same rows again would duplicate them, so such seasons are
+    rebuilt instead.
+    """
+    result_dir = os.path.join(out_dir, 'RESULT')
+    if not os.path.isdir(result_dir):
+        return set()
+    keys = set()
+    for name in os.listdir(result_dir):
+        if not name.startswith('Year='):
+            continue
+        for part in os.listdir(os.path.join(result_dir, name)):
+            match = _PART_RE.match(part)
+            if match and int(match.group(2)) > high_water:
+                keys.add(name[len('Year='):])
+                break
+    return keys
+
+
+def _rebuild_year(cursor, out_dir, key, schema):
+    """Replace one season's files with a fresh copy; returns its row count"""
+    final = _year_dir(out_dir, key)
+    # Built outside RESULT/ so the readers' glob never sees a half-built season
+    staging = os.path.join(out_dir, '_staging', f"Year={key}")
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    rows = 0
+    after_id = 0
+    while True:
+        cursor.execute(YEAR_RESULTS_QUERY, (_year_param(key), after_id, SYNC_CHUNK))
+        df = fetch_frame(cursor, RESULT_DTYPES)
+        if df.empty:
+            break
+        _write_parquet(df, os.path.join(staging, _part_name(df)), schema)
+        rows += len(df)
+        after_id = int(df['Result_ID'].iloc[-1])
+
+    retired = staging + '.old'
+    shutil.rmtree(retired, ignore_errors=True)
+    if os.path.exists(final):
+        os.rename(final, retired)
+    if rows:
+        os.rename(staging, final)
+    else:
+        shutil.rmtree(staging)
+    shutil.rmtree(retired, ignore_errors=True)
+    return rows
+
+
+def sync(conn, out_dir=MIRROR_DIR, full=False):
+    """Bring the mirror in `out_dir` up to date with f1_db; returns a summary dict"""
+    started = time.perf_counter()
+    schema = _result_schema()
+    manifest = {} if full else load_manifest(out_dir)
+    if full:
+        shutil.rmtree(os.path.join(out_dir, 'RESULT'), ignore_errors=True)
+    os.makedirs(os.path.join(out_dir, 'RESULT', '_schema'), exist_ok=True)
+    # Zero-row file with the full schema, so the RESULT glob always matches something
+    schema_file = os.path.join(out_dir, 'RESULT', '_schema', 'part-empty.parquet')
+    if not os.path.exists(schema_file):
+        _, pq = _pyarrow()
+        pq.write_table(schema.empty_table(), schema_file)
+
+    years = manifest.get('years', {})
+    high_water = manifest.get('result_high_water', 0)
+    audit_high_water = manifest.get('audit_high_water')
+    cursor = conn.cursor()
+
+    # Read the audit log first: changes made while we copy are picked up next time
+    changed_races = set()
+    if audit_high_water is None:
+        cursor.execute(AUDIT_HIGH_WATER_QUERY)
+        audit_high_water = int(cursor.fetchone()[0])
+    else:
+        cursor.execute(RESULT_CHANGES_QUERY, (audit_high_water,))
+        for log_id, old_value, new_value in cursor.fetchall():
+            audit_high_water = max(audit_high_water, int(log_id))
+            for value in (old_value, new_value):
+                changed_races.update(int(race) for race in _RACE_ID_RE.findall(value or ''))
+
+    old_race_years = _race_years(out_dir)
+    tables = {}
+    for name, query in FULL_COPY_TABLES.items():
+        cursor.execute(query)
+        df = fetch_frame(cursor, FULL_COPY_DTYPES)
+        _write_parquet(df, os.path.join(out_dir, f"{name}.parquet"))
+        tables[name] = len(df)
+    new_race_years = _race_years(out_dir)
+
+    dirty = _interrupted_years(out_dir, high_water)
+    for race in changed_races:
+        dirty.update(filter(None, (old_race_years.get(race), new_race_years.get(race))))
+    for race, key in old_race_years.items():
+        if new_race_years.get(race, key) != key:
+            dirty.update((key, new_race_years[race]))
+
+    # Append everything above the high-water mark, one file per season per chunk
+    appended = 0
+    while True:
+        cursor.execute(NEW_RESULTS_QUERY, (high_water, SYNC_CHUNK))
+        df = fetch_frame(cursor, RESULT_DTYPES)
+        if df.empty:
+            break
+        for key, part in df.groupby(df['Year'].map(_year_key), sort=False):
+            os.makedirs(_year_dir(out_dir, key), exist_ok=True)
+            _write_parquet(part, os.path.join(_year_dir(out_dir, key), _part_name(part)), schema)
+            entry = years.setdefault(key, {'rows': 0, 'files': 0})
+            entry['rows'] += len(part)
+            entry['files'] += 1
+        appended += len(df)
+        high_water = int(df['Result_ID'].iloc[-1])
+
+    # Anything the high-water mark cannot see (deletes, rows inserted below it,
+    # bulk loads that bypass the audit triggers) shows up as a count mismatch
+    cursor.execute(YEAR_COUNTS_QUERY)
+    counts = {_year_key(year): int(count) for year, count in cursor.fetchall()}
+    for key in set(counts) | set(years):
+        entry = years.get(key)
+        if entry is None or entry['rows'] != counts.get(key, 0) or entry['files'] >= COMPACT_FILES:
+            dirty.add(key)
+
+    for key in sorted(dirty):
+        rows = _rebuild_year(cursor, out_dir, key, schema)
+        if rows:
+            years[key] = {'rows': rows, 'files': len(os.listdir(_year_dir(out_dir, key)))}
+        else:
+            years.pop(key, None)
+    cursor.close()
+
+    _save_manifest(out_dir, {
+        'result_high_water': high_water,
+        'audit_high_water': audit_high_water,
+        'years': years,
+        'tables': tables,
+        'synced_at': datetime.now().isoformat(timespec='seconds'),
+    })
+    return {
+        'appended': appended,
+        'rebuilt_years': sorted(dirty),
+        'results': sum(entry['rows'] for entry in years.values()),
+        'seconds': time.perf_counter() - started,
+    }
+
+
+# =============================================================
+# QUERY (Parquet -> DuckDB)
+# =============================================================
+# DuckDB versions of the MySQL views the analytics queries use
+MIRROR_VIEWS = {
+    'DRIVER_CAREER_TOTALS': """
+        SELECT
+            D.Driver_ID,
+            COALESCE(SUM(R.Points), 0) AS Total_Points,
+            COUNT(CASE WHEN R.Position = 1 THEN 1 END) AS Wins,
+            COALESCE(MIN(R.Position), 0) AS Best_Finish,
+            COALESCE(date_part('year', age(current_date, D.DOB)), 0) AS Age
+        FROM DRIVER D
+        LEFT JOIN RESULT R ON D.Driver_ID = R.Driver_ID
+        GROUP BY D.Driver_ID, D.DOB
+    """,
+    'TEAM_CAREER_TOTALS': """
+        SELECT
+            T.Team_ID,
+            COALESCE(SUM(R.Points), 0) AS Total_Points,
+            COUNT(CASE WHEN R.Position = 1 THEN 1 END) AS Wins,
+            COUNT(DISTINCT R.Driver_ID) AS Different_Drivers
+        FROM TEAM T
+        LEFT JOIN RESULT R ON T.Team_ID = R.Team_ID
+        GROUP BY T.Team_ID
+    """,
+}
+
+
+class ParquetMirror:
+    """Read-only SQL over a mirror directory; MySQL-dialect analytics queries run unchanged"""
+
+    def __init__(self, out_dir=MIRROR_DIR):
+        self.out_dir = out_dir
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._local = threading.local()
+        self._db = None
+        self.queries = 0
+        self.query_time = 0.0
+
+    def _connect(self):
+        with self._lock:
+            if self._db is not None:
+                return self._db
+            try:
+                import duckdb
+            except ImportError:
+                raise MirrorError("The analytics mirror needs DuckDB: pip install duckdb")
+            if not load_manifest(self.out_dir):
+                raise MirrorError(f"No mirror in '{self.out_dir}' yet: run python analytics_mirror.py")
+
+            db = duckdb.connect(':memory:')
+            # Views re-expand their file globs on every query, so syncs show up without reconnecting
+            for name in FULL_COPY_TABLES:
+                path = os.path.join(self.out_dir, f"{name}.parquet").replace("'", "''")
+                db.execute(f"CREATE VIEW {name} AS SELECT * FROM read_parquet('{path}')")
+            results = os.path.join(self.out_dir, 'RESULT', '*', '*.parquet').replace("'", "''")
+            db.execute(
+                f"CREATE VIEW RESULT AS SELECT * EXCLUDE (Year) "
+                f"FROM read_parquet('{results}', hive_partitioning = false)"
+            )
+            for name, query in MIRROR_VIEWS.items():
+                db.execute(f"CREATE VIEW {name} AS {query}")
+            self._db = db
+            return db
+
+    def _cursor(self):
+        # A DuckDB connection is not shared across threads; each thread gets its own cursor
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self._connect().cursor()
+        return cursor
+
+    def query_df(self, query, params=None):
+        """Run a read-only query (with %s placeholders) and return a DataFrame"""
+        # Connect first: a missing duckdb or mirror surfaces as MirrorError from _connect
+        cursor = self._cursor()
+        import duckdb
+        started = time.perf_counter()
+        try:
+            df = cursor.execute(query.replace('%s', '?'), list(params or ())).df()
+        except duckdb.Error as e:
+            raise MirrorError(str(e))
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.queries += 1
+                self.query_time += elapsed
+        return df
+
+    def sync(self, pool, full=False):
+        """Sync the mirror over a pooled connection (one sync at a time per process)"""
+        with self._sync_lock:
+            with pool.connection() as conn:
+                return sync(conn, self.out_dir, full=full)
+
+    def stats(self):
+        manifest = load_manifest(self.out_dir)
+        with self._lock:
+            return {
+                'synced_at': manifest.get('synced_at'),
+                'results': sum(entry['rows'] for entry in manifest.get('years', {}).values()),
+                'seasons': len(manifest.get('years', {})),
+                'queries': self.queries,
+                'query_time': self.query_time,
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync the Parquet analytics mirror from f1_db")
+    parser.add_argument('--out-dir', default=MIRROR_DIR, help="mirror directory")
+    parser.add_argument('--full', action='store_true', help="discard the mirror and copy everything again")
+    parser.add_argument('--every', type=float, default=0,
+                        help="keep running, syncing every N seconds")
+    args = parser.parse_args()
+
+    full = args.full
+    while True:
+        try:
+            conn = mysql.connector.connect(**DB_CONFIG)
+            summary = sync(conn, args.out_dir, full=full)
+            conn.close()
+        except (Error, MirrorError) as e:
+            print(f"❌ Mirror sync failed: {e}")
+            if not args.every:
+                return 1
+        else:
+            rebuilt = ', '.join(summary['rebuilt_years']) or 'none'
+            print(f"✅ {summary['results']:,} results mirrored: {summary['appended']:,} appended, "
+                  f"seasons rebuilt: {rebuilt} ({summary['seconds']:.1f}s)")
+            full = False
+        if not args.every:
+            return 0
+        time.sleep(args.every)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
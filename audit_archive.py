@@ -0,0 +1,113 @@
+"""
+AUDIT_LOG retention: partition upkeep, archiving and Parquet export
+
+Splits future monthly partitions off AUDIT_LOG, retires partitions older
+than the retention window (swapped out whole into AUDIT_LOG_ARCHIVE_<partition>
+tables, or dropped), then exports every archive table to a zstd-compressed
+Parquet file for offline analysis. Meant to run monthly from cron.
+
+Usage:
+    python audit_archive.py [--keep-months 12] [--months-ahead 3] [--out-dir audit_archive]
+                            [--no-archive] [--drop-exported]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import mysql.connector
+from mysql.connector import Error
+
+from data_export import ExportError, stream_export
+from db_pool import DB_CONFIG
+
+ARCHIVE_PREFIX = 'AUDIT_LOG_ARCHIVE_'
+
+# Rows per fetch / Parquet row group while exporting
+EXPORT_CHUNK = 100_000
+
+AUDIT_COLUMNS = ('Log_ID', 'Table_Name', 'Action', 'Record_ID', 'Old_Value', 'New_Value',
+                 'Changed_By', 'Changed_At')
+
+
+def _call(conn, proc_name, params):
+    """Call a maintenance procedure and return the single value it reports"""
+    cursor = conn.cursor()
+    cursor.callproc(proc_name, params)
+    value = None
+    for result in cursor.stored_results():
+        value = result.fetchone()[0]
+    cursor.close()
+    return value
+
+
+def archive_tables(conn):
+    """AUDIT_LOG_ARCHIVE_* tables left by PurgeAuditLog, oldest first"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT TABLE_NAME FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME LIKE %s ORDER BY TABLE_NAME",
+        (ARCHIVE_PREFIX.replace('_', r'\_') + '%',)
+    )
+    tables = [table for (table,) in cursor.fetchall()]
+    cursor.close()
+    return tables
+
+
+def export_table(conn, table, out_dir):
+    """Stream one archive table into <out_dir>/<table>.parquet, one row group per chunk
+
+    Written by data_export's Parquet sink, so archived rows have exactly the
+    column types of a live audit_log export.
+    """
+    path = os.path.join(out_dir, f"{table}.parquet")
+    rows = stream_export(
+        conn, f"SELECT {', '.join(AUDIT_COLUMNS)} FROM `{table}` ORDER BY Log_ID", (),
+        path, 'parquet', EXPORT_CHUNK,
+    )
+    return path, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retire old AUDIT_LOG partitions and export them to Parquet")
+    parser.add_argument('--keep-months', type=int, default=12, help="months of audit history to keep online")
+    parser.add_argument('--months-ahead', type=int, default=3, help="future monthly partitions to pre-create")
+    parser.add_argument('--out-dir', default='audit_archive', help="directory for the Parquet files")
+    parser.add_argument('--no-archive', action='store_true',
+                        help="drop expired partitions outright instead of archiving them")
+    parser.add_argument('--drop-exported', action='store_true',
+                        help="drop archive tables once their Parquet file is written")
+    args = parser.parse_args()
+
+    try:
+        conn = mysql.connector.connect(**DB_CONFIG, autocommit=True)
+        added = _call(conn, 'AddAuditPartitions', (args.months_ahead,))
+        print(f"  Partitions added:  {added}")
+        purged = _call(conn, 'PurgeAuditLog', (args.keep_months, not args.no_archive))
+        print(f"  Partitions purged: {purged}")
+
+        os.makedirs(args.out_dir, exist_ok=True)
+        for table in archive_tables(conn):
+            started = time.perf_counter()
+            path = os.path.join(args.out_dir, f"{table}.parquet")
+            if os.path.exists(path):
+                print(f"  {table:<36} already exported")
+            else:
+                path, rows = export_table(conn, table, args.out_dir)
+                print(f"  {table:<36} {rows:>9,} rows -> {path} ({time.perf_counter() - started:.1f}s)")
+            if args.drop_exported:
+                cursor = conn.cursor()
+                cursor.execute(f"DROP TABLE `{table}`")
+                cursor.close()
+        conn.close()
+    except (Error, ExportError, OSError) as e:
+        print(f"❌ Audit maintenance failed: {e}")
+        return 1
+
+    print("✅ Audit log maintenance complete")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Benchmark: dictionary-cursor fetch vs the typed columnar fetch path
+
+Replays synthetic RESULT-shaped rows through an in-memory cursor so the
+comparison measures only the client side (row materialization + DataFrame
+construction), not the network or the server.
+
+Usage:
+    python benchmarks/bench_fetch.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from columnar_fetch import fetch_frame  # noqa: E402
+
+COLUMNS = ('Result_ID', 'Position', 'Grid', 'Points', 'Driver_Name', 'Team_Name', 'Status')
+
+
+def synthetic_rows(n, seed=1950):
+    """RESULT-shaped tuples, as the connector's C extension hands them over"""
+    rng = random.Random(seed)
+    drivers = [f"Driver {i}" for i in range(850)]
+    teams = [f"Team {i}" for i in range(210)]
+    statuses = ['Finished', 'Accident', 'Engine', '+1 Lap', 'Collision']
+    points = [25.0, 18.0, 15.0, 12.0, 10.0, 8.0, 6.0, 4.0, 2.0, 1.0]
+    rows = []
+    for i in range(n):
+        position = (i % 20) + 1
+        finished = rng.random() > 0.15
+        rows.append((
+            i + 1,
+            position if finished else None,
+            rng.randint(1, 20),
+            points[position - 1] if finished and position <= 10 else 0.0,
+            rng.choice(drivers),
+            rng.choice(teams),
+            'Finished' if finished else rng.choice(statuses),
+        ))
+    return rows
+
+
+class ReplayCursor:
+    """Just enough of a MySQL cursor to feed both fetch paths"""
+
+    def __init__(self, rows, dictionary=False):
+        self._rows = rows
+        self._pos = 0
+        self._dictionary = dictionary
+        self.description = [(name,) for name in COLUMNS]
+
+    def _convert(self, rows):
+        if self._dictionary:
+            return [dict(zip(COLUMNS, row)) for row in rows]
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return self._convert(rows)
+
+    def fetchmany(self, size):
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return self._convert(rows)
+
+
+def dictionary_path(rows):
+    return pd.DataFrame(ReplayCursor(rows, dictionary=True).fetchall())
+
+
+def columnar_path(rows):
+    return fetch_frame(ReplayCursor(rows))
+
+
+def measure(fn, rows, repeats):
+    """Best wall time over `repeats` runs, plus peak traced memory and frame size"""
+    best = float('inf')
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        df = fn(rows)
+        best = min(best, time.perf_counter() - start)
+        del df
+    gc.collect()
+    tracemalloc.start()
+    df = fn(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    frame_bytes = int(df.memory_usage(index=True, deep=True).sum())
+    return best, peak, frame_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare dictionary vs columnar fetch paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'path':<11} {'time':>9} {'peak mem':>10} {'frame':>10}")
+    for n in args.sizes:
+        rows = synthetic_rows(n)
+        results = {}
+        for name, fn in (('dictionary', dictionary_path), ('columnar', columnar_path)):
+            results[name] = measure(fn, rows, args.repeats)
+            elapsed, peak, frame_bytes = results[name]
+            print(f"{n:>10,} {name:<11} {elapsed * 1000:>7.1f}ms {peak / 2**20:>8.1f}MB {frame_bytes / 2**20:>8.1f}MB")
+        speedup = results['dictionary'][0] / results['columnar'][0]
+        memory = results['dictionary'][1] / results['columnar'][1]
+        print(f"{'':>10} {'→':<11} {speedup:>8.1f}× faster, {memory:.1f}× less peak memory\n")
+
+
+if __name__ == '__main__':
+    main()
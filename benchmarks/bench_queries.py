@@ -0,0 +1,286 @@
+"""
+Benchmark: every query and stored routine f1_app.py issues, against synthetic history
+
+Builds a scratch copy of f1_db (tables, views, procedures, functions,
+triggers) filled by synthetic_data at each requested scale, runs the app's
+workload against it and reports p50/p95/p99 latency and rows/s per statement.
+Each run is saved as JSON under benchmarks/results/ together with a hash of
+complete_setup.sql, and compared with the latest earlier run at the same
+scale (preferring one from a different schema version), so a schema change
+that slows a page down shows up as a regression.
+
+The parameterized point lookups are also run both over the text protocol
+and as cached prepared statements (as the app runs them), to show how much
+of their latency is MySQL parsing and planning the statement again.
+
+Usage:
+    python benchmarks/bench_queries.py [--scale 1 10 100] [--iterations 30] [--no-writes]
+                                       [--keep] [--reuse] [--fail-on-regression]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import mysql.connector  # noqa: E402
+from mysql.connector import Error  # noqa: E402
+
+from db_pool import DB_CONFIG  # noqa: E402
+from explain_check import APP_QUERIES  # noqa: E402
+from statement_cache import StatementCache  # noqa: E402
+from synthetic_data import build_database  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+# A p95 this much slower than the baseline (and at least MIN_REGRESSION_MS) is a regression
+REGRESSION_THRESHOLD = 0.20
+MIN_REGRESSION_MS = 0.5
+
+# Parameters for the parameterized statements: the busiest driver/team and the latest race/season
+CONTEXT_QUERIES = {
+    'driver': "SELECT Driver_ID FROM RESULT GROUP BY Driver_ID ORDER BY COUNT(*) DESC LIMIT 1",
+    'team': "SELECT Team_ID FROM RESULT GROUP BY Team_ID ORDER BY COUNT(*) DESC LIMIT 1",
+    'race': "SELECT MAX(Race_ID) FROM RESULT",
+    'year': "SELECT MAX(Year) FROM RACE",
+    'status': "SELECT Status_ID FROM STATUS WHERE Status_description = 'Finished'",
+}
+
+# (name, kind, statement, params(ctx)). kind is 'query' (SELECT), 'call' (read-only
+# procedure) or 'write' (procedure that changes data; skipped with --no-writes).
+# The app's own statements come from explain_check.APP_QUERIES (routines are called, not their bodies);
+# the point lookups among them use the busiest driver/team.
+CONTEXT_PARAMS = {
+    "Functions: driver": lambda ctx: (ctx['driver'],) * 4,
+    "Functions: team": lambda ctx: (ctx['team'],) * 2,
+}
+
+WORKLOAD = [
+    (name, 'query', sql, CONTEXT_PARAMS.get(name, lambda ctx, params=params: params))
+    for name, sql, params in APP_QUERIES
+] + [
+    ("CALL GetDriverStats", 'call', 'GetDriverStats', lambda ctx: (ctx['driver'],)),
+    ("CALL GetTeamPerformance", 'call', 'GetTeamPerformance', lambda ctx: (ctx['team'],)),
+    ("CALL GetRaceResults", 'call', 'GetRaceResults', lambda ctx: (ctx['race'],)),
+    ("CALL GetChampionshipStandings", 'call', 'GetChampionshipStandings', lambda ctx: (ctx['year'],)),
+    ("CALL RefreshDashboardSnapshot", 'write', 'RefreshDashboardSnapshot', lambda ctx: ()),
+    ("CALL RebuildSeasonStandings", 'write', 'RebuildSeasonStandings', lambda ctx: (ctx['year'],)),
+    ("CALL AddDriver", 'write', 'AddDriver', lambda ctx: ('Bench', 'Driver', '2000-01-01', ctx['team'])),
+    ("CALL AddRaceResult", 'write', 'AddRaceResult',
+     lambda ctx: (ctx['race'], ctx['driver'], ctx['team'], ctx['status'], None, 20, 0.0)),
+    ("CALL AddRaceResults", 'write', 'AddRaceResults', lambda ctx: (ctx['race'], json.dumps([
+        {'driver_id': ctx['driver'], 'team_id': ctx['team'], 'status_id': ctx['status'],
+         'position': None, 'grid': 20, 'points': 0}
+    ] * 20))),
+]
+
+
+def schema_version():
+    """Short hash of complete_setup.sql: runs with the same hash benchmarked the same schema"""
+    with open(os.path.join(ROOT, 'complete_setup.sql'), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _context(cursor):
+    ctx = {}
+    for key, query in CONTEXT_QUERIES.items():
+        cursor.execute(query)
+        ctx[key] = cursor.fetchone()[0]
+    return ctx
+
+
+def _execute(cursor, kind, statement, params):
+    """Run one statement to completion; returns the number of rows it produced"""
+    if kind == 'query':
+        cursor.execute(statement, params)
+        return len(cursor.fetchall())
+    cursor.callproc(statement, params)
+    return sum(len(result.fetchall()) for result in cursor.stored_results())
+
+
+def run_workload(conn, iterations, warmup, writes=True):
+    """Time every workload statement; returns {name: stats}"""
+    cursor = conn.cursor()
+    ctx = _context(cursor)
+    results = {}
+    for name, kind, statement, params in WORKLOAD:
+        if kind == 'write' and not writes:
+            continue
+        args = params(ctx)
+        for _ in range(warmup):
+            _execute(cursor, kind, statement, args)
+        latencies = []
+        rows = 0
+        for _ in range(iterations):
+            started = time.perf_counter()
+            rows += _execute(cursor, kind, statement, args)
+            latencies.append(time.perf_counter() - started)
+        cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+        total = sum(latencies)
+        results[name] = {
+            'kind': kind,
+            'p50_ms': cuts[49] * 1000,
+            'p95_ms': cuts[94] * 1000,
+            'p99_ms': cuts[98] * 1000,
+            'rows': rows // iterations,
+            'rows_per_s': rows / total if total else 0.0,
+        }
+        print(f"  {name:<44} p50 {cuts[49] * 1000:>9.2f}ms  p95 {cuts[94] * 1000:>9.2f}ms  "
+              f"p99 {cuts[98] * 1000:>9.2f}ms  {rows / total if total else 0:>12,.0f} rows/s")
+    cursor.close()
+    return results
+
+
+def compare_protocols(conn, iterations, warmup):
+    """p50 of each parameterized point lookup over the text protocol vs as a cached prepared statement"""
+    text_cursor = conn.cursor()
+    ctx = _context(text_cursor)
+    statements = StatementCache(conn)
+    results = {}
+    print("\n  Point lookups: text protocol vs prepared statement")
+    for name, kind, statement, params in WORKLOAD:
+        args = params(ctx)
+        if kind != 'query' or not args:
+            continue
+        p50 = {}
+        for protocol in ('text', 'prepared'):
+            latencies = []
+            for i in range(warmup + iterations):
+                started = time.perf_counter()
+                if protocol == 'text':
+                    text_cursor.execute(statement, args)
+                    text_cursor.fetchall()
+                else:
+                    statements.execute(statement, args).fetchall()
+                if i >= warmup:
+                    latencies.append(time.perf_counter() - started)
+            p50[protocol] = statistics.median(latencies) * 1000
+        saved = p50['text'] - p50['prepared']
+        results[name] = {'text_p50_ms': p50['text'], 'prepared_p50_ms': p50['prepared']}
+        print(f"  {name:<44} text {p50['text']:>9.3f}ms  prepared {p50['prepared']:>9.3f}ms  "
+              f"saved {saved:>7.3f}ms ({saved / p50['text'] if p50['text'] else 0:+.0%})")
+    text_cursor.close()
+    return results
+
+
+def find_baseline(scale, schema, exclude):
+    """Latest saved run at `scale`, preferring one from a different schema version"""
+    runs = []
+    for path in sorted(glob.glob(os.path.join(RESULTS_DIR, f"*-{scale}x.json"))):
+        if os.path.abspath(path) == os.path.abspath(exclude):
+            continue
+        with open(path) as f:
+            runs.append((path, json.load(f)))
+    other_schema = [run for run in runs if run[1]['schema'] != schema]
+    candidates = other_schema or runs
+    return candidates[-1] if candidates else (None, None)
+
+
+def compare(run, baseline):
+    """Print p95 changes against `baseline`; returns the names that regressed"""
+    regressions = []
+    print(f"\n  vs {baseline['started']} (schema {baseline['schema']}, commit {baseline.get('commit')})")
+    for name, stats in run['queries'].items():
+        before = baseline['queries'].get(name)
+        if before is None:
+            print(f"  {name:<44} new")
+            continue
+        change = (stats['p95_ms'] - before['p95_ms']) / before['p95_ms'] if before['p95_ms'] else 0.0
+        regressed = (change > REGRESSION_THRESHOLD
+                     and stats['p95_ms'] - before['p95_ms'] >= MIN_REGRESSION_MS)
+        marker = '  ❌ regression' if regressed else ''
+        print(f"  {name:<44} p95 {before['p95_ms']:>9.2f}ms -> {stats['p95_ms']:>9.2f}ms ({change:+.0%}){marker}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the app's queries and procedures at scale")
+    parser.add_argument('--scale', type=int, nargs='+', default=[1], help="multiples of the real history")
+    parser.add_argument('--seed', type=int, default=1950)
+    parser.add_argument('--iterations', type=int, default=30, help="timed runs per statement")
+    parser.add_argument('--warmup', type=int, default=2, help="untimed runs per statement")
+    parser.add_argument('--no-writes', action='store_true', help="skip the procedures that change data")
+    parser.add_argument('--reuse', action='store_true', help="reuse an existing scratch database")
+    parser.add_argument('--keep', action='store_true', help="don't drop the scratch databases afterwards")
+    parser.add_argument('--fail-on-regression', action='store_true', help="exit 1 if any p95 regressed")
+    args = parser.parse_args()
+    if args.iterations < 2:
+        parser.error("--iterations must be at least 2 to compute percentiles")
+
+    source_db = DB_CONFIG['database']
+    config = {k: v for k, v in DB_CONFIG.items() if k != 'database'}
+    schema = schema_version()
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    regressions = []
+
+    for scale in args.scale:
+        scratch_db = f"f1_bench_{scale}x"
+        try:
+            conn = mysql.connector.connect(**config, autocommit=True)
+            if not args.reuse:
+                print(f"Building {scratch_db} at {scale}x history...")
+                build_database(conn, source_db, scratch_db, scale, args.seed)
+            conn.database = scratch_db
+            cursor = conn.cursor()
+            cursor.execute("SELECT VERSION(), (SELECT COUNT(*) FROM RESULT)")
+            server, results = cursor.fetchone()
+            cursor.close()
+
+            print(f"\nBenchmarking {scratch_db} ({results:,} results, schema {schema})")
+            started = datetime.now()
+            run = {
+                'started': started.isoformat(timespec='seconds'),
+                'schema': schema,
+                'commit': git_commit(),
+                'server': server,
+                'scale': scale,
+                'seed': args.seed,
+                'results': results,
+                'iterations': args.iterations,
+                'queries': run_workload(conn, args.iterations, args.warmup, writes=not args.no_writes),
+                'protocols': compare_protocols(conn, args.iterations, args.warmup),
+            }
+            if not args.keep:
+                conn.cursor().execute(f"DROP DATABASE IF EXISTS `{scratch_db}`")
+            conn.close()
+        except Error as e:
+            print(f"❌ {e}")
+            return 2
+
+        path = os.path.join(RESULTS_DIR, f"{started.strftime('%Y%m%d-%H%M%S')}-{scale}x.json")
+        with open(path, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"\n  Saved {os.path.relpath(path, ROOT)}")
+
+        _, baseline = find_baseline(scale, schema, exclude=path)
+        if baseline is not None:
+            regressions += [f"{name} ({scale}x)" for name in compare(run, baseline)]
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1 if args.fail_on_regression else 0
+    print("\n✅ Benchmark complete")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Benchmark: cold-start import cost of the app and of each of its pages
+
+Runs `python -X importtime` in fresh interpreters: first for what a new
+worker imports before it can draw any page (Streamlit, the data layer and the
+shared page helpers), then for each page module on top of that. Prints where
+the time goes per top-level package and exits 1 if startup or any page is
+over its budget, or if a module that is meant to load lazily (Plotly, DuckDB)
+is imported at startup - so CI can hold the line for autoscaled workers that
+start cold.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--budget-ms 2500] [--page-budget-ms 500] [--top 10]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from f1_pages import PAGES  # noqa: E402
+
+# What f1_app.py imports before it renders anything
+STARTUP_MODULES = ('streamlit', 'f1_pages', 'f1_pages.common')
+# Only ever imported on first use; seeing one of these at startup is a failure
+# (not pyarrow: recent pandas imports it whenever it is installed)
+LAZY_MODULES = ('plotly', 'duckdb')
+CHART_MODULES = ('plotly.express', 'plotly.graph_objects')
+
+STARTUP_BUDGET_MS = float(os.environ.get('F1_STARTUP_BUDGET_MS', 2500))
+PAGE_BUDGET_MS = float(os.environ.get('F1_PAGE_IMPORT_BUDGET_MS', 500))
+
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+\d+ \| *(\S+)\s*$')
+
+
+def import_times(modules, runs):
+    """{module: self-time in ms} for importing `modules` in a fresh interpreter, from the fastest of `runs`"""
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f"import {', '.join(modules)}"],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing {', '.join(modules)} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+        times = {}
+        for line in proc.stderr.splitlines():
+            match = _IMPORTTIME_RE.match(line)
+            if match:
+                times[match.group(2)] = int(match.group(1)) / 1000
+        if best is None or sum(times.values()) < sum(best.values()):
+            best = times
+    return best
+
+
+def by_package(times):
+    """Self-time summed per top-level package, slowest first"""
+    totals = defaultdict(float)
+    for module, ms in times.items():
+        totals[module.split('.')[0]] += ms
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure and enforce the app's cold-start import time")
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters per measurement (fastest counts)")
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS, help="startup import budget")
+    parser.add_argument('--page-budget-ms', type=float, default=PAGE_BUDGET_MS,
+                        help="import budget of each page on top of startup")
+    parser.add_argument('--top', type=int, default=10, help="packages to list in the startup breakdown")
+    args = parser.parse_args()
+
+    failures = []
+    try:
+        startup = import_times(STARTUP_MODULES, args.runs)
+        total = sum(startup.values())
+        print(f"Startup ({', '.join(STARTUP_MODULES)}): {total:.0f} ms over {len(startup)} modules "
+              f"(budget {args.budget_ms:.0f} ms)")
+        for package, ms in by_package(startup)[:args.top]:
+            print(f"  {package:<32} {ms:>8.1f} ms")
+        if total > args.budget_ms:
+            failures.append(f"startup {total:.0f} ms > {args.budget_ms:.0f} ms")
+        eager = sorted({module.split('.')[0] for module in startup} & set(LAZY_MODULES))
+        if eager:
+            failures.append(f"imported at startup but meant to be lazy: {', '.join(eager)}")
+
+        print(f"\nPages (imports on top of startup, budget {args.page_budget_ms:.0f} ms each)")
+        for label, module in PAGES.items():
+            times = import_times(STARTUP_MODULES + (f"f1_pages.{module}",), args.runs)
+            added = {name: ms for name, ms in times.items() if name not in startup}
+            cost = sum(added.values())
+            slowest = max(added, key=added.get) if added else '-'
+            marker = '  ❌ over budget' if cost > args.page_budget_ms else ''
+            print(f"  {label:<28} {cost:>8.1f} ms  {len(added):>4} modules  (slowest: {slowest}){marker}")
+            if cost > args.page_budget_ms:
+                failures.append(f"{label} {cost:.0f} ms > {args.page_budget_ms:.0f} ms")
+
+        chart = import_times(STARTUP_MODULES + CHART_MODULES, args.runs)
+        chart_cost = sum(ms for name, ms in chart.items() if name not in startup)
+        print(f"\nFirst chart (Plotly, paid once per worker): {chart_cost:.0f} ms")
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+
+    if failures:
+        print(f"\n❌ {len(failures)} check(s) failed: {'; '.join(failures)}")
+        return 1
+    print("\n✅ Startup within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Typed, columnar fetch path: cursor rows -> preallocated column arrays -> DataFrame
+
+Replaces cursor(dictionary=True) -> fetchall() -> pd.DataFrame(list_of_dicts),
+which builds one dict per row and then re-infers every column's dtype.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from mysql.connector import Error
+
+CHUNK_SIZE = 10_000
+
+# Dtype hints applied by column name to every query; per-query hints override them.
+#   'Int32'/'Int64'     nullable integers (positions can be NULL for a DNF)
+#   'int32'/'float32'   non-null numerics (a NULL in an 'int32' column raises Error, so only
+#                       hint NOT NULL columns that no outer join can empty)
+#   'category'          low-cardinality names, stored as int codes + one copy of each label
+DEFAULT_DTYPES = {
+    'Result_ID': 'Int32',
+    'Log_ID': 'Int64',
+    'Record_ID': 'Int32',
+    'Position': 'Int32',
+    'Grid': 'Int32',
+    'Starting_Position': 'Int32',
+    'Best_Finish': 'Int32',
+    'Points': 'float32',
+    'Year': 'Int32',
+    'Driver_Name': 'category',
+    'Team_Name': 'category',
+    'Status': 'category',
+    'Circuit_Name': 'category',
+    'Location': 'category',
+    'Nationality': 'category',
+    'Table_Name': 'category',
+    'Action': 'category',
+}
+
+_NULLABLE_INTS = {'Int8': np.int8, 'Int16': np.int16, 'Int32': np.int32, 'Int64': np.int64}
+
+
+class _ColumnBuilder:
+    """Accumulates one column chunk by chunk in its final representation"""
+
+    def __init__(self, name, dtype):
+        self.name = name
+        self.dtype = dtype
+        self.chunks = []
+        self.masks = []
+        self.categories = {}  # label -> code, for 'category' columns
+
+    def extend(self, values):
+        n = len(values)
+        if self.dtype is None:
+            self.chunks.append(values)
+        elif self.dtype == 'category':
+            codes = self.categories
+            self.chunks.append(np.fromiter(
+                (-1 if v is None else codes.setdefault(v, len(codes)) for v in values),
+                dtype=np.int32, count=n
+            ))
+        elif self.dtype in _NULLABLE_INTS:
+            self.masks.append(np.fromiter((v is None for v in values), dtype=bool, count=n))
+            self.chunks.append(np.fromiter(
+                (0 if v is None else v for v in values),
+                dtype=_NULLABLE_INTS[self.dtype], count=n
+            ))
+        elif np.dtype(self.dtype).kind == 'f':
+            # None becomes NaN; Decimal aggregates convert through float()
+            self.chunks.append(np.fromiter(
+                (np.nan if v is None else v for v in values),
+                dtype=self.dtype, count=n
+            ))
+        else:
+            try:
+                self.chunks.append(np.fromiter(values, dtype=self.dtype, count=n))
+            except TypeError:
+                if None not in values:
+                    raise
+                raise Error(msg=f"Column {self.name} is hinted as non-nullable {self.dtype} but holds NULLs") from None
+
+    def finish(self):
+        if self.dtype is None:
+            # No hint: let pandas infer, exactly like the dictionary path did
+            return pd.Series([v for chunk in self.chunks for v in chunk], dtype=None)
+        if self.dtype == 'category':
+            codes = np.concatenate(self.chunks) if self.chunks else np.empty(0, dtype=np.int32)
+            return pd.Categorical.from_codes(codes, categories=list(self.categories))
+        if self.dtype in _NULLABLE_INTS:
+            if not self.chunks:
+                return pd.array([], dtype=self.dtype)
+            return pd.arrays.IntegerArray(np.concatenate(self.chunks), np.concatenate(self.masks))
+        if not self.chunks:
+            return np.empty(0, dtype=self.dtype)
+        return np.concatenate(self.chunks)
+
+
+def fetch_frame(cursor, dtypes=None, chunk_size=CHUNK_SIZE, timings=None):
+    """Read a tuple cursor into typed column arrays and build the DataFrame from them
+
+    If `timings` is a dict, the seconds spent fetching rows and converting
+    them into columns are added to its 'fetch' and 'convert' keys.
+    """
+    if cursor.description is None:
+        return pd.DataFrame()
+    names = [column[0] for column in cursor.description]
+    hints = {**DEFAULT_DTYPES, **(dtypes or {})}
+    builders = [_ColumnBuilder(name, hints.get(name)) for name in names]
+
+    fetch_time = convert_time = 0.0
+    while True:
+        started = time.perf_counter()
+        rows = cursor.fetchmany(chunk_size)
+        fetched = time.perf_counter()
+        fetch_time += fetched - started
+        if not rows:
+            break
+        for builder, values in zip(builders, zip(*rows)):
+            builder.extend(values)
+        convert_time += time.perf_counter() - fetched
+
+    started = time.perf_counter()
+    df = pd.DataFrame({name: builder.finish() for name, builder in zip(names, builders)})
+    convert_time += time.perf_counter() - started
+
+    if timings is not None:
+        timings['fetch'] = timings.get('fetch', 0.0) + fetch_time
+        timings['convert'] = timings.get('convert', 0.0) + convert_time
+    return df
@@ -20,7 +20,7 @@ CREATE TABLE TEAM (
 );
 
 CREATE TABLE DRIVER (
-    Driver_ID INT PRIMARY KEY,
+    Driver_ID INT PRIMARY KEY AUTO_INCREMENT,
     First_Name VARCHAR(255) NOT NULL,
     Last_Name VARCHAR(255) NOT NULL,
     DOB DATE,
@@ -39,7 +39,9 @@ CREATE TABLE RACE (
     Race_Name VARCHAR(255) NOT NULL,
     Venue VARCHAR(255),
     Year INT,
+    Round INT,  -- position in the season's calendar (NULL = fall back to Race_ID order)
     Circuit_ID INT NOT NULL,
+    INDEX idx_race_year_round (Year, Round),
     FOREIGN KEY (Circuit_ID) REFERENCES CIRCUIT(Circuit_ID)
 );
 
@@ -49,7 +51,7 @@ CREATE TABLE STATUS (
 );
 
 CREATE TABLE RESULT (
-    Result_ID INT PRIMARY KEY,
+    Result_ID INT PRIMARY KEY AUTO_INCREMENT,
     Position INT,
     Grid INT,
     Points FLOAT NOT NULL DEFAULT 0,
@@ -57,6 +59,17 @@ CREATE TABLE RESULT (
     Driver_ID INT NOT NULL,
     Team_ID INT NOT NULL,
     Status_ID INT NOT NULL,
+    -- Hot access paths (each also serves as the index for its FK):
+    --   CountDriverWins / GetBestFinish / GetDriverTotalPoints -> Driver_ID [+ Position] covering Points
+    --   CountTeamWins / GetTeamTotalPoints                     -> Team_ID [+ Position] covering Points
+    --   GetRaceResults / race winner joins / circuit averages  -> Race_ID [+ Position] covering Driver_ID, Points
+    --   DNF analysis per team                                  -> Team_ID + Status_ID
+    -- The "no points" anti-join probes idx_result_driver_position per driver,
+    -- so Points needs no index of its own.
+    INDEX idx_result_driver_position (Driver_ID, Position, Points),
+    INDEX idx_result_team_position (Team_ID, Position, Points),
+    INDEX idx_result_race_position (Race_ID, Position, Driver_ID, Points),
+    INDEX idx_result_team_status (Team_ID, Status_ID),
     FOREIGN KEY (Race_ID) REFERENCES RACE(Race_ID),
     FOREIGN KEY (Driver_ID) REFERENCES DRIVER(Driver_ID),
     FOREIGN KEY (Team_ID) REFERENCES TEAM(Team_ID),
@@ -73,6 +86,29 @@ SELECT
     TIMESTAMPDIFF(YEAR, DOB, CURDATE()) AS Age
 FROM DRIVER;
 
+-- Set-based equivalents of the per-row stored functions: one grouped pass
+-- over RESULT instead of one correlated lookup per function per row
+CREATE VIEW DRIVER_CAREER_TOTALS AS
+SELECT
+    D.Driver_ID,
+    COALESCE(SUM(R.Points), 0) AS Total_Points,                    -- GetDriverTotalPoints
+    COUNT(CASE WHEN R.Position = 1 THEN 1 END) AS Wins,            -- CountDriverWins
+    COALESCE(MIN(R.Position), 0) AS Best_Finish,                   -- GetBestFinish
+    COALESCE(TIMESTAMPDIFF(YEAR, D.DOB, CURDATE()), 0) AS Age      -- GetDriverAge
+FROM DRIVER D
+LEFT JOIN RESULT R ON D.Driver_ID = R.Driver_ID
+GROUP BY D.Driver_ID, D.DOB;
+
+CREATE VIEW TEAM_CAREER_TOTALS AS
+SELECT
+    T.Team_ID,
+    COALESCE(SUM(R.Points), 0) AS Total_Points,                    -- GetTeamTotalPoints
+    COUNT(CASE WHEN R.Position = 1 THEN 1 END) AS Wins,            -- CountTeamWins
+    COUNT(DISTINCT R.Driver_ID) AS Different_Drivers
+FROM TEAM T
+LEFT JOIN RESULT R ON T.Team_ID = R.Team_ID
+GROUP BY T.Team_ID;
+
 SELECT 'Tables created successfully! ✅' AS Status;
 
 -- =============================================================
@@ -152,12 +188,12 @@ INSERT INTO STATUS (Status_ID, Status_description) VALUES
 (15, 'Did not start');
 
 -- Insert Races (2024 Season)
-INSERT INTO RACE (Race_ID, Race_Name, Venue, Year, Circuit_ID) VALUES
-(1, 'Bahrain Grand Prix', 'Sakhir', 2024, 1),
-(2, 'Saudi Arabian Grand Prix', 'Jeddah', 2024, 2),
-(3, 'Australian Grand Prix', 'Melbourne', 2024, 3),
-(4, 'Japanese Grand Prix', 'Suzuka', 2024, 4),
-(5, 'Chinese Grand Prix', 'Shanghai', 2024, 5);
+INSERT INTO RACE (Race_ID, Race_Name, Venue, Year, Round, Circuit_ID) VALUES
+(1, 'Bahrain Grand Prix', 'Sakhir', 2024, 1, 1),
+(2, 'Saudi Arabian Grand Prix', 'Jeddah', 2024, 2, 2),
+(3, 'Australian Grand Prix', 'Melbourne', 2024, 3, 3),
+(4, 'Japanese Grand Prix', 'Suzuka', 2024, 4, 4),
+(5, 'Chinese Grand Prix', 'Shanghai', 2024, 5, 5);
 
 -- Insert Results (First 5 races, 20 drivers each = 100 results)
 -- RACE 1: Bahrain GP
@@ -281,22 +317,88 @@ SELECT 'Data inserted successfully! ✅' AS Status;
 -- PART 3: TRIGGERS, PROCEDURES, FUNCTIONS
 -- =============================================================
 
--- Create audit log table
+-- Create audit log table, range-partitioned by month on Changed_At so old months
+-- can be dropped or archived whole (see AddAuditPartitions / PurgeAuditLog).
+-- The partition key has to be part of the primary key, and TIMESTAMP columns
+-- can only be partitioned through UNIX_TIMESTAMP().
 CREATE TABLE AUDIT_LOG (
-    Log_ID INT PRIMARY KEY AUTO_INCREMENT,
+    Log_ID INT AUTO_INCREMENT,
     Table_Name VARCHAR(50),
     Action VARCHAR(50),
     Record_ID INT,
     Old_Value TEXT,
     New_Value TEXT,
     Changed_By VARCHAR(100),
-    Changed_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    Changed_At TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (Log_ID, Changed_At),
+    -- Keyset pagination (newest first) and the server-side Table/Action filters;
+    -- the Table/Action index also covers the per-group counts on the Audit Log page
+    INDEX idx_audit_changed (Changed_At, Log_ID),
+    INDEX idx_audit_table_action (Table_Name, Action, Changed_At, Log_ID),
+    INDEX idx_audit_action (Action, Changed_At, Log_ID)
+)
+PARTITION BY RANGE (UNIX_TIMESTAMP(Changed_At)) (
+    PARTITION p_history VALUES LESS THAN (UNIX_TIMESTAMP('2025-01-01 00:00:00')),
+    PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+-- Progress of load_history.py, one row per source CSV (makes bulk loads resumable)
+CREATE TABLE LOAD_CHECKPOINT (
+    Source_File VARCHAR(100) PRIMARY KEY,
+    Rows_Loaded INT NOT NULL DEFAULT 0,
+    Completed BOOLEAN NOT NULL DEFAULT FALSE,
+    Updated_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+-- Materialized season standings (kept current by the RESULT triggers below)
+CREATE TABLE DRIVER_SEASON_STANDINGS (
+    Year INT NOT NULL,
+    Driver_ID INT NOT NULL,
+    Team_ID INT NOT NULL,
+    Points DOUBLE NOT NULL DEFAULT 0,
+    Wins INT NOT NULL DEFAULT 0,
+    Podiums INT NOT NULL DEFAULT 0,
+    Races INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Year, Driver_ID, Team_ID),
+    INDEX idx_dss_year_points (Year, Points),
+    FOREIGN KEY (Driver_ID) REFERENCES DRIVER(Driver_ID),
+    FOREIGN KEY (Team_ID) REFERENCES TEAM(Team_ID)
+);
+
+CREATE TABLE TEAM_SEASON_STANDINGS (
+    Year INT NOT NULL,
+    Team_ID INT NOT NULL,
+    Points DOUBLE NOT NULL DEFAULT 0,
+    Wins INT NOT NULL DEFAULT 0,
+    Podiums INT NOT NULL DEFAULT 0,
+    Races INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Year, Team_ID),
+    INDEX idx_tss_year_points (Year, Points),
+    FOREIGN KEY (Team_ID) REFERENCES TEAM(Team_ID)
+);
+
+-- Change counters for the small lookup tables, bumped by the *Version triggers below;
+-- the app's dimension cache reloads a table's ID <-> name map only when its counter moves
+CREATE TABLE DIMENSION_VERSION (
+    Table_Name VARCHAR(64) PRIMARY KEY,
+    Version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO DIMENSION_VERSION (Table_Name, Version) VALUES
+('DRIVER', 1), ('TEAM', 1), ('RACE', 1), ('STATUS', 1);
+
+-- Precomputed Dashboard page (one JSON document, rebuilt by RefreshDashboardSnapshot)
+CREATE TABLE DASHBOARD_SNAPSHOT (
+    Snapshot_ID TINYINT PRIMARY KEY,
+    Payload JSON NOT NULL,
+    Refreshed_At TIMESTAMP(3) NOT NULL,
+    Build_ms DOUBLE NOT NULL
 );
 
 DELIMITER $$
 
 -- =============================================================
--- STORED PROCEDURES (6 Total - All needed by Streamlit app)
+-- STORED PROCEDURES (13 Total - 7 used by Streamlit app, 2 for standings, 2 for audit retention, 2 for app caches)
 -- =============================================================
 
 -- Procedure 1: Get Driver Statistics
@@ -340,21 +442,19 @@ BEGIN
         RES.Position;
 END$$
 
--- Procedure 3: Get Championship Standings
+-- Procedure 3: Get Championship Standings (reads materialized standings)
 CREATE PROCEDURE GetChampionshipStandings(IN p_year INT)
 BEGIN
     SELECT
         CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
         T.Team_Name,
-        SUM(RES.Points) AS Total_Points,
-        SUM(CASE WHEN RES.Position = 1 THEN 1 ELSE 0 END) AS Wins,
-        COUNT(RES.Result_ID) AS Races
-    FROM DRIVER D
-    JOIN RESULT RES ON D.Driver_ID = RES.Driver_ID
-    JOIN TEAM T ON RES.Team_ID = T.Team_ID
-    JOIN RACE RA ON RES.Race_ID = RA.Race_ID
-    WHERE RA.Year = p_year
-    GROUP BY D.Driver_ID, D.First_Name, D.Last_Name, T.Team_Name
+        DSS.Points AS Total_Points,
+        DSS.Wins,
+        DSS.Races
+    FROM DRIVER_SEASON_STANDINGS DSS
+    JOIN DRIVER D ON DSS.Driver_ID = D.Driver_ID
+    JOIN TEAM T ON DSS.Team_ID = T.Team_ID
+    WHERE DSS.Year = p_year
     ORDER BY Total_Points DESC;
 END$$
 
@@ -368,11 +468,10 @@ CREATE PROCEDURE AddDriver(
 BEGIN
     DECLARE v_new_id INT;
     
-    -- Get next available ID
-    SELECT COALESCE(MAX(Driver_ID), 0) + 1 INTO v_new_id FROM DRIVER;
-    
-    INSERT INTO DRIVER (Driver_ID, First_Name, Last_Name, DOB, Team_ID)
-    VALUES (v_new_id, p_first_name, p_last_name, p_dob, p_team_id);
+    -- Key comes from AUTO_INCREMENT, so concurrent calls never collide
+    INSERT INTO DRIVER (First_Name, Last_Name, DOB, Team_ID)
+    VALUES (p_first_name, p_last_name, p_dob, p_team_id);
+    SET v_new_id = LAST_INSERT_ID();
     
     SELECT v_new_id AS New_Driver_ID,
            CONCAT('Driver ', p_first_name, ' ', p_last_name, ' added successfully!') AS Message;
@@ -408,16 +507,306 @@ CREATE PROCEDURE AddRaceResult(
 BEGIN
     DECLARE v_new_id INT;
     
-    -- Get next available ID
-    SELECT COALESCE(MAX(Result_ID), 0) + 1 INTO v_new_id FROM RESULT;
-    
-    INSERT INTO RESULT (Result_ID, Race_ID, Driver_ID, Team_ID, Status_ID, Position, Grid, Points)
-    VALUES (v_new_id, p_race_id, p_driver_id, p_team_id, p_status_id, p_position, p_grid, p_points);
+    -- Key comes from AUTO_INCREMENT, so concurrent calls never collide
+    INSERT INTO RESULT (Race_ID, Driver_ID, Team_ID, Status_ID, Position, Grid, Points)
+    VALUES (p_race_id, p_driver_id, p_team_id, p_status_id, p_position, p_grid, p_points);
+    SET v_new_id = LAST_INSERT_ID();
     
     SELECT v_new_id AS New_Result_ID,
            'Race result added successfully!' AS Message;
 END$$
 
+-- Procedure 7: Add a Whole Race Classification (used by Streamlit)
+-- p_results is a JSON array of
+--   {"driver_id", "team_id", "status_id", "position", "grid", "points"}
+-- and is inserted in one statement inside one transaction
+CREATE PROCEDURE AddRaceResults(
+    IN p_race_id INT,
+    IN p_results JSON
+)
+BEGIN
+    DECLARE v_added INT;
+    DECLARE v_first_id INT;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+    
+    START TRANSACTION;
+    
+    INSERT INTO RESULT (Race_ID, Driver_ID, Team_ID, Status_ID, Position, Grid, Points)
+    SELECT p_race_id, J.Driver_ID, J.Team_ID, J.Status_ID, J.Position, J.Grid, J.Points
+    FROM JSON_TABLE(p_results, '$[*]' COLUMNS (
+        Driver_ID INT PATH '$.driver_id' ERROR ON EMPTY,
+        Team_ID INT PATH '$.team_id' ERROR ON EMPTY,
+        Status_ID INT PATH '$.status_id' ERROR ON EMPTY,
+        Position INT PATH '$.position',
+        Grid INT PATH '$.grid',
+        Points FLOAT PATH '$.points' DEFAULT '0' ON EMPTY
+    )) AS J;
+    
+    SET v_added = ROW_COUNT();
+    SET v_first_id = LAST_INSERT_ID();
+    
+    COMMIT;
+    
+    SELECT v_added AS Results_Added,
+           v_first_id AS First_Result_ID,
+           'Race classification added successfully!' AS Message;
+END$$
+
+-- Procedure 8: Apply one result row to the materialized standings
+-- p_sign is 1 when a result is added and -1 when it is removed
+CREATE PROCEDURE ApplyStandingsDelta(
+    IN p_race_id INT,
+    IN p_driver_id INT,
+    IN p_team_id INT,
+    IN p_position INT,
+    IN p_points FLOAT,
+    IN p_sign INT
+)
+BEGIN
+    DECLARE v_year INT;
+    
+    SELECT Year INTO v_year FROM RACE WHERE Race_ID = p_race_id;
+    
+    IF v_year IS NOT NULL THEN
+        INSERT INTO DRIVER_SEASON_STANDINGS (Year, Driver_ID, Team_ID, Points, Wins, Podiums, Races)
+        VALUES (v_year, p_driver_id, p_team_id, p_sign * p_points,
+                IF(p_position = 1, p_sign, 0), IF(p_position <= 3, p_sign, 0), p_sign)
+        ON DUPLICATE KEY UPDATE
+            Points = Points + VALUES(Points),
+            Wins = Wins + VALUES(Wins),
+            Podiums = Podiums + VALUES(Podiums),
+            Races = Races + VALUES(Races);
+        
+        INSERT INTO TEAM_SEASON_STANDINGS (Year, Team_ID, Points, Wins, Podiums, Races)
+        VALUES (v_year, p_team_id, p_sign * p_points,
+                IF(p_position = 1, p_sign, 0), IF(p_position <= 3, p_sign, 0), p_sign)
+        ON DUPLICATE KEY UPDATE
+            Points = Points + VALUES(Points),
+            Wins = Wins + VALUES(Wins),
+            Podiums = Podiums + VALUES(Podiums),
+            Races = Races + VALUES(Races);
+        
+        IF p_sign < 0 THEN
+            DELETE FROM DRIVER_SEASON_STANDINGS
+            WHERE Year = v_year AND Driver_ID = p_driver_id AND Team_ID = p_team_id AND Races <= 0;
+            DELETE FROM TEAM_SEASON_STANDINGS
+            WHERE Year = v_year AND Team_ID = p_team_id AND Races <= 0;
+        END IF;
+    END IF;
+END$$
+
+-- Procedure 9: Rebuild materialized standings from RESULT (NULL = every season)
+-- Use after backfills or bulk loads that bypassed the triggers
+CREATE PROCEDURE RebuildSeasonStandings(IN p_year INT)
+BEGIN
+    DELETE FROM DRIVER_SEASON_STANDINGS WHERE p_year IS NULL OR Year = p_year;
+    DELETE FROM TEAM_SEASON_STANDINGS WHERE p_year IS NULL OR Year = p_year;
+    
+    INSERT INTO DRIVER_SEASON_STANDINGS (Year, Driver_ID, Team_ID, Points, Wins, Podiums, Races)
+    SELECT
+        RA.Year,
+        RES.Driver_ID,
+        RES.Team_ID,
+        SUM(RES.Points),
+        SUM(CASE WHEN RES.Position = 1 THEN 1 ELSE 0 END),
+        SUM(CASE WHEN RES.Position <= 3 THEN 1 ELSE 0 END),
+        COUNT(*)
+    FROM RESULT RES
+    JOIN RACE RA ON RES.Race_ID = RA.Race_ID
+    WHERE RA.Year IS NOT NULL AND (p_year IS NULL OR RA.Year = p_year)
+    GROUP BY RA.Year, RES.Driver_ID, RES.Team_ID;
+    
+    INSERT INTO TEAM_SEASON_STANDINGS (Year, Team_ID, Points, Wins, Podiums, Races)
+    SELECT
+        RA.Year,
+        RES.Team_ID,
+        SUM(RES.Points),
+        SUM(CASE WHEN RES.Position = 1 THEN 1 ELSE 0 END),
+        SUM(CASE WHEN RES.Position <= 3 THEN 1 ELSE 0 END),
+        COUNT(*)
+    FROM RESULT RES
+    JOIN RACE RA ON RES.Race_ID = RA.Race_ID
+    WHERE RA.Year IS NOT NULL AND (p_year IS NULL OR RA.Year = p_year)
+    GROUP BY RA.Year, RES.Team_ID;
+END$$
+
+-- Procedure 10: Split monthly AUDIT_LOG partitions off p_future up to p_months_ahead
+-- months past the current one. Run it ahead of time (e.g. monthly from cron) so
+-- p_future stays empty and each split is a metadata-only change.
+CREATE PROCEDURE AddAuditPartitions(IN p_months_ahead INT)
+BEGIN
+    DECLARE v_boundary DATE;
+    DECLARE v_target DATE;
+    DECLARE v_added INT DEFAULT 0;
+    
+    -- Upper bound of the newest bounded partition = first month still in p_future
+    SELECT DATE(FROM_UNIXTIME(MAX(CAST(PARTITION_DESCRIPTION AS UNSIGNED)))) INTO v_boundary
+    FROM information_schema.PARTITIONS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'AUDIT_LOG'
+      AND PARTITION_DESCRIPTION <> 'MAXVALUE';
+    IF v_boundary IS NULL THEN
+        SET v_boundary = DATE_FORMAT(CURDATE(), '%Y-%m-01');
+    END IF;
+    
+    SET v_target = DATE_FORMAT(CURDATE() + INTERVAL (p_months_ahead + 1) MONTH, '%Y-%m-01');
+    WHILE v_boundary < v_target DO
+        SET @f1_sql = CONCAT(
+            'ALTER TABLE AUDIT_LOG REORGANIZE PARTITION p_future INTO (',
+            'PARTITION p', DATE_FORMAT(v_boundary, '%Y%m'),
+            ' VALUES LESS THAN (UNIX_TIMESTAMP(''', v_boundary + INTERVAL 1 MONTH, ' 00:00:00'')), ',
+            'PARTITION p_future VALUES LESS THAN MAXVALUE)'
+        );
+        PREPARE stmt FROM @f1_sql;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+        SET v_boundary = v_boundary + INTERVAL 1 MONTH;
+        SET v_added = v_added + 1;
+    END WHILE;
+    
+    SELECT v_added AS Partitions_Added;
+END$$
+
+-- Procedure 11: Retire AUDIT_LOG partitions that end before the last p_keep_months
+-- months. With p_archive each one is first swapped (EXCHANGE PARTITION, O(1)) into
+-- its own AUDIT_LOG_ARCHIVE_<partition> table for audit_archive.py to export;
+-- otherwise it is simply dropped. No row-by-row DELETE either way.
+CREATE PROCEDURE PurgeAuditLog(IN p_keep_months INT, IN p_archive BOOLEAN)
+BEGIN
+    DECLARE v_cutoff BIGINT;
+    DECLARE v_partitions TEXT;
+    DECLARE v_partition VARCHAR(64);
+    DECLARE v_purged INT DEFAULT 0;
+    
+    SET v_cutoff = UNIX_TIMESTAMP(DATE_FORMAT(CURDATE() - INTERVAL p_keep_months MONTH, '%Y-%m-01'));
+    
+    SELECT GROUP_CONCAT(PARTITION_NAME ORDER BY PARTITION_ORDINAL_POSITION) INTO v_partitions
+    FROM information_schema.PARTITIONS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'AUDIT_LOG'
+      AND PARTITION_DESCRIPTION <> 'MAXVALUE'
+      AND CAST(PARTITION_DESCRIPTION AS UNSIGNED) <= v_cutoff;
+    
+    WHILE v_partitions IS NOT NULL AND v_partitions <> '' DO
+        SET v_partition = SUBSTRING_INDEX(v_partitions, ',', 1);
+        SET v_partitions = IF(LOCATE(',', v_partitions) > 0,
+                              SUBSTRING(v_partitions, LOCATE(',', v_partitions) + 1), NULL);
+        
+        IF p_archive THEN
+            SET @f1_sql = CONCAT('CREATE TABLE AUDIT_LOG_ARCHIVE_', v_partition, ' LIKE AUDIT_LOG');
+            PREPARE stmt FROM @f1_sql;
+            EXECUTE stmt;
+            DEALLOCATE PREPARE stmt;
+            SET @f1_sql = CONCAT('ALTER TABLE AUDIT_LOG_ARCHIVE_', v_partition, ' REMOVE PARTITIONING');
+            PREPARE stmt FROM @f1_sql;
+            EXECUTE stmt;
+            DEALLOCATE PREPARE stmt;
+            SET @f1_sql = CONCAT('ALTER TABLE AUDIT_LOG EXCHANGE PARTITION ', v_partition,
+                                 ' WITH TABLE AUDIT_LOG_ARCHIVE_', v_partition);
+            PREPARE stmt FROM @f1_sql;
+            EXECUTE stmt;
+            DEALLOCATE PREPARE stmt;
+        END IF;
+        
+        SET @f1_sql = CONCAT('ALTER TABLE AUDIT_LOG DROP PARTITION ', v_partition);
+        PREPARE stmt FROM @f1_sql;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+        SET v_purged = v_purged + 1;
+    END WHILE;
+    
+    SELECT v_purged AS Partitions_Purged;
+END$$
+
+-- Procedure 12: Recompute everything the Dashboard page shows into DASHBOARD_SNAPSHOT
+-- (run every minute by RefreshDashboardSnapshotEvent and by the app after writes).
+-- List entries carry their rank as N, since JSON_ARRAYAGG does not keep row order.
+CREATE PROCEDURE RefreshDashboardSnapshot()
+BEGIN
+    DECLARE v_started DATETIME(6) DEFAULT SYSDATE(6);
+    DECLARE v_payload JSON;
+    
+    SELECT JSON_OBJECT(
+        'drivers', (SELECT COUNT(*) FROM DRIVER),
+        'teams', (SELECT COUNT(*) FROM TEAM),
+        'races', (SELECT COUNT(*) FROM RACE),
+        'results', (SELECT COUNT(*) FROM RESULT),
+        'top_drivers', (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'N', N, 'Driver', Driver, 'Team_Name', Team_Name, 'Points', Points, 'Wins', Wins))
+            FROM (
+                SELECT
+                    ROW_NUMBER() OVER (ORDER BY SUM(DSS.Points) DESC) AS N,
+                    CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver,
+                    T.Team_Name,
+                    SUM(DSS.Points) AS Points,
+                    SUM(DSS.Wins) AS Wins
+                FROM DRIVER_SEASON_STANDINGS DSS
+                JOIN DRIVER D ON DSS.Driver_ID = D.Driver_ID
+                JOIN TEAM T ON DSS.Team_ID = T.Team_ID
+                GROUP BY D.Driver_ID, D.First_Name, D.Last_Name, T.Team_Name
+                ORDER BY Points DESC
+                LIMIT 5
+            ) TOP_DRIVERS
+        ),
+        'top_teams', (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT('N', N, 'Team_Name', Team_Name, 'Points', Points, 'Wins', Wins))
+            FROM (
+                SELECT
+                    ROW_NUMBER() OVER (ORDER BY SUM(TSS.Points) DESC) AS N,
+                    T.Team_Name,
+                    SUM(TSS.Points) AS Points,
+                    SUM(TSS.Wins) AS Wins
+                FROM TEAM_SEASON_STANDINGS TSS
+                JOIN TEAM T ON TSS.Team_ID = T.Team_ID
+                GROUP BY T.Team_ID, T.Team_Name
+                ORDER BY Points DESC
+                LIMIT 5
+            ) TOP_TEAMS
+        ),
+        'recent_races', (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'N', N, 'Race_Name', Race_Name, 'Venue', Venue, 'Circuit_Name', Circuit_Name,
+                'Year', Year, 'Winner', Winner))
+            FROM (
+                SELECT
+                    ROW_NUMBER() OVER (ORDER BY RA.Race_ID DESC) AS N,
+                    RA.Race_Name,
+                    RA.Venue,
+                    C.Circuit_Name,
+                    RA.Year,
+                    CONCAT(D.First_Name, ' ', D.Last_Name) AS Winner
+                FROM RACE RA
+                JOIN CIRCUIT C ON RA.Circuit_ID = C.Circuit_ID
+                LEFT JOIN RESULT RES ON RA.Race_ID = RES.Race_ID AND RES.Position = 1
+                LEFT JOIN DRIVER D ON RES.Driver_ID = D.Driver_ID
+                ORDER BY RA.Race_ID DESC
+                LIMIT 5
+            ) RECENT_RACES
+        )
+    ) INTO v_payload;
+    
+    INSERT INTO DASHBOARD_SNAPSHOT (Snapshot_ID, Payload, Refreshed_At, Build_ms)
+    VALUES (1, v_payload, v_started, TIMESTAMPDIFF(MICROSECOND, v_started, SYSDATE(6)) / 1000)
+    ON DUPLICATE KEY UPDATE
+        Payload = VALUES(Payload),
+        Refreshed_At = VALUES(Refreshed_At),
+        Build_ms = VALUES(Build_ms);
+END$$
+
+-- Procedure 13: Bump a lookup table's DIMENSION_VERSION counter (called by triggers;
+-- skipped during bulk loads, which bump every counter once at the end)
+CREATE PROCEDURE BumpDimensionVersion(IN p_table VARCHAR(64))
+BEGIN
+    IF COALESCE(@f1_bulk_load, 0) = 0 THEN
+        INSERT INTO DIMENSION_VERSION (Table_Name, Version) VALUES (p_table, 1)
+        ON DUPLICATE KEY UPDATE Version = Version + 1;
+    END IF;
+END$$
+
 -- =============================================================
 -- FUNCTIONS (6 Total - All needed by Streamlit app)
 -- =============================================================
@@ -501,7 +890,7 @@ BEGIN
 END$$
 
 -- =============================================================
--- TRIGGERS (3 Total)
+-- TRIGGERS (20 Total)
 -- =============================================================
 
 -- Trigger 1: Log New Driver
@@ -509,9 +898,12 @@ CREATE TRIGGER LogNewDriver
 AFTER INSERT ON DRIVER
 FOR EACH ROW
 BEGIN
-    INSERT INTO AUDIT_LOG (Table_Name, Action, Record_ID, New_Value, Changed_By)
-    VALUES ('DRIVER', 'INSERT', NEW.Driver_ID, 
-            CONCAT('Name: ', NEW.First_Name, ' ', NEW.Last_Name), USER());
+    -- Not for bulk loads (load_history.py), which would log one row per historical driver
+    IF COALESCE(@f1_bulk_load, 0) = 0 THEN
+        INSERT INTO AUDIT_LOG (Table_Name, Action, Record_ID, New_Value, Changed_By)
+        VALUES ('DRIVER', 'INSERT', NEW.Driver_ID, 
+                CONCAT('Name: ', NEW.First_Name, ' ', NEW.Last_Name), USER());
+    END IF;
 END$$
 
 -- Trigger 2: Prevent Driver Deletion
@@ -548,8 +940,148 @@ BEGIN
     END IF;
 END$$
 
+-- Triggers 4-6 keep the materialized standings current. Bulk loads set
+-- @f1_bulk_load = 1 to skip them and call RebuildSeasonStandings afterwards.
+
+-- Trigger 4: Add New Result to Standings
+CREATE TRIGGER AddResultToStandings
+AFTER INSERT ON RESULT
+FOR EACH ROW
+BEGIN
+    IF COALESCE(@f1_bulk_load, 0) = 0 THEN
+        CALL ApplyStandingsDelta(NEW.Race_ID, NEW.Driver_ID, NEW.Team_ID, NEW.Position, NEW.Points, 1);
+    END IF;
+END$$
+
+-- Trigger 5: Move Updated Result Between Standings
+CREATE TRIGGER UpdateResultInStandings
+AFTER UPDATE ON RESULT
+FOR EACH ROW
+BEGIN
+    IF COALESCE(@f1_bulk_load, 0) = 0 THEN
+        CALL ApplyStandingsDelta(OLD.Race_ID, OLD.Driver_ID, OLD.Team_ID, OLD.Position, OLD.Points, -1);
+        CALL ApplyStandingsDelta(NEW.Race_ID, NEW.Driver_ID, NEW.Team_ID, NEW.Position, NEW.Points, 1);
+    END IF;
+END$$
+
+-- Trigger 6: Remove Deleted Result from Standings
+CREATE TRIGGER RemoveResultFromStandings
+AFTER DELETE ON RESULT
+FOR EACH ROW
+BEGIN
+    IF COALESCE(@f1_bulk_load, 0) = 0 THEN
+        CALL ApplyStandingsDelta(OLD.Race_ID, OLD.Driver_ID, OLD.Team_ID, OLD.Position, OLD.Points, -1);
+    END IF;
+END$$
+
+-- Triggers 7-18: Lookup table change counters for the app's dimension cache
+CREATE TRIGGER BumpDriverVersionOnInsert
+AFTER INSERT ON DRIVER
+FOR EACH ROW
+CALL BumpDimensionVersion('DRIVER')$$
+
+CREATE TRIGGER BumpDriverVersionOnUpdate
+AFTER UPDATE ON DRIVER
+FOR EACH ROW
+CALL BumpDimensionVersion('DRIVER')$$
+
+CREATE TRIGGER BumpDriverVersionOnDelete
+AFTER DELETE ON DRIVER
+FOR EACH ROW
+CALL BumpDimensionVersion('DRIVER')$$
+
+CREATE TRIGGER BumpTeamVersionOnInsert
+AFTER INSERT ON TEAM
+FOR EACH ROW
+CALL BumpDimensionVersion('TEAM')$$
+
+CREATE TRIGGER BumpTeamVersionOnUpdate
+AFTER UPDATE ON TEAM
+FOR EACH ROW
+CALL BumpDimensionVersion('TEAM')$$
+
+CREATE TRIGGER BumpTeamVersionOnDelete
+AFTER DELETE ON TEAM
+FOR EACH ROW
+CALL BumpDimensionVersion('TEAM')$$
+
+CREATE TRIGGER BumpRaceVersionOnInsert
+AFTER INSERT ON RACE
+FOR EACH ROW
+CALL BumpDimensionVersion('RACE')$$
+
+CREATE TRIGGER BumpRaceVersionOnUpdate
+AFTER UPDATE ON RACE
+FOR EACH ROW
+CALL BumpDimensionVersion('RACE')$$
+
+CREATE TRIGGER BumpRaceVersionOnDelete
+AFTER DELETE ON RACE
+FOR EACH ROW
+CALL BumpDimensionVersion('RACE')$$
+
+CREATE TRIGGER BumpStatusVersionOnInsert
+AFTER INSERT ON STATUS
+FOR EACH ROW
+CALL BumpDimensionVersion('STATUS')$$
+
+CREATE TRIGGER BumpStatusVersionOnUpdate
+AFTER UPDATE ON STATUS
+FOR EACH ROW
+CALL BumpDimensionVersion('STATUS')$$
+
+CREATE TRIGGER BumpStatusVersionOnDelete
+AFTER DELETE ON STATUS
+FOR EACH ROW
+CALL BumpDimensionVersion('STATUS')$$
+
+-- Triggers 19-20: Log result edits so analytics_mirror.py can rebuild just the seasons
+-- they touched (new results are picked up by Result_ID, so inserts are not logged)
+CREATE TRIGGER LogResultUpdate
+AFTER UPDATE ON RESULT
+FOR EACH ROW
+BEGIN
+    IF COALESCE(@f1_bulk_load, 0) = 0 THEN
+        INSERT INTO AUDIT_LOG (Table_Name, Action, Record_ID, Old_Value, New_Value, Changed_By)
+        VALUES ('RESULT', 'UPDATE', NEW.Result_ID,
+                CONCAT('Race_ID: ', OLD.Race_ID, ', Driver_ID: ', OLD.Driver_ID, ', Points: ', OLD.Points),
+                CONCAT('Race_ID: ', NEW.Race_ID, ', Driver_ID: ', NEW.Driver_ID, ', Points: ', NEW.Points),
+                USER());
+    END IF;
+END$$
+
+CREATE TRIGGER LogResultDelete
+AFTER DELETE ON RESULT
+FOR EACH ROW
+BEGIN
+    IF COALESCE(@f1_bulk_load, 0) = 0 THEN
+        INSERT INTO AUDIT_LOG (Table_Name, Action, Record_ID, Old_Value, Changed_By)
+        VALUES ('RESULT', 'DELETE', OLD.Result_ID,
+                CONCAT('Race_ID: ', OLD.Race_ID, ', Driver_ID: ', OLD.Driver_ID, ', Points: ', OLD.Points),
+                USER());
+    END IF;
+END$$
+
+-- =============================================================
+-- EVENTS (1 Total - needs SET GLOBAL event_scheduler = ON)
+-- =============================================================
+
+-- Event 1: Keep the dashboard snapshot at most a minute old
+CREATE EVENT RefreshDashboardSnapshotEvent
+ON SCHEDULE EVERY 60 SECOND
+DO CALL RefreshDashboardSnapshot()$$
+
 DELIMITER ;
 
+-- Results above were inserted before the standings triggers existed
+CALL RebuildSeasonStandings(NULL);
+
+-- Monthly audit partitions from 2025 through three months ahead
+CALL AddAuditPartitions(3);
+
+-- First dashboard snapshot (the event keeps it fresh from here on)
+CALL RefreshDashboardSnapshot();
+
 
 SELECT First_Name, Last_Name
 FROM DRIVER
@@ -564,12 +1096,13 @@ WHERE Driver_ID NOT IN (
 -- =============================================================
 
 SELECT '✅ F1 Database Setup Complete!' AS Status;
-SELECT 'Schema + Data + 6 Procedures + 6 Functions + 3 Triggers' AS Components;
+SELECT 'Schema + Data + 13 Procedures + 6 Functions + 20 Triggers + 1 Event' AS Components;
 
 -- Show all database objects
 SHOW PROCEDURE STATUS WHERE Db = DATABASE();
 SHOW FUNCTION STATUS WHERE Db = DATABASE();
 SHOW TRIGGERS;
+SHOW EVENTS;
 
 
 
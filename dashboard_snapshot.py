@@ -0,0 +1,98 @@
+"""
+Precomputed Dashboard snapshot: one-read loader plus a background refresher
+"""
+
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+from mysql.connector import Error
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+# Schedule of RefreshDashboardSnapshotEvent; a snapshot older than this is stale
+REFRESH_INTERVAL = float(os.environ.get('F1_DASHBOARD_REFRESH_INTERVAL', 60))
+# Writes arriving within this many seconds of each other share one refresh
+REFRESH_DEBOUNCE = float(os.environ.get('F1_DASHBOARD_REFRESH_DEBOUNCE', 1))
+
+# Tables the snapshot is computed from - writes to any of them make it stale
+SNAPSHOT_TABLES = frozenset({
+    'DRIVER', 'TEAM', 'RACE', 'CIRCUIT', 'RESULT',
+    'DRIVER_SEASON_STANDINGS', 'TEAM_SEASON_STANDINGS',
+})
+
+SNAPSHOT_QUERY = """
+SELECT Payload, Refreshed_At, Build_ms,
+       TIMESTAMPDIFF(MICROSECOND, Refreshed_At, NOW(3)) / 1e6 AS Age
+FROM DASHBOARD_SNAPSHOT
+WHERE Snapshot_ID = 1
+"""
+
+# Column order of each list section, as the Dashboard used to display it
+SECTION_COLUMNS = {
+    'top_drivers': ['Driver', 'Team_Name', 'Points', 'Wins'],
+    'top_teams': ['Team_Name', 'Points', 'Wins'],
+    'recent_races': ['Race_Name', 'Venue', 'Circuit_Name', 'Year', 'Winner'],
+}
+
+
+def parse_snapshot(row):
+    """Turn a DASHBOARD_SNAPSHOT row into counts, section DataFrames and freshness info"""
+    payload = json.loads(row['Payload'])
+    snapshot = {
+        'counts': {name: payload.get(name) or 0 for name in ('drivers', 'teams', 'races', 'results')},
+        'refreshed_at': row['Refreshed_At'],
+        'build_ms': row['Build_ms'],
+        'age': float(row['Age']),
+    }
+    for section, columns in SECTION_COLUMNS.items():
+        entries = sorted(payload.get(section) or [], key=lambda entry: entry['N'])
+        snapshot[section] = pd.DataFrame(entries, columns=columns)
+    return snapshot
+
+
+def refresh_snapshot(pool):
+    """Rebuild the snapshot now on a pooled connection"""
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.callproc('RefreshDashboardSnapshot')
+        for result in cursor.stored_results():
+            result.fetchall()
+        cursor.close()
+
+
+class SnapshotRefresher:
+    """Daemon thread that rebuilds the snapshot shortly after writes, coalescing bursts"""
+
+    def __init__(self, pool, debounce=REFRESH_DEBOUNCE):
+        self._pool = pool
+        self._debounce = debounce
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.refreshes = 0
+        self.failures = 0
+        self.last_error = None
+
+    def request(self):
+        """Schedule a refresh without waiting for it"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='dashboard-snapshot', daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            time.sleep(self._debounce)  # let the rest of a write burst land first
+            self._wake.clear()
+            try:
+                refresh_snapshot(self._pool)
+                self.refreshes += 1
+            except Error as e:
+                self.failures += 1
+                self.last_error = str(e)
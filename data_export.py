@@ -0,0 +1,268 @@
+"""
+Streaming CSV / Parquet export of full-history tables
+
+Rows come off an unbuffered cursor (the server streams the result instead of
+the client buffering it) in fixed-size fetchmany() chunks, and each chunk is
+written out before the next is read, so memory stays flat whatever the size
+of the result.
+
+Usage:
+    python data_export.py {race_results,driver_standings,team_standings,audit_log}
+                          [--format csv|parquet] [--out PATH] [--chunk-rows 50000]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.constants import FieldType
+
+from db_pool import DB_CONFIG
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+# Rows per fetchmany() / CSV flush / Parquet row group
+EXPORT_CHUNK = int(os.environ.get('F1_EXPORT_CHUNK_ROWS', 50_000))
+EXPORT_DIR = os.environ.get('F1_EXPORT_DIR', 'exports')
+# Larger exports are left on the server instead of offered as a browser download (which loads the file)
+DOWNLOAD_MAX_MB = float(os.environ.get('F1_EXPORT_DOWNLOAD_MAX_MB', 200))
+# Seconds the server waits on a slow reader (e.g. a Parquet writer) before dropping the stream
+NET_WRITE_TIMEOUT = int(os.environ.get('F1_EXPORT_NET_WRITE_TIMEOUT', 600))
+
+FORMATS = ('csv', 'parquet')
+
+RACE_RESULTS_EXPORT = """
+SELECT
+    RA.Year,
+    RA.Round,
+    RA.Race_ID,
+    RA.Race_Name,
+    C.Circuit_Name,
+    RES.Result_ID,
+    RES.Position,
+    RES.Grid,
+    RES.Driver_ID,
+    CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
+    RES.Team_ID,
+    T.Team_Name,
+    S.Status_description AS Status,
+    RES.Points
+FROM RESULT RES
+JOIN RACE RA ON RES.Race_ID = RA.Race_ID
+JOIN CIRCUIT C ON RA.Circuit_ID = C.Circuit_ID
+JOIN DRIVER D ON RES.Driver_ID = D.Driver_ID
+JOIN TEAM T ON RES.Team_ID = T.Team_ID
+JOIN STATUS S ON RES.Status_ID = S.Status_ID
+ORDER BY RES.Result_ID
+"""
+
+DRIVER_STANDINGS_EXPORT = """
+SELECT
+    DSS.Year,
+    DSS.Driver_ID,
+    CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
+    DSS.Team_ID,
+    T.Team_Name,
+    DSS.Points,
+    DSS.Wins,
+    DSS.Podiums,
+    DSS.Races
+FROM DRIVER_SEASON_STANDINGS DSS
+JOIN DRIVER D ON DSS.Driver_ID = D.Driver_ID
+JOIN TEAM T ON DSS.Team_ID = T.Team_ID
+ORDER BY DSS.Year, DSS.Driver_ID, DSS.Team_ID
+"""
+
+TEAM_STANDINGS_EXPORT = """
+SELECT
+    TSS.Year,
+    TSS.Team_ID,
+    T.Team_Name,
+    TSS.Points,
+    TSS.Wins,
+    TSS.Podiums,
+    TSS.Races
+FROM TEAM_SEASON_STANDINGS TSS
+JOIN TEAM T ON TSS.Team_ID = T.Team_ID
+ORDER BY TSS.Year, TSS.Team_ID
+"""
+
+AUDIT_LOG_EXPORT = """
+SELECT Log_ID, Table_Name, Action, Record_ID, Old_Value, New_Value, Changed_By, Changed_At
+FROM AUDIT_LOG
+{where}
+ORDER BY Changed_At, Log_ID
+"""
+
+# name -> (export query, row count query for progress)
+EXPORTS = {
+    'race_results': (RACE_RESULTS_EXPORT, "SELECT COUNT(*) AS Row_Count FROM RESULT"),
+    'driver_standings': (DRIVER_STANDINGS_EXPORT, "SELECT COUNT(*) AS Row_Count FROM DRIVER_SEASON_STANDINGS"),
+    'team_standings': (TEAM_STANDINGS_EXPORT, "SELECT COUNT(*) AS Row_Count FROM TEAM_SEASON_STANDINGS"),
+    'audit_log': (AUDIT_LOG_EXPORT.format(where=""), "SELECT COUNT(*) AS Row_Count FROM AUDIT_LOG"),
+}
+
+_INTEGER_TYPES = {FieldType.TINY, FieldType.SHORT, FieldType.LONG, FieldType.INT24, FieldType.LONGLONG,
+                  FieldType.YEAR}
+_FLOAT_TYPES = {FieldType.FLOAT, FieldType.DOUBLE, FieldType.DECIMAL, FieldType.NEWDECIMAL}
+_DATETIME_TYPES = {FieldType.DATETIME, FieldType.TIMESTAMP}
+
+
+class ExportError(Exception):
+    """An export could not be written (bad format, missing pyarrow)"""
+
+
+def export_path(name, fmt, out_dir=EXPORT_DIR):
+    """Timestamped file name for an export of `name`"""
+    return os.path.join(out_dir, f"{name}-{datetime.now():%Y%m%d-%H%M%S}.{fmt}")
+
+
+def _arrow_schema(pa, description):
+    """Fixed Arrow schema from the cursor's column types, so every row group agrees"""
+    fields = []
+    for column in description:
+        name, type_code = column[0], column[1]
+        if type_code in _INTEGER_TYPES:
+            arrow_type = pa.int64()
+        elif type_code in _FLOAT_TYPES:
+            arrow_type = pa.float64()
+        elif type_code in _DATETIME_TYPES:
+            arrow_type = pa.timestamp('us')
+        elif type_code == FieldType.DATE:
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _arrow_values(values, arrow_type, pa):
+    if pa.types.is_floating(arrow_type):
+        return [None if v is None else float(v) for v in values]
+    if pa.types.is_string(arrow_type):
+        return [v if v is None or isinstance(v, str) else
+                v.decode() if isinstance(v, (bytes, bytearray)) else str(v) for v in values]
+    return list(values)
+
+
+class _CsvSink:
+    def __init__(self, path, names):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(names)
+
+    def write(self, rows):
+        self._writer.writerows(
+            [float(v) if isinstance(v, Decimal) else v for v in row] for row in rows
+        )
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetSink:
+    def __init__(self, path, description):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ExportError("Parquet export needs pyarrow: pip install pyarrow")
+        self._pa = pa
+        self._schema = _arrow_schema(pa, description)
+        self._writer = pq.ParquetWriter(path, self._schema, compression='zstd')
+
+    def write(self, rows):
+        pa = self._pa
+        columns = [
+            pa.array(_arrow_values(values, field.type, pa), type=field.type)
+            for field, values in zip(self._schema, zip(*rows))
+        ]
+        self._writer.write_table(pa.Table.from_arrays(columns, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def stream_export(conn, query, params, path, fmt='csv', chunk_rows=EXPORT_CHUNK, progress=None):
+    """Stream a query's rows into a CSV or Parquet file at `path`; returns the row count
+
+    `progress(rows_written)` is called after every chunk. The file only gets
+    its final name once complete, so an interrupted export leaves no partial
+    file behind under that name.
+    """
+    if fmt not in FORMATS:
+        raise ExportError(f"Unknown export format '{fmt}' (expected one of {', '.join(FORMATS)})")
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    partial = path + '.partial'
+
+    setup = conn.cursor()
+    setup.execute("SET SESSION net_write_timeout = %s", (NET_WRITE_TIMEOUT,))
+    cursor = conn.cursor(buffered=False)
+    sink = None
+    rows_written = 0
+    try:
+        cursor.execute(query, params or ())
+        names = [column[0] for column in cursor.description]
+        sink = _CsvSink(partial, names) if fmt == 'csv' else _ParquetSink(partial, cursor.description)
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            sink.write(rows)
+            rows_written += len(rows)
+            if progress is not None:
+                progress(rows_written)
+        sink.close()
+        sink = None
+        os.replace(partial, path)
+    finally:
+        if sink is not None:
+            sink.close()
+        if os.path.exists(partial):
+            os.remove(partial)
+        try:
+            # An abandoned unbuffered result must be drained before the connection is reused
+            conn.consume_results()
+            cursor.close()
+            setup.execute("SET SESSION net_write_timeout = DEFAULT")
+            setup.close()
+        except Error:
+            pass
+    return rows_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a full-history table to CSV or Parquet")
+    parser.add_argument('name', choices=sorted(EXPORTS), help="what to export")
+    parser.add_argument('--format', choices=FORMATS, default='csv', help="output format")
+    parser.add_argument('--out', help=f"output file (default: a timestamped file in {EXPORT_DIR}/)")
+    parser.add_argument('--chunk-rows', type=int, default=EXPORT_CHUNK, help="rows per fetch / write")
+    args = parser.parse_args()
+
+    path = args.out or export_path(args.name, args.format)
+    query, _ = EXPORTS[args.name]
+    started = time.perf_counter()
+    try:
+        conn = mysql.connector.connect(**DB_CONFIG, autocommit=True)
+        rows = stream_export(
+            conn, query, (), path, args.format, args.chunk_rows,
+            progress=lambda n: print(f"\r  {n:,} rows", end='', flush=True),
+        )
+        conn.close()
+    except (Error, ExportError, OSError) as e:
+        print(f"\n❌ Export failed: {e}")
+        return 1
+
+    print(f"\n✅ {rows:,} rows -> {path} ({time.perf_counter() - started:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
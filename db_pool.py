@@ -0,0 +1,225 @@
+"""
+Thread-safe MySQL connection pool for the F1 Database Management System
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import mysql.connector
+from mysql.connector import Error, errors
+
+from statement_cache import StatementCache
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+DB_CONFIG = {
+    'host': os.environ.get('F1_DB_HOST', 'localhost'),
+    'port': int(os.environ.get('F1_DB_PORT', 3306)),
+    'user': os.environ.get('F1_DB_USER', 'root'),  # Change to your username
+    'password': os.environ.get('F1_DB_PASSWORD', 'suhkan@2019'),  # CHANGE THIS TO YOUR PASSWORD
+    'database': os.environ.get('F1_DB_NAME', 'f1_db'),
+}
+
+POOL_SIZE = int(os.environ.get('F1_DB_POOL_SIZE', 10))
+CHECKOUT_TIMEOUT = float(os.environ.get('F1_DB_CHECKOUT_TIMEOUT', 10))
+# Connections idle longer than this are pinged (and reconnected) on checkout
+HEALTH_CHECK_INTERVAL = float(os.environ.get('F1_DB_HEALTH_CHECK_INTERVAL', 30))
+
+# Errors that mean the socket itself is unusable, not just the statement
+CONNECTION_ERRORS = (errors.OperationalError, errors.InterfaceError)
+
+
+class PoolTimeoutError(Error):
+    """No pooled connection became free within the checkout timeout"""
+
+
+class ConnectionPool:
+    """Bounded pool of MySQL connections shared by every Streamlit session"""
+
+    def __init__(self, config=None, size=POOL_SIZE, checkout_timeout=CHECKOUT_TIMEOUT,
+                 health_check_interval=HEALTH_CHECK_INTERVAL):
+        self.config = dict(config or DB_CONFIG)
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._idle = []  # (connection, last_used) - LIFO so warm sockets are reused first
+        self._created = 0
+        self._in_use = 0
+        # id(connection) -> its prepared statements; server-side they die with the session,
+        # so an entry is dropped whenever its connection is closed or reconnected
+        self._statements = {}
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_time': 0.0,
+            'timeouts': 0,
+            'reconnects': 0,
+            'discarded': 0,
+        }
+
+    def _connect(self):
+        """Open a new server connection"""
+        conn = mysql.connector.connect(**self.config)
+        # Pooled connections must not hold a read snapshot open between checkouts
+        conn.autocommit = True
+        return conn
+
+    def _ensure_healthy(self, conn, last_used):
+        """Ping a connection that has been idle for a while, reconnecting if needed"""
+        if time.monotonic() - last_used < self.health_check_interval:
+            return conn
+        if conn.is_connected():
+            return conn
+        conn.reconnect(attempts=2, delay=0)
+        conn.autocommit = True
+        with self._cond:
+            self._stats['reconnects'] += 1
+            self._statements.pop(id(conn), None)
+        return conn
+
+    def acquire(self, timeout=None):
+        """Check a connection out of the pool, waiting up to `timeout` seconds"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._created < self.size:
+                    self._created += 1
+                    conn, last_used = None, None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        msg=f"No database connection free after {timeout:.1f}s "
+                            f"({self.size} in use)"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+            self._in_use += 1
+            self._stats['checkouts'] += 1
+            if waited:
+                self._stats['waits'] += 1
+                self._stats['wait_time'] += time.monotonic() - started
+
+        try:
+            if conn is None:
+                return self._connect()
+            return self._ensure_healthy(conn, last_used)
+        except Error:
+            if conn is not None:
+                with self._cond:
+                    self._statements.pop(id(conn), None)
+            self._forget()
+            raise
+
+    def release(self, conn, discard=False):
+        """Return a connection to the pool, or drop it if it is broken"""
+        if not discard:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except Error:
+                discard = True
+
+        if discard:
+            try:
+                conn.close()
+            except Error:
+                pass
+            with self._cond:
+                self._stats['discarded'] += 1
+                self._statements.pop(id(conn), None)
+            self._forget()
+            return
+
+        with self._cond:
+            self._in_use -= 1
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def _forget(self):
+        """Free the slot of a connection that was never returned"""
+        with self._cond:
+            self._in_use -= 1
+            self._created -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Context manager that checks a connection out and always returns it"""
+        conn = self.acquire(timeout)
+        discard = False
+        try:
+            yield conn
+        except CONNECTION_ERRORS:
+            discard = True
+            raise
+        finally:
+            self.release(conn, discard=discard)
+
+    def statements(self, conn):
+        """The prepared-statement cache of a connection checked out of this pool"""
+        with self._cond:
+            cache = self._statements.get(id(conn))
+            if cache is None:
+                cache = self._statements[id(conn)] = StatementCache(conn)
+        return cache
+
+    def statement_stats(self):
+        """Prepared statements held and statement cache hits / misses over every connection"""
+        with self._cond:
+            caches = [cache.stats() for cache in self._statements.values()]
+        stats = {key: sum(cache[key] for cache in caches) for key in ('prepared', 'hits', 'misses', 'evictions')}
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def kill_query(self, connection_id):
+        """Stop the statement running on one of this pool's connections (KILL QUERY from a fresh connection)"""
+        # Not from the pool: a runaway statement is often exactly why no pooled connection is free
+        conn = mysql.connector.connect(**self.config)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"KILL QUERY {int(connection_id)}")
+            cursor.close()
+        finally:
+            conn.close()
+
+    def metrics(self):
+        """Snapshot of pool usage counters"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update(
+                size=self.size,
+                created=self._created,
+                in_use=self._in_use,
+                idle=len(self._idle),
+            )
+        stats['avg_wait'] = stats['wait_time'] / stats['waits'] if stats['waits'] else 0.0
+        return stats
+
+    def close(self):
+        """Close every idle connection"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            for conn, _ in idle:
+                self._statements.pop(id(conn), None)
+        for conn, _ in idle:
+            try:
+                conn.close()
+            except Error:
+                pass
@@ -0,0 +1,214 @@
+"""
+Read/write splitting: writes go to the primary pool, reads to the least busy replica that is caught up enough
+"""
+
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from mysql.connector import Error
+
+from db_pool import DB_CONFIG, ConnectionPool
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+# Comma-separated host[:port] list; replicas use the primary's user, password and database
+REPLICAS = os.environ.get('F1_DB_REPLICAS', '')
+REPLICA_POOL_SIZE = int(os.environ.get('F1_DB_REPLICA_POOL_SIZE', 10))
+# Replicas further behind than this (seconds) get no reads at all
+MAX_REPLICA_LAG = float(os.environ.get('F1_DB_MAX_REPLICA_LAG', 5))
+# How often each replica's lag is measured; between checks the last measurement is trusted
+LAG_CHECK_INTERVAL = float(os.environ.get('F1_DB_LAG_CHECK_INTERVAL', 1))
+
+# MySQL 8.0.22+ first, then the pre-8.0.22 spelling
+LAG_QUERIES = (
+    ("SHOW REPLICA STATUS", 'Seconds_Behind_Source'),
+    ("SHOW SLAVE STATUS", 'Seconds_Behind_Master'),
+)
+
+# Writes older than this can no longer pin anyone to the primary, so they are forgotten
+SESSION_WRITE_HORIZON = 300
+
+
+def replica_configs(spec=REPLICAS, base=None):
+    """Connection configs for a 'host[:port],host[:port]' replica list"""
+    configs = []
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        host, _, port = entry.partition(':')
+        config = dict(base or DB_CONFIG)
+        config.update(host=host, port=int(port) if port else 3306)
+        configs.append(config)
+    return configs
+
+
+class Replica:
+    """One replica's pool plus its last lag measurement"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.name = f"{pool.config['host']}:{pool.config['port']}"
+        self.lag = None
+        self.healthy = False
+        self.checked_at = None
+        self.applied_through = 0.0  # everything the primary committed before this (time.time()) is here
+        self.reads = 0
+        self.last_error = None
+
+    def check(self):
+        """Measure replication lag; a replica that is down or not applying gets no reads"""
+        checked_at = time.time()
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                row, column = None, None
+                for query, column in LAG_QUERIES:
+                    try:
+                        cursor.execute(query)
+                    except Error:
+                        continue
+                    row = cursor.fetchone()
+                    break
+                else:
+                    raise Error(msg="Neither SHOW REPLICA STATUS nor SHOW SLAVE STATUS is allowed")
+                cursor.close()
+        except Error as e:
+            self.healthy, self.lag, self.last_error = False, None, str(e)
+        else:
+            if row is None:
+                # Not replicating from anything (e.g. a static copy): treat as current
+                self.lag = 0.0
+            else:
+                self.lag = row[column]
+            self.healthy = self.lag is not None and self.lag <= MAX_REPLICA_LAG
+            self.last_error = None if self.lag is not None else "Replication SQL thread is not running"
+            if self.lag is not None:
+                # Seconds_Behind_Source is whole seconds, so allow one more
+                self.applied_through = checked_at - float(self.lag) - 1
+        self.checked_at = time.monotonic()
+
+
+class QueryRouter:
+    """Routes each connection checkout to the primary or a replica
+
+    Reads name a `session` (any hashable token) to get read-your-writes: after
+    that session writes, its reads stay on the primary until a replica has
+    provably applied the write. Reads with no session get the same guarantee
+    against the latest write from any session, which is what results shared
+    across sessions (caches, engines) need.
+    """
+
+    def __init__(self, primary, replicas=None, check_interval=LAG_CHECK_INTERVAL):
+        self.primary = primary
+        if replicas is None:
+            replicas = [ConnectionPool(config, size=REPLICA_POOL_SIZE) for config in replica_configs()]
+        self.replicas = [Replica(pool) for pool in replicas]
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checking = set()
+        self._round_robin = itertools.count()
+        self._session_writes = {}
+        self._last_write = 0.0
+        self.primary_reads = 0
+        self.pinned_reads = 0
+
+    def wrote(self, session=None):
+        """Record a committed write, pinning `session`'s reads to the primary for now"""
+        now = time.time()
+        with self._lock:
+            self._last_write = now
+            if session is not None:
+                self._session_writes[session] = now
+            if len(self._session_writes) > 1000:
+                horizon = now - SESSION_WRITE_HORIZON
+                self._session_writes = {s: t for s, t in self._session_writes.items() if t > horizon}
+
+    def _refresh_lag(self):
+        """Re-measure every replica whose last check is older than the check interval"""
+        now = time.monotonic()
+        with self._lock:
+            due = [replica for replica in self.replicas
+                   if replica not in self._checking
+                   and (replica.checked_at is None or now - replica.checked_at >= self._check_interval)]
+            self._checking.update(due)
+        for replica in due:
+            try:
+                replica.check()
+            finally:
+                with self._lock:
+                    self._checking.discard(replica)
+
+    def _route(self, session):
+        """The Replica to read from, or None for the primary"""
+        if not self.replicas:
+            return None
+        self._refresh_lag()
+        with self._lock:
+            since = self._session_writes.get(session, 0.0) if session is not None else self._last_write
+            candidates = [replica for replica in self.replicas if replica.healthy]
+            current = [replica for replica in candidates if replica.applied_through >= since]
+            if not current:
+                if candidates:
+                    self.pinned_reads += 1
+                self.primary_reads += 1
+                return None
+            # Least busy first; the rotating offset spreads ties
+            start = next(self._round_robin)
+            current = current[start % len(current):] + current[:start % len(current)]
+            replica = min(current, key=lambda r: r.pool.metrics()['in_use'])
+            replica.reads += 1
+            return replica
+
+    def pool_for(self, read=False, session=None):
+        """The primary pool, or for `read` a replica pool when one is current enough"""
+        replica = self._route(session) if read else None
+        return replica.pool if replica is not None else self.primary
+
+    @contextmanager
+    def connection(self, read=False, session=None):
+        """Check out a primary connection, or for `read` a replica connection when one is current enough"""
+        with self.pool_for(read, session).connection() as conn:
+            yield conn
+
+    def reader(self, session=None):
+        """Pool-like object whose connections are routed as reads (for engines that take a pool)"""
+        return _Reader(self, session)
+
+    def statement_stats(self):
+        """Prepared-statement cache counters summed over the primary and every replica pool"""
+        pools = [self.primary] + [replica.pool for replica in self.replicas]
+        per_pool = [pool.statement_stats() for pool in pools]
+        stats = {key: sum(p[key] for p in per_pool) for key in ('prepared', 'hits', 'misses', 'evictions')}
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def metrics(self):
+        """Routing counters plus per-replica lag and read counts"""
+        with self._lock:
+            return {
+                'primary_reads': self.primary_reads,
+                'pinned_reads': self.pinned_reads,
+                'replicas': [
+                    {
+                        'name': replica.name,
+                        'healthy': replica.healthy,
+                        'lag': replica.lag,
+                        'reads': replica.reads,
+                        'in_use': replica.pool.metrics()['in_use'],
+                        'error': replica.last_error,
+                    }
+                    for replica in self.replicas
+                ],
+            }
+
+
+class _Reader:
+    def __init__(self, router, session):
+        self._router = router
+        self._session = session
+
+    def connection(self):
+        return self._router.connection(read=True, session=self._session)
@@ -0,0 +1,107 @@
+"""
+In-process ID <-> name maps for the small lookup tables (drivers, teams, races, statuses)
+"""
+
+import os
+import threading
+import time
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+# How often DIMENSION_VERSION is polled; between polls the maps are served with no round trip
+VERSION_CHECK_INTERVAL = float(os.environ.get('F1_DIMENSION_CHECK_INTERVAL', 5))
+
+# Display-ordered (ID, Name) query per dimension table
+DIMENSIONS = {
+    'DRIVER': "SELECT Driver_ID AS ID, CONCAT(First_Name, ' ', Last_Name) AS Name FROM DRIVER ORDER BY First_Name, Last_Name",
+    'TEAM': "SELECT Team_ID AS ID, Team_Name AS Name FROM TEAM ORDER BY Team_Name",
+    'RACE': "SELECT Race_ID AS ID, CONCAT(Race_Name, ' - ', Year) AS Name FROM RACE ORDER BY Race_ID DESC",
+    'STATUS': "SELECT Status_ID AS ID, Status_description AS Name FROM STATUS ORDER BY Status_ID",
+}
+
+VERSION_QUERY = "SELECT Table_Name, Version FROM DIMENSION_VERSION"
+
+
+class Dimension:
+    """Bidirectional map for one table: `ids` is name -> ID in display order, `names` is ID -> name"""
+
+    __slots__ = ('table', 'version', 'ids', 'names')
+
+    def __init__(self, table, version, rows):
+        self.table = table
+        self.version = version
+        self.ids = {}
+        self.names = {}
+        for row in rows:
+            name = row['Name'] if row['Name'] is not None else f"#{row['ID']}"
+            if name in self.ids:
+                name = f"{name} (#{row['ID']})"  # two drivers can share a name
+            self.ids[name] = row['ID']
+            self.names[row['ID']] = name
+
+    def options(self):
+        """Names in display order, for selectboxes"""
+        return list(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class DimensionCache:
+    """Thread-safe dimension maps, reloaded only when a table's DIMENSION_VERSION counter moves
+
+    `load(query)` runs a query and returns a list of dict rows, or None on failure
+    (a failed reload keeps serving the previous map).
+    """
+
+    def __init__(self, load, check_interval=VERSION_CHECK_INTERVAL):
+        self._load = load
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._dimensions = {}
+        self._versions = {}
+        self._checked_at = None
+        self._stale = set()
+        self.loads = 0
+        self.version_checks = 0
+
+    def get(self, table):
+        """Current Dimension for `table` (one of DIMENSIONS)"""
+        with self._lock:
+            self._check_versions()
+            dimension = self._dimensions.get(table)
+            version = self._versions.get(table, 0)
+            if dimension is None or dimension.version != version or table in self._stale:
+                rows = self._load(DIMENSIONS[table])
+                if rows is not None:
+                    dimension = self._dimensions[table] = Dimension(table, version, rows)
+                    self._stale.discard(table)
+                    self.loads += 1
+                elif dimension is None:
+                    return Dimension(table, None, [])
+            return dimension
+
+    def _check_versions(self):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self._check_interval and not self._stale:
+            return
+        rows = self._load(VERSION_QUERY)
+        if rows is not None:
+            self._versions = {row['Table_Name']: row['Version'] for row in rows}
+            self._checked_at = now
+            self.version_checks += 1
+
+    def invalidate(self, tables=None):
+        """Reload these tables (None = all) on next use, e.g. right after this process wrote them"""
+        with self._lock:
+            loaded = self._dimensions.keys()
+            self._stale.update(loaded if tables is None else loaded & set(tables))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'tables': {table: len(dimension) for table, dimension in self._dimensions.items()},
+                'loads': self.loads,
+                'version_checks': self.version_checks,
+            }
@@ -0,0 +1,232 @@
+"""
+EXPLAIN-based index check for the queries issued by f1_app.py
+
+Copies the f1_db schema (tables, views and the stored functions some queries call)
+into a scratch database, fills it with synthetic history (20x the real record, about
+500k results, by default), then EXPLAINs every query the app runs and fails if
+any of them falls back to a full table scan of a fact table.
+
+Usage:
+    python explain_check.py [--scale 20] [--scratch-db f1_explain] [--keep]
+"""
+
+import argparse
+import re
+import sys
+
+import mysql.connector
+from mysql.connector import Error
+
+from analytics_engine import RESULT_QUERY, WATERMARK_QUERY
+from dashboard_snapshot import SNAPSHOT_QUERY
+from db_pool import DB_CONFIG
+from dimension_cache import DIMENSIONS, VERSION_QUERY
+from f1_data import (
+    ALL_DRIVERS_QUERY, ALL_TEAMS_QUERY, AUDIT_GROUPS_QUERY, AUDIT_PAGE_QUERY, CIRCUIT_STATS_QUERY, DEMO_QUERIES,
+    DRIVER_FUNCTIONS_QUERY, DRIVER_POINTS_QUERY, LINEUP_QUERY, SEASONS_QUERY, TEAM_FUNCTIONS_QUERY,
+    TEAM_NATIONALITY_QUERY, TEAM_RELIABILITY_QUERY, F1Data,
+)
+from standings_engine import SEASON_QUERY
+from synthetic_data import build_database
+
+# Tables that grow with race history - a full scan of these is a regression
+FACT_TABLES = {'RESULT', 'AUDIT_LOG', 'DRIVER_SEASON_STANDINGS', 'TEAM_SEASON_STANDINGS'}
+
+# Full scans smaller than this are ignored (the optimizer is right to skip the index)
+MIN_SCAN_ROWS = 1000
+
+SQL_KEYWORDS = {
+    'ON', 'WHERE', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'JOIN', 'GROUP', 'ORDER',
+    'LIMIT', 'HAVING', 'USING', 'AS', 'UNION',
+}
+
+AUDIT_WINDOW_WHERE, AUDIT_WINDOW_PARAMS = F1Data._audit_where(30)
+AUDIT_FILTERED_WHERE, AUDIT_FILTERED_PARAMS = F1Data._audit_where(
+    None, ('DRIVER',), ('INSERT',), ('2024-06-01 00:00:00', 10**9)
+)
+
+# (name, sql, params) for every statement the app sends, taken from the modules
+# that send them so this list can't drift from the real workload. Bulk copies
+# (exports, mirror syncs) read whole tables by design and are not checked.
+APP_QUERIES = [
+    ("Dashboard: snapshot read", SNAPSHOT_QUERY, ()),
+    ("Standings: seasons", SEASONS_QUERY, ()),
+    ("Standings: season results by round", SEASON_QUERY, (2024,)),
+    ("Standings: team nationalities", TEAM_NATIONALITY_QUERY, ()),
+    ("Drivers: all drivers", ALL_DRIVERS_QUERY, ()),
+    ("Teams: all teams", ALL_TEAMS_QUERY, ()),
+    ("Add Result: lineup", LINEUP_QUERY, ()),
+    ("Functions: driver", DRIVER_FUNCTIONS_QUERY, (1,) * 4),
+    ("Functions: team", TEAM_FUNCTIONS_QUERY, (1,) * 2),
+    ("Dimensions: version check", VERSION_QUERY, ()),
+] + [
+    (f"Dimensions: {table.lower()} map", query, ()) for table, query in DIMENSIONS.items()
+] + [
+    ("Analytics: circuit statistics", CIRCUIT_STATS_QUERY, ()),
+    ("Analytics: DNF analysis", TEAM_RELIABILITY_QUERY, ()),
+    ("Analytics: points distribution", DRIVER_POINTS_QUERY, ()),
+    ("Analytics snapshot: watermark", WATERMARK_QUERY, ()),
+    ("Analytics snapshot: result chunk", RESULT_QUERY, (0, 50_000)),
+] + [
+    (f"Queries: {label.lower()}{suffix}", query, ())
+    for label, queries in DEMO_QUERIES.items()
+    for query, suffix in zip(queries, ('', ' (per-row functions)'))
+    if query is not None
+] + [
+    ("Audit log: counts by table/action", AUDIT_GROUPS_QUERY.format(where=''), ()),
+    ("Audit log: counts in window", AUDIT_GROUPS_QUERY.format(where=AUDIT_WINDOW_WHERE), AUDIT_WINDOW_PARAMS),
+    ("Audit log: first page", AUDIT_PAGE_QUERY.format(where=''), (51,)),
+    ("Audit log: next page, filtered", AUDIT_PAGE_QUERY.format(where=AUDIT_FILTERED_WHERE),
+     AUDIT_FILTERED_PARAMS + (51,)),
+]
+
+# Bodies of the stored procedures and functions the app calls, copied from
+# complete_setup.sql (EXPLAIN can't look inside a CALL)
+ROUTINE_QUERIES = [
+    ("RefreshDashboardSnapshot: result count", "SELECT COUNT(*) FROM RESULT", ()),
+    ("RefreshDashboardSnapshot: top 5 drivers", """
+        SELECT ROW_NUMBER() OVER (ORDER BY SUM(DSS.Points) DESC) AS N,
+               CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver, T.Team_Name,
+               SUM(DSS.Points) AS Points, SUM(DSS.Wins) AS Wins
+        FROM DRIVER_SEASON_STANDINGS DSS
+        JOIN DRIVER D ON DSS.Driver_ID = D.Driver_ID
+        JOIN TEAM T ON DSS.Team_ID = T.Team_ID
+        GROUP BY D.Driver_ID, D.First_Name, D.Last_Name, T.Team_Name
+        ORDER BY Points DESC LIMIT 5
+    """, ()),
+    ("RefreshDashboardSnapshot: top 5 teams", """
+        SELECT ROW_NUMBER() OVER (ORDER BY SUM(TSS.Points) DESC) AS N,
+               T.Team_Name, SUM(TSS.Points) AS Points, SUM(TSS.Wins) AS Wins
+        FROM TEAM_SEASON_STANDINGS TSS
+        JOIN TEAM T ON TSS.Team_ID = T.Team_ID
+        GROUP BY T.Team_ID, T.Team_Name
+        ORDER BY Points DESC LIMIT 5
+    """, ()),
+    ("RefreshDashboardSnapshot: recent races", """
+        SELECT ROW_NUMBER() OVER (ORDER BY RA.Race_ID DESC) AS N,
+               RA.Race_Name, RA.Venue, C.Circuit_Name, RA.Year,
+               CONCAT(D.First_Name, ' ', D.Last_Name) AS Winner
+        FROM RACE RA
+        JOIN CIRCUIT C ON RA.Circuit_ID = C.Circuit_ID
+        LEFT JOIN RESULT RES ON RA.Race_ID = RES.Race_ID AND RES.Position = 1
+        LEFT JOIN DRIVER D ON RES.Driver_ID = D.Driver_ID
+        ORDER BY RA.Race_ID DESC LIMIT 5
+    """, ()),
+    ("GetDriverStats", """
+        SELECT CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name, D.DOB,
+               TIMESTAMPDIFF(YEAR, D.DOB, CURDATE()) AS Age, T.Team_Name AS Current_Team,
+               COUNT(R.Result_ID), SUM(R.Points),
+               SUM(CASE WHEN R.Position = 1 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN R.Position <= 3 THEN 1 ELSE 0 END),
+               MIN(R.Position), ROUND(AVG(R.Position), 2)
+        FROM DRIVER D
+        LEFT JOIN TEAM T ON D.Team_ID = T.Team_ID
+        LEFT JOIN RESULT R ON D.Driver_ID = R.Driver_ID
+        WHERE D.Driver_ID = %s
+        GROUP BY D.Driver_ID, D.First_Name, D.Last_Name, D.DOB, T.Team_Name
+    """, (1,)),
+    ("GetTeamPerformance", """
+        SELECT T.Team_Name, T.Nationality, COUNT(DISTINCT R.Race_ID), SUM(R.Points),
+               SUM(CASE WHEN R.Position = 1 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN R.Position <= 3 THEN 1 ELSE 0 END),
+               COUNT(DISTINCT R.Driver_ID)
+        FROM TEAM T
+        LEFT JOIN RESULT R ON T.Team_ID = R.Team_ID
+        WHERE T.Team_ID = %s
+        GROUP BY T.Team_ID, T.Team_Name, T.Nationality
+    """, (1,)),
+    ("GetRaceResults", """
+        SELECT RES.Position, CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
+               T.Team_Name, RES.Grid AS Starting_Position, RES.Points, S.Status_description AS Status
+        FROM RESULT RES
+        JOIN DRIVER D ON RES.Driver_ID = D.Driver_ID
+        JOIN TEAM T ON RES.Team_ID = T.Team_ID
+        JOIN STATUS S ON RES.Status_ID = S.Status_ID
+        WHERE RES.Race_ID = %s
+        ORDER BY CASE WHEN RES.Position IS NULL THEN 1 ELSE 0 END, RES.Position
+    """, (1,)),
+    ("GetChampionshipStandings", """
+        SELECT CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name, T.Team_Name,
+               DSS.Points AS Total_Points, DSS.Wins, DSS.Races
+        FROM DRIVER_SEASON_STANDINGS DSS
+        JOIN DRIVER D ON DSS.Driver_ID = D.Driver_ID
+        JOIN TEAM T ON DSS.Team_ID = T.Team_ID
+        WHERE DSS.Year = %s
+        ORDER BY Total_Points DESC
+    """, (2024,)),
+    ("GetDriverTotalPoints", "SELECT COALESCE(SUM(Points), 0) FROM RESULT WHERE Driver_ID = %s", (1,)),
+    ("CountDriverWins", "SELECT COUNT(*) FROM RESULT WHERE Driver_ID = %s AND Position = 1", (1,)),
+    ("GetDriverAge", "SELECT DOB FROM DRIVER WHERE Driver_ID = %s", (1,)),
+    ("GetBestFinish", "SELECT MIN(Position) FROM RESULT WHERE Driver_ID = %s AND Position IS NOT NULL", (1,)),
+    ("GetTeamTotalPoints", "SELECT COALESCE(SUM(Points), 0) FROM RESULT WHERE Team_ID = %s", (1,)),
+    ("CountTeamWins", "SELECT COUNT(*) FROM RESULT WHERE Team_ID = %s AND Position = 1", (1,)),
+]
+
+def _aliases(query):
+    """Map each table alias in a query to its table name"""
+    aliases = {}
+    for table, alias in re.findall(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', query, re.I):
+        aliases[table.upper()] = table.upper()
+        if alias and alias.upper() not in SQL_KEYWORDS:
+            aliases[alias.upper()] = table.upper()
+    return aliases
+
+
+def check_queries(conn, queries=APP_QUERIES + ROUTINE_QUERIES):
+    """EXPLAIN each query; return a list of (name, table, rows) full scans of fact tables"""
+    failures = []
+    cursor = conn.cursor(dictionary=True)
+    for name, query, params in queries:
+        cursor.execute("EXPLAIN " + query, params)
+        plan = cursor.fetchall()
+        aliases = _aliases(query)
+        for step in plan:
+            alias = (step.get('table') or '').upper()
+            table = aliases.get(alias, alias)
+            scan = step.get('type')
+            rows = step.get('rows') or 0
+            print(f"  {name:<40} {alias:<8} {scan or '-':<7} {step.get('key') or '-':<32} rows={rows}")
+            if scan == 'ALL' and table in FACT_TABLES and rows >= MIN_SCAN_ROWS:
+                failures.append((name, table, rows))
+    cursor.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if any app query full-scans a fact table")
+    parser.add_argument('--scale', type=int, default=20, help="multiple of the real 1950-2024 history")
+    parser.add_argument('--scratch-db', default='f1_explain', help="database to build the dataset in")
+    parser.add_argument('--reuse', action='store_true', help="skip rebuilding the scratch database")
+    parser.add_argument('--keep', action='store_true', help="don't drop the scratch database afterwards")
+    args = parser.parse_args()
+
+    source_db = DB_CONFIG['database']
+    if args.scratch_db == source_db:
+        parser.error("--scratch-db must not be the application database")
+
+    config = {k: v for k, v in DB_CONFIG.items() if k != 'database'}
+    try:
+        conn = mysql.connector.connect(**config)
+        if not args.reuse:
+            print(f"Building {args.scratch_db} at {args.scale}x history...")
+            build_database(conn, source_db, args.scratch_db, args.scale)
+        conn.database = args.scratch_db
+        failures = check_queries(conn)
+        if not args.keep:
+            conn.cursor().execute(f"DROP DATABASE IF EXISTS `{args.scratch_db}`")
+        conn.close()
+    except Error as e:
+        print(f"❌ {e}")
+        return 2
+
+    if failures:
+        print("\n❌ Full table scans found:")
+        for name, table, rows in failures:
+            print(f"  {name}: {table} (~{rows:,} rows)")
+        return 1
+    print("\n✅ No query falls back to a full scan of a fact table")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
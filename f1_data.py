@@ -0,0 +1,806 @@
+"""
+Headless data access for the F1 Database Management System
+
+Every read and write the app performs is a method on F1Data, carrying its own
+result caching, write invalidation and profiling. Nothing here imports
+Streamlit: failures go to a `report(message)` callback and come back as None
+or an empty DataFrame, so the same calls work from pages, batch jobs and
+benchmarks alike.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+from mysql.connector import Error
+
+from db_pool import ConnectionPool, PoolTimeoutError
+from db_router import QueryRouter
+from query_governor import AdmissionError, QueryGovernor
+from query_cache import (
+    QueryCache, LOOKUP_TTL, PROCEDURE_TABLES, PROCEDURE_WRITES, is_read_sql, normalize_sql, tables_for_sql
+)
+from columnar_fetch import fetch_frame
+from query_profiler import QueryProfiler, digest_probe, procedure_statement
+from query_fanout import QueryFanout
+from dimension_cache import DimensionCache
+from standings_engine import StandingsEngine, RACE_WRITE_PROCEDURES
+from analytics_engine import AnalyticsEngine
+from analytics_mirror import ParquetMirror, MirrorError
+from data_export import AUDIT_LOG_EXPORT, EXPORTS, ExportError, export_path, stream_export
+from dashboard_snapshot import (
+    REFRESH_INTERVAL, SNAPSHOT_QUERY, SNAPSHOT_TABLES, SnapshotRefresher, parse_snapshot, refresh_snapshot
+)
+
+# =============================================================
+# QUERIES
+# =============================================================
+SEASONS_QUERY = "SELECT DISTINCT Year FROM RACE WHERE Year IS NOT NULL ORDER BY Year DESC"
+
+TEAM_NATIONALITY_QUERY = "SELECT Team_ID, Nationality FROM TEAM"
+
+ALL_DRIVERS_QUERY = """
+SELECT
+    D.Driver_ID,
+    CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
+    D.DOB,
+    TIMESTAMPDIFF(YEAR, D.DOB, CURDATE()) AS Age,
+    T.Team_Name
+FROM DRIVER D
+LEFT JOIN TEAM T ON D.Team_ID = T.Team_ID
+ORDER BY D.Driver_ID
+"""
+
+ALL_TEAMS_QUERY = "SELECT * FROM TEAM ORDER BY Team_Name"
+
+# Starting grid for a full classification: the entry list of the latest race with results, in team order
+LINEUP_QUERY = """
+SELECT RES.Driver_ID, RES.Team_ID
+FROM RESULT RES
+WHERE RES.Race_ID = (
+    SELECT RA.Race_ID
+    FROM RACE RA
+    WHERE EXISTS (SELECT 1 FROM RESULT R WHERE R.Race_ID = RA.Race_ID)
+    ORDER BY RA.Year DESC, RA.Round DESC, RA.Race_ID DESC
+    LIMIT 1
+)
+ORDER BY RES.Team_ID, RES.Driver_ID
+"""
+
+DRIVER_FUNCTIONS_QUERY = """
+SELECT
+    GetDriverTotalPoints(%s) AS Total_Points,
+    CountDriverWins(%s) AS Wins,
+    GetDriverAge(%s) AS Age,
+    GetBestFinish(%s) AS Best_Finish
+"""
+
+TEAM_FUNCTIONS_QUERY = """
+SELECT
+    GetTeamTotalPoints(%s) AS Total_Points,
+    CountTeamWins(%s) AS Wins
+"""
+
+CIRCUIT_STATS_QUERY = """
+SELECT
+    C.Circuit_Name,
+    C.Location,
+    COUNT(DISTINCT RA.Race_ID) AS Races_Held,
+    ROUND(AVG(RES.Points), 2) AS Avg_Points
+FROM CIRCUIT C
+JOIN RACE RA ON C.Circuit_ID = RA.Circuit_ID
+LEFT JOIN RESULT RES ON RA.Race_ID = RES.Race_ID
+GROUP BY C.Circuit_ID, C.Circuit_Name, C.Location
+ORDER BY Races_Held DESC
+"""
+
+TEAM_RELIABILITY_QUERY = """
+SELECT
+    T.Team_Name,
+    COUNT(RES.Result_ID) AS Total_Results,
+    SUM(CASE WHEN S.Status_description = 'Finished' THEN 1 ELSE 0 END) AS Finished,
+    SUM(CASE WHEN S.Status_description != 'Finished' THEN 1 ELSE 0 END) AS DNF,
+    ROUND(
+        (SUM(CASE WHEN S.Status_description = 'Finished' THEN 1 ELSE 0 END) * 100.0) / COUNT(RES.Result_ID),
+        2
+    ) AS Reliability_Percentage
+FROM TEAM T
+JOIN RESULT RES ON T.Team_ID = RES.Team_ID
+JOIN STATUS S ON RES.Status_ID = S.Status_ID
+GROUP BY T.Team_ID, T.Team_Name
+ORDER BY Reliability_Percentage DESC
+"""
+
+DRIVER_POINTS_QUERY = """
+SELECT
+    CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
+    SUM(DSS.Points) AS Total_Points
+FROM DRIVER D
+JOIN DRIVER_SEASON_STANDINGS DSS ON D.Driver_ID = DSS.Driver_ID
+GROUP BY D.Driver_ID, D.First_Name, D.Last_Name
+HAVING Total_Points > 0
+ORDER BY Total_Points DESC
+"""
+
+TOP_DRIVERS_QUERY = """
+SELECT
+    CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
+    T.Team_Name,
+    DCT.Total_Points,
+    DCT.Wins,
+    DCT.Best_Finish,
+    DCT.Age
+FROM DRIVER D
+JOIN DRIVER_CAREER_TOTALS DCT ON D.Driver_ID = DCT.Driver_ID
+LEFT JOIN TEAM T ON D.Team_ID = T.Team_ID
+ORDER BY Total_Points DESC, D.Driver_ID
+LIMIT 10
+"""
+
+TOP_DRIVERS_FUNCTIONS_QUERY = """
+SELECT
+    CONCAT(D.First_Name, ' ', D.Last_Name) AS Driver_Name,
+    T.Team_Name,
+    GetDriverTotalPoints(D.Driver_ID) AS Total_Points,
+    CountDriverWins(D.Driver_ID) AS Wins,
+    GetBestFinish(D.Driver_ID) AS Best_Finish,
+    GetDriverAge(D.Driver_ID) AS Age
+FROM DRIVER D
+LEFT JOIN TEAM T ON D.Team_ID = T.Team_ID
+ORDER BY Total_Points DESC, D.Driver_ID
+LIMIT 10
+"""
+
+TEAM_COMPARISON_QUERY = """
+SELECT
+    T.Team_Name,
+    TCT.Total_Points,
+    TCT.Wins,
+    TCT.Different_Drivers
+FROM TEAM T
+JOIN TEAM_CAREER_TOTALS TCT ON T.Team_ID = TCT.Team_ID
+ORDER BY Total_Points DESC, T.Team_ID
+"""
+
+TEAM_COMPARISON_FUNCTIONS_QUERY = """
+SELECT
+    T.Team_Name,
+    GetTeamTotalPoints(T.Team_ID) AS Total_Points,
+    CountTeamWins(T.Team_ID) AS Wins,
+    COUNT(DISTINCT R.Driver_ID) AS Different_Drivers
+FROM TEAM T
+LEFT JOIN RESULT R ON T.Team_ID = R.Team_ID
+GROUP BY T.Team_ID, T.Team_Name
+ORDER BY Total_Points DESC, T.Team_ID
+"""
+
+RACE_WINNERS_QUERY = """
+SELECT
+    RA.Race_Name,
+    RA.Year,
+    CONCAT(D.First_Name, ' ', D.Last_Name) AS Winner,
+    T.Team_Name,
+    RES.Points
+FROM RACE RA
+JOIN RESULT RES ON RA.Race_ID = RES.Race_ID AND RES.Position = 1
+JOIN DRIVER D ON RES.Driver_ID = D.Driver_ID
+JOIN TEAM T ON RES.Team_ID = T.Team_ID
+ORDER BY RA.Race_ID DESC
+"""
+
+CIRCUIT_RACES_QUERY = """
+SELECT
+    C.Circuit_Name,
+    C.Location,
+    COUNT(DISTINCT RA.Race_ID) AS Races_Held
+FROM CIRCUIT C
+LEFT JOIN RACE RA ON C.Circuit_ID = RA.Circuit_ID
+GROUP BY C.Circuit_ID, C.Circuit_Name, C.Location
+ORDER BY Races_Held DESC
+"""
+
+# A nested query (subquery): drivers outside the set of drivers that have scored points
+DRIVERS_WITHOUT_POINTS_QUERY = """
+SELECT First_Name, Last_Name
+FROM DRIVER
+WHERE Driver_ID NOT IN (
+    -- This is the nested query --
+    SELECT DISTINCT Driver_ID
+    FROM RESULT
+    WHERE Points > 0
+)
+ORDER BY Last_Name
+"""
+
+# Complex Queries demo: (set-based statement, per-row stored function version or None)
+DEMO_QUERIES = {
+    "Top Drivers by Points": (TOP_DRIVERS_QUERY, TOP_DRIVERS_FUNCTIONS_QUERY),
+    "Team Performance Comparison": (TEAM_COMPARISON_QUERY, TEAM_COMPARISON_FUNCTIONS_QUERY),
+    "Race Winners Summary": (RACE_WINNERS_QUERY, None),
+    "Circuit Statistics": (CIRCUIT_RACES_QUERY, None),
+    "Drivers with No Points (Nested Query)": (DRIVERS_WITHOUT_POINTS_QUERY, None),
+}
+
+# AUDIT_LOG is partitioned by month on Changed_At, so a bounded window only
+# touches the partitions it overlaps
+AUDIT_WINDOW_CONDITION = "Changed_At >= NOW() - INTERVAL %s DAY"
+
+# Entry counts per (table, action): a covering scan of idx_audit_table_action
+AUDIT_GROUPS_QUERY = """
+SELECT Table_Name, Action, COUNT(*) AS Entries
+FROM AUDIT_LOG
+{where}
+GROUP BY Table_Name, Action
+"""
+
+AUDIT_PAGE_QUERY = """
+SELECT
+    Log_ID,
+    Table_Name,
+    Action,
+    Record_ID,
+    Old_Value,
+    New_Value,
+    Changed_By,
+    Changed_At
+FROM AUDIT_LOG
+{where}
+ORDER BY Changed_At DESC, Log_ID DESC
+LIMIT %s
+"""
+
+AUDIT_PARTITIONS_QUERY = """
+SELECT
+    PARTITION_NAME AS Partition_Name,
+    IF(PARTITION_DESCRIPTION = 'MAXVALUE', NULL,
+       FROM_UNIXTIME(PARTITION_DESCRIPTION)) AS Ends_Before,
+    TABLE_ROWS AS Approx_Rows,
+    ROUND((DATA_LENGTH + INDEX_LENGTH) / 1024 / 1024, 2) AS Size_MB
+FROM information_schema.PARTITIONS
+WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'AUDIT_LOG'
+ORDER BY PARTITION_ORDINAL_POSITION
+"""
+
+SERVER_DIGESTS_QUERY = """
+SELECT
+    DIGEST,
+    DIGEST_TEXT,
+    COUNT_STAR AS Executions,
+    ROUND(AVG_TIMER_WAIT / 1e9, 2) AS Avg_ms,
+    ROUND(MAX_TIMER_WAIT / 1e9, 2) AS Max_ms,
+    SUM_ROWS_EXAMINED AS Rows_Examined,
+    SUM_ROWS_SENT AS Rows_Sent,
+    SUM_NO_INDEX_USED AS No_Index_Used
+FROM performance_schema.events_statements_summary_by_digest
+WHERE SCHEMA_NAME = DATABASE()
+ORDER BY SUM_TIMER_WAIT DESC
+LIMIT 25
+"""
+
+STATEMENT_DIGEST_QUERY = "SELECT STATEMENT_DIGEST(%s) AS Digest"
+
+
+def _print_error(message):
+    print(message, file=sys.stderr)
+
+
+def _dtype_key(dtypes):
+    return tuple(sorted((dtypes or {}).items()))
+
+
+class F1Data:
+    """Every query and write the app issues, over one pool, result cache, profiler and set of engines
+
+    Reads are routed to replicas by `router` (see db_router; by default the
+    F1_DB_REPLICAS list, or none). Uncached reads are consistent with the
+    current thread's session (set_session), everything shared across sessions
+    with the latest write. `report(message)` is called with a one-line description of each failure
+    (default: print to stderr), `notify(message)` when a heavy query has to queue for a
+    slot (see query_governor). `worker_context()`, if given, runs on the calling
+    thread of gather() and returns a callable that carries its per-thread state
+    (e.g. a UI context) onto the fan-out workers.
+    """
+
+    def __init__(self, pool=None, cache=None, profiler=None, report=None, worker_context=None, router=None,
+                 governor=None, notify=None):
+        self.pool = pool if pool is not None else ConnectionPool()
+        self.router = router if router is not None else QueryRouter(self.pool)
+        self.governor = governor if governor is not None else QueryGovernor()
+        self.cache = cache if cache is not None else QueryCache()
+        self.profiler = profiler if profiler is not None else QueryProfiler()
+        self.fanout = QueryFanout()
+        self.dimensions = DimensionCache(lambda query: self._run_query(query))
+        self.standings = StandingsEngine(self._run_frame)
+        self.analytics = AnalyticsEngine(self.router.reader())
+        self.mirror = ParquetMirror()
+        self.snapshot_refresher = SnapshotRefresher(self.pool)
+        self._report = report or _print_error
+        self._notify = notify or _print_error
+        self._worker_context = worker_context
+        self._local = threading.local()
+
+    def set_session(self, session):
+        """Name the session the current thread works for, for read-your-writes routing"""
+        self._local.session = session
+
+    def current_session(self):
+        return getattr(self._local, 'session', None)
+
+    # =============================================================
+    # RUNNERS
+    # =============================================================
+    @contextmanager
+    def _checkout(self, read, session, workload):
+        """Admit `workload`, then check out a routed (pool, connection) watched against the workload's budget"""
+        with self.governor.admit(workload, self._notify):
+            pool = self.router.pool_for(read, session)
+            with pool.connection() as conn, self.governor.watch(workload, pool, conn):
+                yield pool, conn
+
+    def _failed(self, statement, start, error, workload, what):
+        """Report a failed statement (cancellations and rejections in their own words)"""
+        if isinstance(error, AdmissionError):
+            self._report(str(error))
+            return
+        if isinstance(error, PoolTimeoutError):
+            self._report(f"Database busy: {error}")
+            return
+        self.profiler.record(statement, time.perf_counter() - start, error=True)
+        self._report(self.governor.explain(error, workload) or f"{what} failed: {error}")
+
+    def _run_query(self, query, params=None, fetch=True, session=None, workload=None):
+        """Execute SQL query as a prepared statement (reads on a replica current for `session`)"""
+        statement = normalize_sql(query)
+        read = fetch and is_read_sql(query)
+        workload = workload or ('lookup' if read else 'write')
+        start = time.perf_counter()
+        try:
+            with self._checkout(read, session, workload) as (pool, conn):
+                cursor = pool.statements(conn).execute(self.governor.prepare(query, workload), params or ())
+
+                if fetch:
+                    fetch_start = time.perf_counter()
+                    names = [column[0] for column in cursor.description]
+                    result = [dict(zip(names, row)) for row in cursor.fetchall()]
+                    end = time.perf_counter()
+                    self.profiler.record(statement, end - start, end - fetch_start, len(result))
+                    return result
+                else:
+                    conn.commit()
+                    self.profiler.record(statement, time.perf_counter() - start)
+                    return True
+        except Error as e:
+            self._failed(statement, start, e, workload, "Query")
+            return None
+
+    def _run_procedure(self, proc_name, params=(), session=None, workload=None):
+        """Call stored procedure on a pooled connection (read-only ones on a replica current for `session`)"""
+        statement = procedure_statement(proc_name, params)
+        read = proc_name in PROCEDURE_TABLES
+        workload = workload or ('lookup' if read else 'write')
+        start = time.perf_counter()
+        try:
+            with self._checkout(read, session, workload) as (_, conn):
+                cursor = conn.cursor(dictionary=True)
+                cursor.callproc(proc_name, params)
+
+                fetch_start = time.perf_counter()
+                results = []
+                for result in cursor.stored_results():
+                    results.extend(result.fetchall())
+                end = time.perf_counter()
+
+                cursor.close()
+                self.profiler.record(statement, end - start, end - fetch_start, len(results))
+                return results
+        except Error as e:
+            self._failed(statement, start, e, workload, "Procedure")
+            return None
+
+    def _run_frame(self, query, params=None, dtypes=None, session=None, workload=None):
+        """Execute SQL query as a prepared statement, fetching straight into a typed DataFrame"""
+        statement = normalize_sql(query)
+        read = is_read_sql(query)
+        workload = workload or ('lookup' if read else 'write')
+        start = time.perf_counter()
+        try:
+            with self._checkout(read, session, workload) as (pool, conn):
+                cursor = pool.statements(conn).execute(self.governor.prepare(query, workload), params or ())
+
+                timings = {'fetch': 0.0, 'convert': 0.0}
+                df = fetch_frame(cursor, dtypes, timings=timings)
+                self.profiler.record(statement, time.perf_counter() - start, timings['fetch'], len(df))
+                self.profiler.record_convert(statement, timings['convert'])
+                return df
+        except Error as e:
+            self._failed(statement, start, e, workload, "Query")
+            return None
+
+    def _run_procedure_frame(self, proc_name, params=(), dtypes=None, session=None, workload=None):
+        """Call stored procedure on a pooled connection, fetching its result set into a typed DataFrame"""
+        statement = procedure_statement(proc_name, params)
+        read = proc_name in PROCEDURE_TABLES
+        workload = workload or ('lookup' if read else 'write')
+        start = time.perf_counter()
+        try:
+            with self._checkout(read, session, workload) as (_, conn):
+                cursor = conn.cursor()
+                cursor.callproc(proc_name, params)
+
+                timings = {'fetch': 0.0, 'convert': 0.0}
+                frames = [fetch_frame(result, dtypes, timings=timings) for result in cursor.stored_results()]
+                cursor.close()
+
+                df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else (frames[0] if frames else pd.DataFrame())
+                self.profiler.record(statement, time.perf_counter() - start, timings['fetch'], len(df))
+                self.profiler.record_convert(statement, timings['convert'])
+                return df
+        except Error as e:
+            self._failed(statement, start, e, workload, "Procedure")
+            return None
+
+    def _after_write(self, tables, race_id=None):
+        """Invalidate cached reads of written tables (None = everything) and refresh the dashboard snapshot"""
+        # First, so reloads of what is invalidated below can't come from a replica that lacks the write
+        self.router.wrote(self.current_session())
+        if tables is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(tables)
+        self.dimensions.invalidate(tables)
+        self.standings.invalidate(tables, race_id)
+        self.analytics.invalidate()
+        if tables is None or SNAPSHOT_TABLES.intersection(tables):
+            self.snapshot_refresher.request()
+
+    def invalidate(self):
+        """Drop every cached read, lookup map and season, e.g. after changes made outside the app"""
+        self.cache.clear()
+        self.dimensions.invalidate()
+        self.standings.invalidate()
+
+    # =============================================================
+    # GENERIC ACCESS
+    # =============================================================
+    def execute_query(self, query, params=None, fetch=True, ttl=None, workload=None):
+        """Execute SQL query, serving reads from the result cache (ttl=0 bypasses it)
+
+        `workload` picks the budget and admission class (see query_governor);
+        by default reads are lookups and everything else a write.
+        """
+        tables = tables_for_sql(query)
+
+        if not fetch:
+            result = self._run_query(query, params, fetch=False)
+            if result:
+                self._after_write(tables)
+            return result
+
+        if ttl == 0:
+            return self._run_query(query, params, session=self.current_session(), workload=workload)
+        return self.cache.get_or_load(self.cache.key(query, params), tables,
+                                      lambda: self._run_query(query, params, workload=workload), ttl)
+
+    def call_procedure(self, proc_name, params=(), ttl=None, workload=None):
+        """Call stored procedure, caching read-only ones and invalidating what writes touch"""
+        if proc_name in PROCEDURE_WRITES:
+            result = self._run_procedure(proc_name, params)
+            if result is not None:
+                # Result writes name their race, so only that season's standings are recomputed
+                race_id = params[0] if proc_name in RACE_WRITE_PROCEDURES else None
+                self._after_write(PROCEDURE_WRITES[proc_name], race_id)
+            return result
+
+        if proc_name not in PROCEDURE_TABLES:
+            # Unknown procedure - can't tell what it touches, so play safe
+            result = self._run_procedure(proc_name, params)
+            self._after_write(None)
+            return result
+
+        if ttl == 0:
+            return self._run_procedure(proc_name, params, session=self.current_session(), workload=workload)
+        return self.cache.get_or_load(
+            self.cache.procedure_key(proc_name, params),
+            PROCEDURE_TABLES[proc_name],
+            lambda: self._run_procedure(proc_name, params, workload=workload),
+            ttl,
+        )
+
+    def query_df(self, query, params=None, ttl=None, dtypes=None, workload=None):
+        """Execute SQL query into a typed DataFrame (see columnar_fetch for dtype hints)"""
+        if ttl == 0:
+            df = self._run_frame(query, params, dtypes, session=self.current_session(), workload=workload)
+        else:
+            df = self.cache.get_or_load(
+                self.cache.key(query, params) + ('frame', _dtype_key(dtypes)),
+                tables_for_sql(query),
+                lambda: self._run_frame(query, params, dtypes, workload=workload),
+                ttl,
+            )
+        return pd.DataFrame() if df is None else df
+
+    def procedure_df(self, proc_name, params=(), ttl=None, dtypes=None, workload=None):
+        """Call read-only stored procedure into a typed DataFrame (None if it failed or returned nothing)"""
+        if ttl == 0 or proc_name not in PROCEDURE_TABLES:
+            df = self._run_procedure_frame(proc_name, params, dtypes, session=self.current_session(),
+                                           workload=workload)
+        else:
+            df = self.cache.get_or_load(
+                self.cache.procedure_key(proc_name, params) + ('frame', _dtype_key(dtypes)),
+                PROCEDURE_TABLES[proc_name],
+                lambda: self._run_procedure_frame(proc_name, params, dtypes, workload=workload),
+                ttl,
+            )
+        if df is None or df.empty:
+            return None
+        return df
+
+    def mirror_df(self, query, params=None):
+        """Run a read-only analytics query on the DuckDB mirror instead of MySQL"""
+        try:
+            return self.mirror.query_df(query, params)
+        except MirrorError as e:
+            self._report(f"Mirror query failed: {e}")
+            return pd.DataFrame()
+
+    def timed(self, query, params=None, workload='analytic'):
+        """Run a query uncached and return (rows, elapsed seconds)"""
+        start = time.perf_counter()
+        rows = self.execute_query(query, params, ttl=0, workload=workload)
+        return rows, time.perf_counter() - start
+
+    def gather(self, *loaders):
+        """Run independent loaders (lambdas over this object's methods) concurrently, results in order"""
+        page = self.profiler.current_page()
+        session = self.current_session()
+        carry = self._worker_context() if self._worker_context is not None else None
+
+        def bind():
+            if carry is not None:
+                carry()
+            self.profiler.set_page(page)
+            self.set_session(session)
+
+        return self.fanout.gather(*loaders, bind=bind)
+
+    # =============================================================
+    # DASHBOARD
+    # =============================================================
+    def dashboard_snapshot(self):
+        """Parsed dashboard snapshot (see parse_snapshot) plus a 'stale' flag, or None"""
+        rows = self.execute_query(SNAPSHOT_QUERY, ttl=0)
+        if rows == []:
+            # Never built (e.g. setup skipped the first refresh) - build it inline once
+            self.refresh_dashboard()
+            rows = self.execute_query(SNAPSHOT_QUERY, ttl=0)
+        if not rows:
+            return None
+
+        snapshot = parse_snapshot(rows[0])
+        snapshot['stale'] = snapshot['age'] > 2 * REFRESH_INTERVAL
+        if snapshot['stale']:
+            # Event scheduler is probably off - rebuild in the background
+            self.snapshot_refresher.request()
+        return snapshot
+
+    def refresh_dashboard(self):
+        """Rebuild the dashboard snapshot now; False if that failed"""
+        try:
+            refresh_snapshot(self.pool)
+        except Error as e:
+            self._report(f"Snapshot refresh failed: {e}")
+            return False
+        self.router.wrote(self.current_session())
+        return True
+
+    # =============================================================
+    # STANDINGS, DRIVERS, TEAMS, RACES
+    # =============================================================
+    def seasons(self):
+        """Every season with a race, newest first"""
+        return [row['Year'] for row in self.execute_query(SEASONS_QUERY, ttl=LOOKUP_TTL) or []]
+
+    def season_standings(self, year):
+        """SeasonStandings for `year` (see standings_engine), or None"""
+        return self.standings.season(year)
+
+    def team_nationalities(self):
+        """Team_ID -> nationality"""
+        rows = self.execute_query(TEAM_NATIONALITY_QUERY, ttl=LOOKUP_TTL) or []
+        return {row['Team_ID']: row['Nationality'] for row in rows}
+
+    def lookup(self, table):
+        """Name <-> ID maps for DRIVER, TEAM, RACE or STATUS (see dimension_cache)"""
+        return self.dimensions.get(table)
+
+    def all_drivers(self):
+        return self.query_df(ALL_DRIVERS_QUERY)
+
+    def driver_stats(self, driver_id):
+        """GetDriverStats for one driver, or None"""
+        return self.procedure_df('GetDriverStats', (driver_id,))
+
+    def driver_functions(self, driver_id):
+        """The driver stored functions evaluated for one driver, as a dict (None on failure)"""
+        rows = self.execute_query(DRIVER_FUNCTIONS_QUERY, (driver_id,) * 4)
+        return rows[0] if rows else None
+
+    def add_driver(self, first_name, last_name, dob, team_id):
+        return self.call_procedure('AddDriver', (first_name, last_name, dob, team_id))
+
+    def all_teams(self):
+        return self.query_df(ALL_TEAMS_QUERY)
+
+    def team_performance(self, team_id):
+        """GetTeamPerformance for one team, or None"""
+        return self.procedure_df('GetTeamPerformance', (team_id,))
+
+    def team_functions(self, team_id):
+        """The team stored functions evaluated for one team, as a dict (None on failure)"""
+        rows = self.execute_query(TEAM_FUNCTIONS_QUERY, (team_id,) * 2)
+        return rows[0] if rows else None
+
+    def race_results(self, race_id):
+        """GetRaceResults for one race, or None"""
+        return self.procedure_df('GetRaceResults', (race_id,))
+
+    def lineup(self):
+        """(Driver_ID, Team_ID) rows of the latest race's entry list, in team order (empty before any results)"""
+        return self.execute_query(LINEUP_QUERY, ttl=LOOKUP_TTL) or []
+
+    def add_race_result(self, race_id, driver_id, team_id, status_id, position, grid, points):
+        return self.call_procedure('AddRaceResult', (race_id, driver_id, team_id, status_id, position, grid, points))
+
+    def add_race_results(self, race_id, results):
+        """Insert a whole classification (dicts with driver_id, team_id, status_id, position, grid, points)"""
+        return self.call_procedure('AddRaceResults', (race_id, json.dumps(results)))
+
+    # =============================================================
+    # ANALYTICS
+    # =============================================================
+    def analytics_snapshot(self, force=False):
+        """In-memory RESULT snapshot (see analytics_engine), or None if it could not be refreshed"""
+        try:
+            return self.analytics.snapshot(force=force)
+        except (Error, PoolTimeoutError) as e:
+            self._report(f"Snapshot refresh failed, falling back to MySQL: {e}")
+            return None
+
+    def _aggregate(self, backend, aggregation, query):
+        """Run an Analytics aggregation on 'mysql', 'memory' or 'duckdb' (memory falls back to MySQL)"""
+        if backend == 'memory':
+            snapshot = self.analytics_snapshot()
+            if snapshot is not None:
+                return getattr(snapshot, aggregation)()
+        elif backend == 'duckdb':
+            return self.mirror_df(query)
+        return self.query_df(query, workload='analytic')
+
+    def circuit_stats(self, backend='mysql'):
+        """Races held and average points per circuit"""
+        return self._aggregate(backend, 'circuit_stats', CIRCUIT_STATS_QUERY)
+
+    def team_reliability(self, backend='mysql'):
+        """Finished vs DNF results per team"""
+        return self._aggregate(backend, 'team_reliability', TEAM_RELIABILITY_QUERY)
+
+    def driver_points(self, backend='mysql'):
+        """Career points per driver with any points"""
+        return self._aggregate(backend, 'driver_points', DRIVER_POINTS_QUERY)
+
+    def demo_query(self, name, per_row=False, backend='mysql'):
+        """One of DEMO_QUERIES, set-based or through the per-row stored functions (MySQL only)"""
+        set_query, function_query = DEMO_QUERIES[name]
+        if per_row and function_query is not None:
+            return self.query_df(function_query, workload='analytic')
+        if backend == 'duckdb':
+            return self.mirror_df(set_query)
+        return self.query_df(set_query, workload='analytic')
+
+    def sync_mirror(self):
+        """Bring the Parquet mirror up to date; its summary, or None on failure"""
+        try:
+            return self.mirror.sync(self.router.reader())
+        except (Error, MirrorError, OSError) as e:
+            self._report(f"Mirror sync failed: {e}")
+            return None
+
+    # =============================================================
+    # AUDIT LOG
+    # =============================================================
+    def audit_groups(self, window_days=None):
+        """Entry counts per (Table_Name, Action) in the last `window_days` days (None = all time)"""
+        where = f"WHERE {AUDIT_WINDOW_CONDITION}" if window_days else ""
+        params = (window_days,) if window_days else ()
+        return self.query_df(AUDIT_GROUPS_QUERY.format(where=where), params, workload='analytic')
+
+    @staticmethod
+    def _audit_where(window_days=None, tables=None, actions=None, before=None):
+        """WHERE clause and parameters for an audit window and filters (None = no filter)"""
+        conditions, params = [], []
+        if window_days:
+            conditions.append(AUDIT_WINDOW_CONDITION)
+            params.append(window_days)
+        if tables is not None:
+            conditions.append(f"Table_Name IN ({', '.join(['%s'] * len(tables))})")
+            params.extend(tables)
+        if actions is not None:
+            conditions.append(f"Action IN ({', '.join(['%s'] * len(actions))})")
+            params.extend(actions)
+        if before is not None:
+            changed_at, log_id = before
+            conditions.append("(Changed_At < %s OR (Changed_At = %s AND Log_ID < %s))")
+            params.extend([changed_at, changed_at, log_id])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, tuple(params)
+
+    def audit_page(self, window_days=None, tables=None, actions=None, before=None, limit=50):
+        """Newest audit entries strictly older than `before` = (Changed_At, Log_ID)
+
+        `tables` / `actions` of None mean no filter. Keyset pagination: pass the
+        last row of one page as `before` for the next, so deep pages cost the
+        same as the first one.
+        """
+        where, params = self._audit_where(window_days, tables, actions, before)
+        return self.query_df(AUDIT_PAGE_QUERY.format(where=where), params + (limit,))
+
+    def audit_partitions(self):
+        """AUDIT_LOG partitions with their upper bound, row estimate and size"""
+        return self.query_df(AUDIT_PARTITIONS_QUERY, ttl=0)
+
+    # =============================================================
+    # EXPORTS
+    # =============================================================
+    def _export(self, name, query, params, fmt, path, progress, total):
+        """Stream `query` to a file on a read connection; summary dict, or None on failure"""
+        path = path or export_path(name, fmt)
+        statement = normalize_sql(query)
+        start = time.perf_counter()
+        try:
+            with self._checkout(True, self.current_session(), 'export') as (_, conn):
+                rows = stream_export(
+                    conn, query, params, path, fmt,
+                    progress=(lambda n: progress(n, total)) if progress is not None else None,
+                )
+        except Error as e:
+            self._failed(statement, start, e, 'export', "Export")
+            return None
+        except (ExportError, OSError) as e:
+            self.profiler.record(statement, time.perf_counter() - start, error=True)
+            self._report(f"Export failed: {e}")
+            return None
+        elapsed = time.perf_counter() - start
+        self.profiler.record(statement, elapsed, elapsed, rows)
+        return {'path': path, 'rows': rows, 'bytes': os.path.getsize(path), 'seconds': elapsed}
+
+    def export(self, name, fmt='csv', path=None, progress=None):
+        """Stream one of data_export.EXPORTS to CSV/Parquet; `progress(rows, total)` after each chunk"""
+        query, count_query = EXPORTS[name]
+        counted = self.execute_query(count_query)
+        total = counted[0]['Row_Count'] if counted else None
+        return self._export(name, query, (), fmt, path, progress, total)
+
+    def export_audit(self, fmt='csv', path=None, progress=None, window_days=None, tables=None, actions=None,
+                     total=None):
+        """Stream the audit entries matching a window and filters (as audit_page) to CSV/Parquet, oldest first"""
+        where, params = self._audit_where(window_days, tables, actions)
+        return self._export('audit_log', AUDIT_LOG_EXPORT.format(where=where), params, fmt, path, progress, total)
+
+    # =============================================================
+    # PROFILING
+    # =============================================================
+    def server_digests(self):
+        """Top statements of this schema by total server time, from performance_schema"""
+        return self.query_df(SERVER_DIGESTS_QUERY, ttl=0)
+
+    def statement_digests(self, statements):
+        """Server digest -> profiled statement, for matching client-side stats to server ones"""
+        rows = self.gather(*[
+            lambda statement=statement: self.execute_query(STATEMENT_DIGEST_QUERY, (digest_probe(statement),), ttl=0)
+            for statement in statements
+        ])
+        return {row[0]['Digest']: statement for statement, row in zip(statements, rows) if row}
@@ -0,0 +1,26 @@
+"""
+One module per page of the app, imported the first time its page is selected
+
+Each module has a render(data) that draws the page. A cold worker only
+pays the import and setup cost of the pages it actually serves.
+"""
+
+import importlib
+
+# Sidebar label -> module in this package, in sidebar order
+PAGES = {
+    "🏠 Dashboard": 'dashboard',
+    "🏆 Championship Standings": 'standings',
+    "👤 Driver Management": 'drivers',
+    "🏢 Team Management": 'teams',
+    "🏁 Race Results": 'race_results',
+    "📊 Analytics": 'analytics',
+    "⚙ Database Operations": 'database_operations',
+    "📜 Audit Log": 'audit_log',
+    "🐢 Query Profiler": 'profiler',
+}
+
+
+def render(page, data):
+    """Draw `page`, importing its module on first use"""
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render(data)
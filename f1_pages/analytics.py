@@ -0,0 +1,124 @@
+"""
+Analytics page
+
+Plotly is imported at the first chart drawn, not with the page.
+"""
+
+import streamlit as st
+from datetime import datetime
+from analytics_engine import DEFAULT_BACKEND as DEFAULT_ANALYTICS_BACKEND
+from f1_pages.common import export_panel, lazy_tabs, mirror_caption, session_memo
+
+
+def render(data):
+    """📊 Analytics"""
+    st.header("📊 Advanced Analytics")
+    
+    backends = {"MySQL": "mysql", "In-memory snapshot": "memory", "DuckDB mirror": "duckdb"}
+    labels = list(backends)
+    default = list(backends.values()).index(DEFAULT_ANALYTICS_BACKEND) if DEFAULT_ANALYTICS_BACKEND in backends.values() else 0
+    backend = backends[st.radio("Backend:", labels, index=default, horizontal=True, key="analytics_backend")]
+    
+    if backend == "memory":
+        col1, col2 = st.columns([4, 1])
+        with col2:
+            force = st.button("🔄 Reload Snapshot")
+        if data.analytics_snapshot(force=force) is None:
+            backend = "mysql"  # refresh failed and was reported; don't retry it in every tab
+        else:
+            stats = data.analytics.stats()
+            with col1:
+                st.caption(
+                    f"{stats['rows']:,} results · {stats['bytes'] / 1024 / 1024:.1f} MB · "
+                    f"built {datetime.fromtimestamp(stats['built_at']).strftime('%H:%M:%S')} · "
+                    f"last refresh {stats['last_refresh'] * 1000:.0f} ms · "
+                    f"{stats['full_loads']} full / {stats['incremental_loads']} incremental loads"
+                )
+    elif backend == "duckdb":
+        mirror_caption(data)
+    
+    export_panel("analytics_export", {
+        "driver standings (all seasons)": lambda fmt, progress: data.export('driver_standings', fmt, progress=progress),
+        "team standings (all seasons)": lambda fmt, progress: data.export('team_standings', fmt, progress=progress),
+        "race results (all seasons)": lambda fmt, progress: data.export('race_results', fmt, progress=progress),
+    })
+    
+    tab = lazy_tabs(["Circuit Analysis", "DNF Analysis", "Points Distribution"], key="analytics_tab")
+    
+    if tab == "Circuit Analysis":
+        st.subheader("Circuit Statistics")
+        if backend == "mysql":
+            circuit_data = session_memo(data, "analytics:circuits", data.circuit_stats)
+        else:
+            circuit_data = data.circuit_stats(backend)
+        
+        if circuit_data is None or circuit_data.empty:
+            st.info("No circuit statistics to show")
+        else:
+            st.dataframe(circuit_data, use_container_width=True, hide_index=True)
+            
+            # Chart - FIXED: Changed from update_xaxis to update_layout
+            import plotly.express as px
+            fig = px.bar(
+                circuit_data,
+                x='Circuit_Name',
+                y='Races_Held',
+                color='Location',
+                title='Races Held per Circuit'
+            )
+            fig.update_layout(xaxis_tickangle=-45)  # FIXED LINE
+            st.plotly_chart(fig, use_container_width=True)
+    
+    elif tab == "DNF Analysis":
+        st.subheader("DNF (Did Not Finish) Analysis")
+        if backend == "mysql":
+            dnf_data = session_memo(data, "analytics:dnf", data.team_reliability)
+        else:
+            dnf_data = data.team_reliability(backend)
+        
+        if dnf_data is None or dnf_data.empty:
+            st.info("No reliability data to show")
+        else:
+            st.dataframe(dnf_data, use_container_width=True, hide_index=True)
+            
+            # Chart
+            import plotly.graph_objects as go
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                name='Finished',
+                x=dnf_data['Team_Name'],
+                y=dnf_data['Finished'],
+                marker_color='green'
+            ))
+            fig.add_trace(go.Bar(
+                name='DNF',
+                x=dnf_data['Team_Name'],
+                y=dnf_data['DNF'],
+                marker_color='red'
+            ))
+            fig.update_layout(
+                barmode='stack',
+                title='Team Reliability Analysis',
+                xaxis_tickangle=-45
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    elif tab == "Points Distribution":
+        st.subheader("Points Distribution")
+        if backend == "mysql":
+            points_data = session_memo(data, "analytics:points", data.driver_points)
+        else:
+            points_data = data.driver_points(backend)
+        
+        if points_data is None or points_data.empty:
+            st.info("No points data to show")
+        else:
+            # Pie chart
+            import plotly.express as px
+            fig = px.pie(
+                points_data.head(10),
+                values='Total_Points',
+                names='Driver_Name',
+                title='Top 10 Drivers - Points Share'
+            )
+            st.plotly_chart(fig, use_container_width=True)
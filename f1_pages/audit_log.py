@@ -0,0 +1,106 @@
+"""
+Audit Log page
+"""
+
+import streamlit as st
+from f1_pages.common import export_panel
+
+
+def render(data):
+    """📜 Audit Log"""
+    st.header("📜 Audit Log")
+    
+    st.info("This page shows all database changes tracked by triggers")
+    
+    # AUDIT_LOG is partitioned by month, so a bounded window only touches the partitions it overlaps
+    windows = {"Last 24 hours": 1, "Last 7 days": 7, "Last 30 days": 30, "Last 90 days": 90, "All time": None}
+    window = st.selectbox("Time window:", list(windows), index=2)
+    window_days = windows[window]
+    
+    # Entry counts per (table, action), used for the filter options and the summary metrics
+    groups = data.audit_groups(window_days)
+    
+    if not groups.empty:
+        tables = groups['Table_Name'].dropna().unique().tolist()
+        actions = groups['Action'].dropna().unique().tolist()
+        
+        # Filter options
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            table_filter = st.multiselect("Filter by Table:", options=tables, default=tables)
+        with col2:
+            action_filter = st.multiselect("Filter by Action:", options=actions, default=actions)
+        with col3:
+            page_size = st.selectbox("Rows per page:", [25, 50, 100], index=1)
+        
+        # Keyset pagination: each page starts strictly after the last (Changed_At, Log_ID)
+        # of the page before it
+        signature = (window, tuple(table_filter), tuple(action_filter), page_size)
+        if st.session_state.get('audit_signature') != signature:
+            st.session_state.audit_signature = signature
+            st.session_state.audit_cursors = [None]
+        cursors = st.session_state.audit_cursors
+        
+        if not table_filter or not action_filter:
+            st.warning("Select at least one table and one action")
+        else:
+            # Filters run on the server; selecting everything means no predicate at all
+            df = data.audit_page(
+                window_days,
+                tables=None if set(table_filter) == set(tables) else table_filter,
+                actions=None if set(action_filter) == set(actions) else action_filter,
+                before=cursors[-1],
+                limit=page_size + 1,
+            )
+            
+            # One extra row tells us whether an older page exists
+            has_more = len(df) > page_size
+            df = df.head(page_size)
+            
+            st.dataframe(df, use_container_width=True, hide_index=True)
+            
+            col1, col2, col3 = st.columns([1, 3, 1])
+            with col1:
+                if st.button("⬅ Newer", disabled=len(cursors) == 1):
+                    cursors.pop()
+                    st.rerun()
+            with col2:
+                st.caption(f"Page {len(cursors)} · {len(df)} entries")
+            with col3:
+                if st.button("Older ➡", disabled=not has_more):
+                    last = df.iloc[-1]
+                    cursors.append((last['Changed_At'].to_pydatetime(), int(last['Log_ID'])))
+                    st.rerun()
+        
+        matching = groups[groups['Table_Name'].isin(table_filter) & groups['Action'].isin(action_filter)]
+        if table_filter and action_filter:
+            export_panel("audit_export", {
+                "matching entries": lambda fmt, progress: data.export_audit(
+                    fmt,
+                    progress=progress,
+                    window_days=window_days,
+                    tables=None if set(table_filter) == set(tables) else table_filter,
+                    actions=None if set(action_filter) == set(actions) else action_filter,
+                    total=int(matching['Entries'].sum()),
+                ),
+            })
+        
+        # Summary statistics
+        st.subheader("📊 Audit Summary")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Log Entries in Window", f"{int(groups['Entries'].sum()):,}")
+        with col2:
+            st.metric("Matching Filters", f"{int(matching['Entries'].sum()):,}")
+        with col3:
+            st.metric("Tables Affected", len(tables))
+        with col4:
+            st.metric("Action Types", len(actions))
+    else:
+        st.info(f"No audit log entries found ({window.lower()})")
+    
+    with st.expander("🗂 Partitions"):
+        partitions = data.audit_partitions()
+        st.dataframe(partitions, use_container_width=True, hide_index=True)
+        st.caption("Run `python audit_archive.py` monthly to add partitions and archive expired months to Parquet.")
@@ -0,0 +1,117 @@
+"""
+Data access and UI helpers shared by the app and every page module
+"""
+
+import os
+import threading
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import pandas as pd
+from f1_data import F1Data
+from data_export import DOWNLOAD_MAX_MB, FORMATS as EXPORT_FORMATS
+
+# =============================================================
+# DATA ACCESS
+# =============================================================
+def _worker_context():
+    """Carry this script run's context onto fan-out workers so they can show st.error"""
+    ctx = get_script_run_ctx()
+    return lambda: add_script_run_ctx(threading.current_thread(), ctx)
+
+@st.cache_resource
+def get_data():
+    """Create the data access layer (pool, caches, profiler, engines) shared by all sessions"""
+    return F1Data(
+        report=lambda message: st.error(f"❌ {message}"),
+        notify=lambda message: st.info(f"⏳ {message}"),
+        worker_context=_worker_context,
+    )
+
+# Points for finishing positions 1-10
+RACE_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+
+# =============================================================
+# UI HELPERS
+# =============================================================
+def mirror_caption(data):
+    """Show how current the analytics mirror is, with a button to sync it now"""
+    col1, col2 = st.columns([4, 1])
+    with col2:
+        if st.button("🔄 Sync Mirror"):
+            with st.spinner("Syncing mirror..."):
+                summary = data.sync_mirror()
+            if summary is not None:
+                st.success(f"✅ {summary['appended']:,} results appended in {summary['seconds']:.1f}s")
+    stats = data.mirror.stats()
+    with col1:
+        if stats['synced_at']:
+            st.caption(f"DuckDB over Parquet · {stats['results']:,} results in {stats['seasons']} seasons · "
+                       f"synced {stats['synced_at']}")
+        else:
+            st.caption("DuckDB over Parquet · not synced yet")
+
+def export_panel(key, datasets):
+    """Expander that streams an export to a server-side file with a progress bar, then offers it for download
+
+    `datasets` maps a label to run(fmt, progress) -> export summary (see F1Data.export).
+    """
+    with st.expander("⬇ Export"):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            label = st.selectbox("Data:", list(datasets), key=f"{key}_dataset") if len(datasets) > 1 else next(iter(datasets))
+        with col2:
+            fmt = st.radio("Format:", EXPORT_FORMATS, horizontal=True, key=f"{key}_format")
+        
+        if st.button(f"Export {label}", key=f"{key}_run"):
+            bar = st.progress(0.0, text="Starting export...")
+            
+            def progress(rows, total):
+                fraction = min(rows / total, 1.0) if total else 0.0
+                bar.progress(fraction, text=f"{rows:,}{f' of {total:,}' if total else ''} rows written")
+            
+            result = datasets[label](fmt, progress)
+            bar.empty()
+            if result is not None:
+                st.session_state[f"{key}_result"] = result
+        
+        # The last export stays on offer across reruns until it is replaced or removed
+        result = st.session_state.get(f"{key}_result")
+        if result and os.path.exists(result['path']):
+            size_mb = result['bytes'] / 1024 / 1024
+            st.success(f"✅ {result['rows']:,} rows · {size_mb:.1f} MB in {result['seconds']:.1f}s → `{result['path']}`")
+            if size_mb <= DOWNLOAD_MAX_MB:
+                with open(result['path'], 'rb') as file:
+                    st.download_button("💾 Download", file, file_name=os.path.basename(result['path']), key=f"{key}_download")
+            else:
+                st.caption(f"Larger than {DOWNLOAD_MAX_MB:.0f} MB - copy it from the server path above.")
+
+def frames_match(a, b, tolerance=1e-6):
+    """Compare two result frames, allowing FLOAT vs DOUBLE rounding in numeric columns"""
+    if list(a.columns) != list(b.columns) or len(a) != len(b):
+        return False
+    for column in a.columns:
+        left = pd.to_numeric(a[column], errors='coerce')
+        right = pd.to_numeric(b[column], errors='coerce')
+        if left.notna().all() and right.notna().all():
+            if ((left - right).abs() > tolerance).any():
+                return False
+        elif not a[column].astype(str).equals(b[column].astype(str)):
+            return False
+    return True
+
+def lazy_tabs(labels, key):
+    """Tab strip that only runs the selected tab's body (st.tabs runs every body on each rerun)"""
+    return st.radio("View:", labels, horizontal=True, key=key, label_visibility="collapsed")
+
+def session_memo(data, key, compute):
+    """Memoize a tab's computed data for this session until a write invalidates `data`'s query cache"""
+    memo = st.session_state.setdefault('_tab_memo', {})
+    version = data.cache.version()
+    entry = memo.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    value = compute()
+    if value is not None:  # failed loads are retried on the next rerun
+        memo[key] = (version, value)
+    return value
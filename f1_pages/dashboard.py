@@ -0,0 +1,68 @@
+"""
+Dashboard page
+"""
+
+import streamlit as st
+
+
+def render(data):
+    """🏠 Dashboard"""
+    st.header("📊 Dashboard")
+    
+    # Everything on this page comes from one precomputed row (see RefreshDashboardSnapshot)
+    snapshot = data.dashboard_snapshot()
+    
+    if snapshot is not None:
+        counts = snapshot['counts']
+        
+        # Staleness indicator
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            caption = (
+                f"Snapshot taken {snapshot['age']:.0f}s ago "
+                f"({snapshot['refreshed_at']:%H:%M:%S}, built in {snapshot['build_ms']:.0f} ms)"
+            )
+            if snapshot['stale']:
+                # Event scheduler is probably off - it is rebuilding in the background, show what we have
+                st.warning(f"⏳ {caption} - refreshing in the background")
+            else:
+                st.caption(f"🕒 {caption}")
+        with col2:
+            if st.button("🔄 Refresh Now") and data.refresh_dashboard():
+                st.rerun()
+        
+        # Statistics Cards
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Drivers", counts['drivers'], "Active")
+        
+        with col2:
+            st.metric("Total Teams", counts['teams'], "All Seasons")
+        
+        with col3:
+            st.metric("Total Races", counts['races'], "Completed")
+        
+        with col4:
+            st.metric("Total Results", counts['results'], "Recorded")
+        
+        st.divider()
+        
+        # Top 5 Drivers
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("🏆 Top 5 Drivers")
+            st.dataframe(snapshot['top_drivers'], use_container_width=True, hide_index=True)
+        
+        with col2:
+            st.subheader("🏢 Top 5 Teams")
+            st.dataframe(snapshot['top_teams'], use_container_width=True, hide_index=True)
+        
+        st.divider()
+        
+        # Recent Races
+        st.subheader("🏁 Recent Races")
+        st.dataframe(snapshot['recent_races'], use_container_width=True, hide_index=True)
+    else:
+        st.info("Dashboard snapshot not available - run complete_setup.sql to create it")
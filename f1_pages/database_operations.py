@@ -0,0 +1,210 @@
+"""
+Database Operations page
+"""
+
+import streamlit as st
+import pandas as pd
+from f1_data import DEMO_QUERIES
+from analytics_engine import DEFAULT_BACKEND as DEFAULT_ANALYTICS_BACKEND
+from f1_pages.common import RACE_POINTS, frames_match, lazy_tabs, mirror_caption
+
+
+def render(data):
+    """⚙ Database Operations"""
+    st.header("⚙ Database Operations")
+    
+    tab = lazy_tabs(["Test Functions", "Test Queries", "Add Result"], key="operations_tab")
+    
+    if tab == "Test Functions":
+        st.subheader("Test Database Functions")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Driver Functions**")
+            driver_id = st.number_input("Driver ID:", min_value=1, value=1)
+            
+            if st.button("Test Driver Functions"):
+                result = data.driver_functions(driver_id)
+                if result:
+                    st.json(result)
+        
+        with col2:
+            st.markdown("**Team Functions**")
+            team_id = st.number_input("Team ID:", min_value=1, value=1)
+            
+            if st.button("Test Team Functions"):
+                result = data.team_functions(team_id)
+                if result:
+                    st.json(result)
+    
+    elif tab == "Test Queries":
+        st.subheader("Complex Queries Demonstration")
+        
+        # Nested query demo is "Drivers with No Points (Nested Query)"
+        query_type = st.selectbox("Select Query:", list(DEMO_QUERIES))
+        
+        # Some have a per-row stored function version next to the set-based view version
+        set_query, function_query = DEMO_QUERIES[query_type]
+        has_set_based = function_query is not None
+        if has_set_based:
+            implementation = st.radio(
+                "Implementation:",
+                ["Set-based (views)", "Per-row functions", "Compare both"],
+                horizontal=True
+            )
+        
+        # The stored functions only exist in MySQL; everything else can run on the mirror
+        on_mirror = False
+        if not has_set_based or implementation == "Set-based (views)":
+            on_mirror = st.radio(
+                "Backend:",
+                ["MySQL", "DuckDB mirror"],
+                index=1 if DEFAULT_ANALYTICS_BACKEND == "duckdb" else 0,
+                horizontal=True,
+                key="queries_backend"
+            ) == "DuckDB mirror"
+            if on_mirror:
+                mirror_caption(data)
+        
+        if st.button("Execute Query"):
+            if query_type == "Drivers with No Points (Nested Query)":
+                st.info("This query demonstrates a nested query (subquery) to find drivers who are not in the set of drivers that have scored points.")
+            
+            if has_set_based and implementation == "Compare both":
+                set_rows, set_time = data.timed(set_query)
+                function_rows, function_time = data.timed(function_query)
+                if set_rows is not None and function_rows is not None:
+                    set_df = pd.DataFrame(set_rows)
+                    function_df = pd.DataFrame(function_rows)
+                    
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Set-based", f"{set_time * 1000:.1f} ms")
+                    with col2:
+                        st.metric("Per-row functions", f"{function_time * 1000:.1f} ms")
+                    with col3:
+                        st.metric("Speedup", f"{function_time / set_time:.1f}×" if set_time else "N/A")
+                    
+                    if frames_match(set_df, function_df):
+                        st.success("✅ Both implementations return identical results")
+                    else:
+                        st.warning("⚠ Results differ between implementations")
+                    st.dataframe(set_df, use_container_width=True, hide_index=True)
+            else:
+                per_row = has_set_based and implementation == "Per-row functions"
+                df = data.demo_query(query_type, per_row=per_row, backend="duckdb" if on_mirror else "mysql")
+                if not df.empty:
+                    st.dataframe(df, use_container_width=True, hide_index=True)
+    
+    elif tab == "Add Result":
+        st.subheader("Add Race Result")
+        
+        entry_mode = st.radio("Entry Mode:", ["Single Result", "Full Race Classification"], horizontal=True)
+        
+        # Lookups shared by both entry modes (from the in-process dimension cache) and the
+        # classification grid's lineup, fetched as one concurrent batch
+        drivers, teams, races, statuses, lineup = data.gather(
+            lambda: data.lookup('DRIVER'),
+            lambda: data.lookup('TEAM'),
+            lambda: data.lookup('RACE'),
+            lambda: data.lookup('STATUS'),
+            data.lineup if entry_mode == "Full Race Classification" else list,
+        )
+        race_opts = races.ids
+        driver_opts = drivers.ids
+        team_opts = teams.ids
+        status_opts = statuses.ids
+        
+        if entry_mode == "Single Result":
+            with st.form("add_result_form"):
+                sel_race = st.selectbox("Race:", list(race_opts.keys()))
+                sel_driver = st.selectbox("Driver:", list(driver_opts.keys()))
+                sel_team = st.selectbox("Team:", list(team_opts.keys()))
+                sel_status = st.selectbox("Status:", list(status_opts.keys()))
+                
+                position = st.number_input("Final Position (leave 0 for DNF):", min_value=0, max_value=20, value=1)
+                grid = st.number_input("Grid Position:", min_value=1, max_value=20, value=1)
+                points = st.number_input("Points:", min_value=0.0, max_value=26.0, value=0.0, step=1.0)
+                
+                submitted = st.form_submit_button("Add Result")
+                
+                if submitted:
+                    race_id = race_opts[sel_race]
+                    driver_id = driver_opts[sel_driver]
+                    team_id = team_opts[sel_team]
+                    status_id = status_opts[sel_status]
+                    final_pos = position if position > 0 else None
+                    
+                    result = data.add_race_result(race_id, driver_id, team_id, status_id, final_pos, grid, points)
+                    if result:
+                        st.success("✅ Race result added successfully!")
+                        st.rerun()
+        
+        else:
+            st.caption(
+                "Enter the whole grid and submit it in one transaction. Set Position to 0 for a DNF. "
+                "The grid starts from the latest race's entry list - add or remove rows as needed."
+            )
+            
+            # Pre-fill the latest race's entrants with the team they drove for, in team order
+            finished = next(iter(status_opts), None)
+            grid_df = pd.DataFrame([
+                {
+                    'Position': i,
+                    'Driver': drivers.names.get(row['Driver_ID']),
+                    'Team': teams.names.get(row['Team_ID']),
+                    'Status': finished,
+                    'Grid': i,
+                    'Points': float(RACE_POINTS[i - 1]) if i <= len(RACE_POINTS) else 0.0,
+                }
+                for i, row in enumerate(lineup, start=1)
+            ])
+            
+            with st.form("add_classification_form"):
+                sel_race = st.selectbox("Race:", list(race_opts.keys()))
+                classification = st.data_editor(
+                    grid_df,
+                    num_rows="dynamic",
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "Position": st.column_config.NumberColumn("Pos", min_value=0, step=1),
+                        "Driver": st.column_config.SelectboxColumn("Driver", options=list(driver_opts.keys()), required=True),
+                        "Team": st.column_config.SelectboxColumn("Team", options=list(team_opts.keys()), required=True),
+                        "Status": st.column_config.SelectboxColumn("Status", options=list(status_opts.keys()), required=True),
+                        "Grid": st.column_config.NumberColumn("Grid", min_value=0, step=1),
+                        "Points": st.column_config.NumberColumn("Points", min_value=0.0, step=0.5, format="%.1f"),
+                    }
+                )
+                
+                submitted = st.form_submit_button("Add Classification")
+                
+                if submitted:
+                    rows = classification
+                    # Reject incomplete rows rather than silently saving the race without them
+                    missing = rows[['Driver', 'Team', 'Status']].isna().any(axis=1).tolist()
+                    incomplete = [str(i) for i, is_missing in enumerate(missing, start=1) if is_missing]
+                    if incomplete:
+                        st.error(f"❌ {len(incomplete)} row(s) are missing a driver, team or status: "
+                                 f"row {', '.join(incomplete)}")
+                    elif rows.empty:
+                        st.error("❌ The classification has no rows")
+                    elif rows['Driver'].duplicated().any():
+                        st.error("❌ A driver appears more than once in the classification")
+                    else:
+                        payload = [
+                            {
+                                'driver_id': driver_opts[row.Driver],
+                                'team_id': team_opts[row.Team],
+                                'status_id': status_opts[row.Status],
+                                'position': int(row.Position) if pd.notna(row.Position) and row.Position > 0 else None,
+                                'grid': int(row.Grid) if pd.notna(row.Grid) else None,
+                                'points': float(row.Points) if pd.notna(row.Points) else 0.0,
+                            }
+                            for row in rows.itertuples(index=False)
+                        ]
+                        result = data.add_race_results(race_opts[sel_race], payload)
+                        if result:
+                            st.success(f"✅ {result[0]['Results_Added']} results added successfully!")
+                            st.rerun()
@@ -0,0 +1,69 @@
+"""
+Driver Management page
+"""
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+from f1_pages.common import lazy_tabs, session_memo
+
+
+def render(data):
+    """👤 Driver Management"""
+    st.header("👤 Driver Management")
+    
+    tab = lazy_tabs(["View Drivers", "Driver Stats", "Add Driver"], key="drivers_tab")
+    
+    if tab == "View Drivers":
+        st.subheader("All Drivers")
+        drivers = session_memo(data, "drivers:all", data.all_drivers)
+        st.dataframe(drivers, use_container_width=True, hide_index=True)
+    
+    elif tab == "Driver Stats":
+        st.subheader("Driver Statistics")
+        
+        # Select driver
+        driver_options = data.lookup('DRIVER').ids
+        
+        selected_driver = st.selectbox("Select Driver:", list(driver_options.keys()))
+        
+        if st.button("Get Stats"):
+            driver_id = driver_options[selected_driver]
+            df = data.driver_stats(driver_id)
+            
+            if df is not None:
+                
+                # Display as metrics
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Total Points", df['Total_Points'].values[0])
+                with col2:
+                    st.metric("Wins", df['Wins'].values[0])
+                with col3:
+                    st.metric("Podiums", df['Podiums'].values[0])
+                with col4:
+                    best = df['Best_Finish'].iloc[0]
+                    st.metric("Best Finish", f"P{int(best)}" if pd.notna(best) and best else "N/A")
+                
+                st.dataframe(df, use_container_width=True, hide_index=True)
+    
+    elif tab == "Add Driver":
+        st.subheader("Add New Driver")
+        
+        with st.form("add_driver_form"):
+            first_name = st.text_input("First Name")
+            last_name = st.text_input("Last Name")
+            dob = st.date_input("Date of Birth", max_value=datetime.now().date())
+            
+            # Get teams
+            team_options = data.lookup('TEAM').ids
+            selected_team = st.selectbox("Team:", list(team_options.keys()))
+            
+            submitted = st.form_submit_button("Add Driver")
+            
+            if submitted:
+                team_id = team_options[selected_team]
+                result = data.add_driver(first_name, last_name, dob, team_id)
+                if result:
+                    st.success(f"✅ Driver {first_name} {last_name} added successfully!")
+                    st.rerun()
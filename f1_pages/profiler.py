@@ -0,0 +1,83 @@
+"""
+Query Profiler page
+
+Plotly is imported at the first chart drawn, not with the page.
+"""
+
+import streamlit as st
+import pandas as pd
+from query_profiler import SERVER_SIDE
+
+
+def render(data):
+    """🐢 Query Profiler"""
+    st.header("🐢 Query Profiler")
+    
+    st.info("Latency, row counts and fetch/convert time for every statement the app has run since start-up")
+    
+    report = pd.DataFrame(data.profiler.report())
+    if report.empty:
+        st.info("No statements recorded yet - browse some pages first")
+    else:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Distinct Statements", len(report))
+        with col2:
+            st.metric("Executions", int(report['Calls'].sum()))
+        with col3:
+            st.metric("Total DB Time", f"{report['Total_ms'].sum() / 1000:.2f} s")
+        
+        sort_by = st.selectbox("Sort by:", ["Total_ms", "p95_ms", "p99_ms", "Max_ms", "Avg_ms", "Calls", "Avg_Rows"])
+        report = report.sort_values(sort_by, ascending=False)
+        
+        st.subheader("Slowest Statements")
+        st.dataframe(report, use_container_width=True, hide_index=True)
+        
+        st.subheader("Latency Histogram")
+        statement = st.selectbox("Statement:", report['Statement'].tolist())
+        histogram = pd.DataFrame(data.profiler.histogram(statement), columns=['Latency', 'Executions'])
+        import plotly.express as px
+        fig = px.bar(histogram, x='Latency', y='Executions', title='Latency Distribution')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        fanout = data.fanout.stats()
+        if fanout['batches']:
+            st.caption(
+                f"Parallel fan-out: {fanout['batches']} batches of {fanout['tasks']} queries · "
+                f"{fanout['task_time'] * 1000:.0f} ms of query time in {fanout['wall_time'] * 1000:.0f} ms "
+                f"({fanout['speedup']:.1f}× overlap)"
+            )
+        
+        if st.button("Reset Profile"):
+            data.profiler.reset()
+            st.rerun()
+    
+    st.subheader("🚦 Workload Budgets")
+    workloads = pd.DataFrame([
+        {
+            'Workload': name,
+            'Budget_s': workload['budget'],
+            'Slots': workload['slots'],
+            'Running': workload['running'],
+            'Queued_Now': workload['waiting'],
+            'Ever_Queued': workload['queued'],
+            'Rejected': workload['rejected'],
+            'Cancelled': workload['cancelled'],
+        }
+        for name, workload in data.governor.stats().items()
+    ])
+    st.dataframe(workloads, use_container_width=True, hide_index=True)
+    st.caption("Empty budget or slots means unlimited: writes and lookups are never queued")
+    
+    if SERVER_SIDE:
+        st.subheader("🖥 Server-Side (performance_schema)")
+        server = data.server_digests()
+        
+        if not server.empty and not report.empty:
+            # Match client-side statements to server digests
+            digests = data.statement_digests(report['Statement'].tolist())
+            server.insert(0, 'App_Statement', server['DIGEST'].map(digests))
+        
+        st.dataframe(server.drop(columns=['DIGEST'], errors='ignore'), use_container_width=True, hide_index=True)
+    else:
+        st.caption("Set F1_PROFILE_SERVER_SIDE=1 to correlate with performance_schema statement digests.")
@@ -0,0 +1,64 @@
+"""
+Race Results page
+"""
+
+import streamlit as st
+from f1_pages.common import export_panel
+
+
+def render(data):
+    """🏁 Race Results"""
+    st.header("🏁 Race Results")
+    
+    # Get races
+    race_options = data.lookup('RACE').ids
+    
+    selected_race = st.selectbox("Select Race:", list(race_options.keys()))
+    
+    if st.button("Show Results", type="primary"):
+        race_id = race_options[selected_race]
+        df = data.race_results(race_id)
+        
+        if df is not None:
+            
+            # Style the dataframe
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Position": st.column_config.NumberColumn("Pos", format="%d"),
+                    "Points": st.column_config.NumberColumn("Points", format="%.1f"),
+                }
+            )
+            
+            # Podium visualization
+            podium_df = df[df['Position'].notna() & (df['Position'] <= 3)]
+            if not podium_df.empty:
+                st.subheader("🏆 Podium")
+                col1, col2, col3 = st.columns(3)
+                
+                if len(podium_df) >= 1:
+                    with col1:
+                        st.markdown("### 🥇 1st Place")
+                        st.success(f"{podium_df.iloc[0]['Driver_Name']}")
+                        st.write(f"Team: {podium_df.iloc[0]['Team_Name']}")
+                        st.write(f"Points: {podium_df.iloc[0]['Points']}")
+                
+                if len(podium_df) >= 2:
+                    with col2:
+                        st.markdown("### 🥈 2nd Place")
+                        st.info(f"{podium_df.iloc[1]['Driver_Name']}")
+                        st.write(f"Team: {podium_df.iloc[1]['Team_Name']}")
+                        st.write(f"Points: {podium_df.iloc[1]['Points']}")
+                
+                if len(podium_df) >= 3:
+                    with col3:
+                        st.markdown("### 🥉 3rd Place")
+                        st.warning(f"{podium_df.iloc[2]['Driver_Name']}")
+                        st.write(f"Team: {podium_df.iloc[2]['Team_Name']}")
+                        st.write(f"Points: {podium_df.iloc[2]['Points']}")
+    
+    export_panel("results_export", {
+        "every race result": lambda fmt, progress: data.export('race_results', fmt, progress=progress),
+    })
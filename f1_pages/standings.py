@@ -0,0 +1,115 @@
+"""
+Championship Standings page
+
+Plotly is imported at the first chart drawn, not with the page.
+"""
+
+import streamlit as st
+from f1_pages.common import lazy_tabs
+
+
+def render(data):
+    """🏆 Championship Standings"""
+    st.header("🏆 Championship Standings")
+    
+    years = data.seasons()
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        season = st.selectbox("Season:", years)
+    with col2:
+        tab = lazy_tabs(["Driver Standings", "Team Standings", "Progression"], key="standings_tab")
+    
+    # The season and the name lookups are independent: fetch them as one concurrent batch
+    standings, driver_names, team_names, nationality = data.gather(
+        lambda: data.season_standings(season) if season else None,
+        lambda: data.lookup('DRIVER').names,
+        lambda: data.lookup('TEAM').names,
+        data.team_nationalities if tab == "Team Standings" else dict,
+    )
+    
+    if standings is None:
+        st.info("No seasons found")
+    
+    elif tab in ("Driver Standings", "Team Standings") and standings.drivers.empty:
+        st.info("No results recorded for this season yet")
+    
+    elif tab == "Driver Standings":
+        st.subheader(f"Driver Championship {season}")
+        
+        df = standings.drivers.assign(
+            Driver_Name=standings.drivers['Driver_ID'].map(driver_names),
+            Team_Name=standings.drivers['Team_ID'].map(team_names),
+        )[['Rank', 'Driver_Name', 'Team_Name', 'Points', 'Wins', 'Podiums', 'Races']]
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        
+        # Chart
+        import plotly.express as px
+        fig = px.bar(
+            df.head(10),
+            x='Driver_Name',
+            y='Points',
+            color='Team_Name',
+            title='Top 10 Drivers by Points',
+            labels={'Driver_Name': 'Driver'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    elif tab == "Team Standings":
+        st.subheader(f"Team Championship {season}")
+        
+        team_standings = standings.teams.assign(
+            Team_Name=standings.teams['Team_ID'].map(team_names),
+            Nationality=standings.teams['Team_ID'].map(nationality),
+        )[['Rank', 'Team_Name', 'Nationality', 'Points', 'Wins', 'Podiums', 'Races']]
+        
+        st.dataframe(team_standings, use_container_width=True, hide_index=True)
+        
+        # Chart
+        import plotly.express as px
+        fig = px.bar(
+            team_standings,
+            x='Team_Name',
+            y='Points',
+            color='Nationality',
+            title='Team Championship Points',
+            labels={'Team_Name': 'Team'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    elif tab == "Progression":
+        st.subheader(f"Championship Progression {season}")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            championship = st.radio("Championship:", ["Drivers", "Teams"], horizontal=True)
+        with col2:
+            top_n = st.slider("Show top:", min_value=2, max_value=20, value=10)
+        
+        if championship == "Drivers":
+            table, progression, names, label = standings.drivers, standings.driver_progression, driver_names, 'Driver'
+            leaders = table['Driver_ID'].head(top_n).tolist()
+        else:
+            table, progression, names, label = standings.teams, standings.team_progression, team_names, 'Team'
+            leaders = table['Team_ID'].head(top_n).tolist()
+        
+        if not leaders:
+            st.info("No results recorded for this season yet")
+        else:
+            # Points after each round, carried through rounds a driver/team missed
+            chart = (progression[leaders]
+                     .rename(columns=names)
+                     .reset_index()
+                     .melt(id_vars='Round', var_name=label, value_name='Points'))
+            chart['Race'] = chart['Round'].map(dict(zip(standings.races['Round'], standings.races['Race_Name'])))
+            import plotly.express as px
+            fig = px.line(
+                chart,
+                x='Round',
+                y='Points',
+                color=label,
+                markers=True,
+                hover_data=['Race'],
+                title=f'Cumulative {label} Points by Round'
+            )
+            st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,41 @@
+"""
+Team Management page
+"""
+
+import streamlit as st
+from f1_pages.common import lazy_tabs, session_memo
+
+
+def render(data):
+    """🏢 Team Management"""
+    st.header("🏢 Team Management")
+    
+    tab = lazy_tabs(["View Teams", "Team Performance"], key="teams_tab")
+    
+    if tab == "View Teams":
+        st.subheader("All Teams")
+        teams = session_memo(data, "teams:all", data.all_teams)
+        st.dataframe(teams, use_container_width=True, hide_index=True)
+    
+    elif tab == "Team Performance":
+        st.subheader("Team Performance Analysis")
+        
+        team_options = data.lookup('TEAM').ids
+        
+        selected_team = st.selectbox("Select Team:", list(team_options.keys()))
+        
+        if st.button("Get Performance"):
+            team_id = team_options[selected_team]
+            df = data.team_performance(team_id)
+            
+            if df is not None:
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total Points", df['Total_Points'].values[0])
+                with col2:
+                    st.metric("Wins", df['Wins'].values[0])
+                with col3:
+                    st.metric("Podiums", df['Podiums'].values[0])
+                
+                st.dataframe(df, use_container_width=True, hide_index=True)
@@ -0,0 +1,272 @@
+"""
+Bulk loader for the Ergast-style 1950-2024 F1 history CSVs
+
+Streams status, constructors, circuits, drivers, races and results CSVs
+into f1_db using batched multi-row INSERTs. Each batch commits together
+with its checkpoint row in LOAD_CHECKPOINT, so an interrupted load
+resumes exactly where it stopped. Per-row standings maintenance is
+deferred while loading and rebuilt once at the end.
+
+Usage:
+    python load_history.py path/to/csv_dir [--batch-size 5000] [--truncate]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from itertools import islice
+
+import mysql.connector
+from mysql.connector import Error
+
+from db_pool import DB_CONFIG
+
+NULL = '\\N'  # Ergast's NULL marker
+
+
+def _int(value):
+    return None if value in (NULL, '') else int(value)
+
+
+def _float(value):
+    return 0.0 if value in (NULL, '') else float(value)
+
+
+def _str(value):
+    return None if value in (NULL, '') else value
+
+
+# (source file, target table, INSERT statement, row builder) in foreign-key order.
+# Builders get the CSV row as a {column: value} lookup plus the loader context.
+SOURCES = [
+    (
+        'status.csv', 'STATUS',
+        "INSERT INTO STATUS (Status_ID, Status_description) VALUES (%s, %s)",
+        lambda r, ctx: (int(r['statusId']), r['status']),
+    ),
+    (
+        'constructors.csv', 'TEAM',
+        "INSERT INTO TEAM (Team_ID, Team_Name, Nationality) VALUES (%s, %s, %s)",
+        lambda r, ctx: (int(r['constructorId']), r['name'], _str(r['nationality'])),
+    ),
+    (
+        'circuits.csv', 'CIRCUIT',
+        "INSERT INTO CIRCUIT (Circuit_ID, Circuit_Name, Location) VALUES (%s, %s, %s)",
+        lambda r, ctx: (int(r['circuitId']), r['name'], _str(r['country'])),
+    ),
+    (
+        'drivers.csv', 'DRIVER',
+        "INSERT INTO DRIVER (Driver_ID, First_Name, Last_Name, DOB, Team_ID) VALUES (%s, %s, %s, %s, NULL)",
+        lambda r, ctx: (int(r['driverId']), r['forename'], r['surname'], _str(r['dob'])),
+    ),
+    (
+        'races.csv', 'RACE',
+        "INSERT INTO RACE (Race_ID, Race_Name, Venue, Year, Round, Circuit_ID) VALUES (%s, %s, %s, %s, %s, %s)",
+        lambda r, ctx: (int(r['raceId']), r['name'], ctx['venues'].get(int(r['circuitId'])),
+                        int(r['year']), _int(r['round']), int(r['circuitId'])),
+    ),
+    (
+        'results.csv', 'RESULT',
+        "INSERT INTO RESULT (Result_ID, Race_ID, Driver_ID, Team_ID, Status_ID, Position, Grid, Points) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+        lambda r, ctx: (int(r['resultId']), int(r['raceId']), int(r['driverId']), int(r['constructorId']),
+                        int(r['statusId']), _int(r['position']), _int(r['grid']), _float(r['points'])),
+    ),
+]
+
+# Cleared by --truncate, children first
+DATA_TABLES = [
+    'DRIVER_SEASON_STANDINGS', 'TEAM_SEASON_STANDINGS', 'RESULT', 'RACE',
+    'DRIVER', 'CIRCUIT', 'TEAM', 'STATUS', 'LOAD_CHECKPOINT',
+]
+
+
+class _Row:
+    """Column-name lookup over a csv.reader row without building a dict per row"""
+    __slots__ = ('index', 'values')
+
+    def __init__(self, index):
+        self.index = index
+        self.values = None
+
+    def __getitem__(self, column):
+        return self.values[self.index[column]]
+
+
+def _stream_rows(path, skip):
+    """Yield rows of a CSV file, skipping the first `skip` data rows"""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        row = _Row({name: i for i, name in enumerate(header)})
+        for values in islice(reader, skip, None):
+            row.values = values
+            yield row
+
+
+def _checkpoint(cursor, source):
+    """Rows already loaded from a source file, and whether it finished"""
+    cursor.execute("SELECT Rows_Loaded, Completed FROM LOAD_CHECKPOINT WHERE Source_File = %s", (source,))
+    row = cursor.fetchone()
+    return (row[0], bool(row[1])) if row else (0, False)
+
+
+def _save_checkpoint(cursor, source, rows_loaded, completed=False):
+    cursor.execute(
+        "INSERT INTO LOAD_CHECKPOINT (Source_File, Rows_Loaded, Completed) VALUES (%s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE Rows_Loaded = VALUES(Rows_Loaded), Completed = VALUES(Completed)",
+        (source, rows_loaded, completed)
+    )
+
+
+def untracked_rows(conn):
+    """(table, rows in it, rows its checkpoint accounts for) for every unfinished source with foreign rows
+
+    Such rows (e.g. the complete_setup.sql seed data) would collide with the
+    CSV's primary keys on every attempt, so resuming can't get past them.
+    """
+    cursor = conn.cursor()
+    conflicts = []
+    for source, table, _, _ in SOURCES:
+        loaded, completed = _checkpoint(cursor, source)
+        if completed:
+            continue
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        rows = cursor.fetchone()[0]
+        if rows > loaded:
+            conflicts.append((table, rows, loaded))
+    cursor.close()
+    return conflicts
+
+
+def load_source(conn, csv_dir, source, insert_sql, build, ctx, batch_size):
+    """Stream one CSV into its table in committed, checkpointed batches"""
+    cursor = conn.cursor()
+    loaded, completed = _checkpoint(cursor, source)
+    if completed:
+        print(f"  {source:<18} already loaded ({loaded:,} rows)")
+        cursor.close()
+        return 0
+
+    path = os.path.join(csv_dir, source)
+    started = time.perf_counter()
+    new_rows = 0
+    batch = []
+    for row in _stream_rows(path, loaded):
+        batch.append(build(row, ctx))
+        if len(batch) >= batch_size:
+            cursor.executemany(insert_sql, batch)
+            loaded += len(batch)
+            new_rows += len(batch)
+            _save_checkpoint(cursor, source, loaded)
+            conn.commit()
+            batch.clear()
+    if batch:
+        cursor.executemany(insert_sql, batch)
+        loaded += len(batch)
+        new_rows += len(batch)
+    _save_checkpoint(cursor, source, loaded, completed=True)
+    conn.commit()
+    cursor.close()
+
+    elapsed = time.perf_counter() - started
+    rate = new_rows / elapsed if elapsed else 0
+    print(f"  {source:<18} {new_rows:>8,} rows in {elapsed:6.2f}s ({rate:,.0f} rows/s)")
+    return new_rows
+
+
+def _circuit_venues(csv_dir):
+    """Circuit_ID -> city, used as RACE.Venue (a few dozen rows, kept in memory)"""
+    return {
+        int(row['circuitId']): _str(row['location'])
+        for row in _stream_rows(os.path.join(csv_dir, 'circuits.csv'), 0)
+    }
+
+
+def finish_load(conn):
+    """Work deferred during the load: standings, current teams, lookup versions, optimizer stats"""
+    cursor = conn.cursor()
+    print("  Rebuilding season standings...")
+    cursor.callproc('RebuildSeasonStandings', (None,))
+
+    # A driver's current team is the one they drove for in their latest result
+    cursor.execute("""
+        UPDATE DRIVER D
+        JOIN (
+            SELECT R.Driver_ID, R.Team_ID
+            FROM RESULT R
+            JOIN (SELECT Driver_ID, MAX(Result_ID) AS Last_Result FROM RESULT GROUP BY Driver_ID) L
+              ON R.Result_ID = L.Last_Result
+        ) LATEST ON D.Driver_ID = LATEST.Driver_ID
+        SET D.Team_ID = LATEST.Team_ID
+        WHERE D.Team_ID IS NULL
+    """)
+    # The Bump*Version triggers were skipped, so tell app dimension caches to reload
+    cursor.execute(
+        "UPDATE DIMENSION_VERSION SET Version = Version + 1 "
+        "WHERE Table_Name IN ('DRIVER', 'TEAM', 'RACE', 'STATUS')"
+    )
+    conn.commit()
+
+    for _, table, _, _ in SOURCES:
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+    cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load Ergast F1 history CSVs into f1_db")
+    parser.add_argument('csv_dir', help="directory containing the Ergast CSV files")
+    parser.add_argument('--batch-size', type=int, default=5000, help="rows per INSERT batch / commit")
+    parser.add_argument('--truncate', action='store_true',
+                        help="clear existing data and checkpoints first instead of resuming")
+    args = parser.parse_args()
+
+    missing = [source for source, _, _, _ in SOURCES if not os.path.exists(os.path.join(args.csv_dir, source))]
+    if missing:
+        parser.error(f"missing CSV files in {args.csv_dir}: {', '.join(missing)}")
+
+    try:
+        conn = mysql.connector.connect(**DB_CONFIG, autocommit=False)
+        cursor = conn.cursor()
+        # Files are loaded parent-first, so per-row FK probes are redundant;
+        # @f1_bulk_load makes the standings and audit triggers skip their per-row work
+        cursor.execute("SET SESSION foreign_key_checks = 0")
+        cursor.execute("SET SESSION unique_checks = 0")
+        cursor.execute("SET @f1_bulk_load = 1")
+
+        if args.truncate:
+            print("Clearing existing data...")
+            for table in DATA_TABLES:
+                cursor.execute(f"TRUNCATE TABLE {table}")
+        cursor.close()
+
+        conflicts = untracked_rows(conn)
+        if conflicts:
+            for table, rows, loaded in conflicts:
+                print(f"❌ {table} has {rows:,} rows but only {loaded:,} came from an earlier load")
+            print("Existing data would collide with the history's IDs: re-run with --truncate to replace it.")
+            conn.close()
+            return 1
+
+        ctx = {'venues': _circuit_venues(args.csv_dir)}
+        started = time.perf_counter()
+        print(f"Loading {args.csv_dir} into {DB_CONFIG['database']}...")
+        total = 0
+        for source, _, insert_sql, build in SOURCES:
+            total += load_source(conn, args.csv_dir, source, insert_sql, build, ctx, args.batch_size)
+        finish_load(conn)
+        conn.close()
+    except Error as e:
+        print(f"❌ Load failed: {e}")
+        print("Re-run the same command to resume from the last committed batch.")
+        return 1
+
+    print(f"✅ Loaded {total:,} rows in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+TTL + LRU result cache for read queries and stored procedures,
+invalidated per table by the app's write paths
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+DEFAULT_TTL = float(os.environ.get('F1_CACHE_TTL', 60))
+LOOKUP_TTL = float(os.environ.get('F1_CACHE_LOOKUP_TTL', 600))
+MAX_BYTES = int(os.environ.get('F1_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+# Tables read by each read-only stored procedure
+PROCEDURE_TABLES = {
+    'GetDriverStats': ('DRIVER', 'TEAM', 'RESULT'),
+    'GetRaceResults': ('RESULT', 'DRIVER', 'TEAM', 'STATUS'),
+    'GetChampionshipStandings': ('DRIVER_SEASON_STANDINGS', 'DRIVER', 'TEAM'),
+    'GetTeamPerformance': ('TEAM', 'RESULT'),
+}
+
+# Tables written by each write procedure, including trigger side effects
+PROCEDURE_WRITES = {
+    'AddDriver': ('DRIVER',),
+    'AddRaceResult': ('RESULT',),
+    'AddRaceResults': ('RESULT',),
+    'RebuildSeasonStandings': ('DRIVER_SEASON_STANDINGS', 'TEAM_SEASON_STANDINGS'),
+    'AddAuditPartitions': ('AUDIT_LOG',),
+    'PurgeAuditLog': ('AUDIT_LOG',),
+    'RefreshDashboardSnapshot': ('DASHBOARD_SNAPSHOT',),
+}
+
+# Tables that triggers write to whenever a table changes
+TRIGGER_WRITES = {
+    'DRIVER': ('AUDIT_LOG', 'DIMENSION_VERSION'),  # LogNewDriver, Bump*Version
+    'TEAM': ('DIMENSION_VERSION',),
+    'RACE': ('DIMENSION_VERSION',),
+    'STATUS': ('DIMENSION_VERSION',),
+    'RESULT': ('DRIVER_SEASON_STANDINGS', 'TEAM_SEASON_STANDINGS', 'AUDIT_LOG'),  # *Standings, LogResult*
+}
+
+# Base tables behind each view, so view reads are invalidated by writes
+VIEW_TABLES = {
+    'DRIVER_DETAILS': ('DRIVER',),
+    'DRIVER_CAREER_TOTALS': ('DRIVER', 'RESULT'),
+    'TEAM_CAREER_TOTALS': ('TEAM', 'RESULT'),
+}
+
+# Tables read by the stored functions that queries can call inline
+FUNCTION_TABLES = {
+    'GetDriverTotalPoints': ('RESULT',),
+    'CountDriverWins': ('RESULT',),
+    'GetDriverAge': ('DRIVER',),
+    'GetBestFinish': ('RESULT',),
+    'GetTeamTotalPoints': ('RESULT',),
+    'CountTeamWins': ('RESULT',),
+}
+
+_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+_WHITESPACE_RE = re.compile(r'\s+')
+_TABLE_RE = re.compile(r'\b(?:FROM|JOIN|INTO|UPDATE)\s+`?(\w+)`?', re.I)
+_FUNCTION_RE = re.compile(r'\b(' + '|'.join(FUNCTION_TABLES) + r')\s*\(')
+_READ_RE = re.compile(r'\s*\(*\s*(?:SELECT|WITH|SHOW|EXPLAIN|DESCRIBE|DESC)\b', re.I)
+# Anything that could make a SELECT/WITH write or lock (misfires only send a read to the primary)
+_LOCKING_RE = re.compile(r'\b(?:UPDATE|DELETE|INTO|FOR\s+SHARE|LOCK\s+IN\s+SHARE\s+MODE)\b', re.I)
+
+
+def normalize_sql(query):
+    """Strip comments and collapse whitespace so formatting doesn't split cache keys"""
+    query = _COMMENT_RE.sub(' ', query)
+    return _WHITESPACE_RE.sub(' ', query).strip().rstrip(';').strip()
+
+
+def tables_for_sql(query):
+    """Tables a statement reads or writes, including those behind stored functions"""
+    query = _COMMENT_RE.sub(' ', query)
+    tables = {name.upper() for name in _TABLE_RE.findall(query)}
+    for view in tables & VIEW_TABLES.keys():
+        tables.update(VIEW_TABLES[view])
+    for func in _FUNCTION_RE.findall(query):
+        tables.update(FUNCTION_TABLES[func])
+    return frozenset(tables)
+
+
+def is_read_sql(query):
+    """True for statements a replica can answer: no writes, locking reads or SELECT ... INTO"""
+    query = _COMMENT_RE.sub(' ', query)
+    return bool(_READ_RE.match(query)) and not _LOCKING_RE.search(query)
+
+
+def _freeze(params):
+    """Turn query parameters into a hashable key component"""
+    if params is None:
+        return ()
+    if isinstance(params, dict):
+        return tuple(sorted(params.items()))
+    return tuple(params)
+
+
+def _share(value):
+    """Hand out a cached result without letting the caller mutate the cached copy"""
+    if isinstance(value, list):
+        return list(value)
+    return value.copy(deep=False)  # DataFrame: new column index, shared column data
+
+
+def _estimate_size(rows):
+    """Rough in-memory size of a fetched result, extrapolated from its first row"""
+    if hasattr(rows, 'memory_usage'):
+        return int(rows.memory_usage(index=True).sum())
+    size = sys.getsizeof(rows)
+    if rows:
+        first = rows[0]
+        values = first.values() if isinstance(first, dict) else first
+        row_size = sys.getsizeof(first) + sum(sys.getsizeof(v) for v in values)
+        size += row_size * len(rows)
+    return size
+
+
+class QueryCache:
+    """Thread-safe result cache keyed on normalized SQL plus parameters"""
+
+    def __init__(self, max_bytes=MAX_BYTES, default_ttl=DEFAULT_TTL):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (rows, expires_at, tables, size)
+        self._by_table = {}  # table -> set of keys depending on it
+        self._generations = {}  # table -> write counter, guards in-flight loads
+        self._epoch = 0  # bumped by clear()
+        self._version = 0  # bumped by every invalidation, for callers memoizing derived data
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    @staticmethod
+    def key(query, params=None):
+        """Cache key for a SQL statement"""
+        return (normalize_sql(query), _freeze(params))
+
+    @staticmethod
+    def procedure_key(proc_name, params=()):
+        """Cache key for a stored procedure call"""
+        return (f"CALL {proc_name}", _freeze(params))
+
+    def get_or_load(self, key, tables, loader, ttl=None):
+        """Return cached rows (or DataFrame) for `key`, or run `loader` and cache what it returns"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return _share(entry[0])
+            if entry is not None:
+                self._drop(key)
+            self._stats['misses'] += 1
+            generation = self._generation(tables)
+
+        rows = loader()
+        if rows is None:
+            return None  # failed statements are never cached
+
+        ttl = self.default_ttl if ttl is None else ttl
+        size = _estimate_size(rows)
+        with self._lock:
+            # A write to a dependent table landed while we were loading
+            if self._generation(tables) != generation or size > self.max_bytes:
+                return rows
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (rows, time.monotonic() + ttl, tables, size)
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+        return _share(rows)
+
+    def invalidate(self, tables):
+        """Evict every entry that depends on any of `tables` or on their trigger targets"""
+        tables = {table.upper() for table in tables}
+        for table in list(tables):
+            tables.update(TRIGGER_WRITES.get(table, ()))
+        with self._lock:
+            self._version += 1
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+                for key in list(self._by_table.get(table, ())):
+                    self._drop(key)
+                    self._stats['invalidations'] += 1
+
+    def clear(self):
+        """Evict everything"""
+        with self._lock:
+            self._epoch += 1
+            self._version += 1
+            self._entries.clear()
+            self._by_table.clear()
+            self._bytes = 0
+
+    def version(self):
+        """Counter that changes whenever any cached data may have gone stale"""
+        with self._lock:
+            return self._version
+
+    def stats(self):
+        """Snapshot of cache counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def _generation(self, tables):
+        return (self._epoch,) + tuple(self._generations.get(table, 0) for table in sorted(tables))
+
+    def _drop(self, key):
+        _, _, tables, size = self._entries.pop(key)
+        self._bytes -= size
+        for table in tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
@@ -0,0 +1,77 @@
+"""
+Concurrent fan-out of independent queries over the shared connection pool
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Keep this below the connection pool size so sequential paths still get a connection
+MAX_WORKERS = int(os.environ.get('F1_QUERY_FANOUT_WORKERS', 6))
+
+
+class QueryFanout:
+    """Runs a batch of independent loaders on a shared thread pool and returns all results together"""
+
+    def __init__(self, max_workers=MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='f1-fanout')
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.tasks = 0
+        self.wall_time = 0.0
+        self.task_time = 0.0
+
+    def _call(self, loader, bind):
+        self._local.worker = True
+        started = time.perf_counter()
+        try:
+            if bind is not None:
+                bind()
+            return loader()
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.task_time += elapsed
+
+    def gather(self, *loaders, bind=None):
+        """Call every zero-argument loader concurrently; results come back in argument order
+
+        `bind` runs first in each worker, to carry per-thread state (UI context,
+        profiler page) over from the calling thread. Exceptions propagate from
+        the first loader that raised, after the whole batch has finished.
+        """
+        started = time.perf_counter()
+        if len(loaders) < 2 or getattr(self._local, 'worker', False):
+            # Nothing to overlap, or already on a worker: nested batches run inline
+            # instead of waiting on a pool they are occupying
+            results = [loader() for loader in loaders]
+            with self._lock:
+                self.task_time += time.perf_counter() - started
+        else:
+            futures = [self._executor.submit(self._call, loader, bind) for loader in loaders]
+            outcomes = [(future.exception(), future) for future in futures]
+            for error, _ in outcomes:
+                if error is not None:
+                    raise error
+            results = [future.result() for _, future in outcomes]
+        with self._lock:
+            self.batches += 1
+            self.tasks += len(loaders)
+            self.wall_time += time.perf_counter() - started
+        return results
+
+    def stats(self):
+        """Batch counts and how much round-trip time overlapping saved"""
+        with self._lock:
+            return {
+                'batches': self.batches,
+                'tasks': self.tasks,
+                'wall_time': self.wall_time,
+                'task_time': self.task_time,
+                'speedup': self.task_time / self.wall_time if self.wall_time else 1.0,
+            }
+
+    def close(self):
+        self._executor.shutdown(wait=False)
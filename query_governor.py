@@ -0,0 +1,275 @@
+"""
+Per-workload execution budgets, KILL QUERY cancellation and admission control
+
+Every statement runs under a workload:
+    'write'     data entry - never queued, never timed out
+    'lookup'    point lookups and page reads - never queued, short budget
+    'analytic'  full-table aggregations - short queue, a few at a time, longer budget
+    'export'    streaming exports - one or two at a time, no budget (they are long by design)
+
+A budget is enforced twice: SELECTs carry a MAX_EXECUTION_TIME optimizer
+hint, and a watchdog sends KILL QUERY from a separate connection shortly
+after the budget for anything the hint can't reach (procedures, CTEs).
+Capping the heavy workloads keeps pool connections and server threads free,
+so writes and lookups always get through.
+"""
+
+import heapq
+import itertools
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from mysql.connector import Error
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+LOOKUP_BUDGET = float(os.environ.get('F1_LOOKUP_BUDGET', 5))
+ANALYTIC_BUDGET = float(os.environ.get('F1_ANALYTIC_BUDGET', 30))
+ANALYTIC_SLOTS = int(os.environ.get('F1_ANALYTIC_SLOTS', 2))
+ANALYTIC_QUEUE = int(os.environ.get('F1_ANALYTIC_QUEUE', 8))
+EXPORT_SLOTS = int(os.environ.get('F1_EXPORT_SLOTS', 1))
+# Longest a queued statement waits for a slot before giving up
+QUEUE_WAIT = float(os.environ.get('F1_QUEUE_WAIT', 30))
+# The server-side hint gets this long to fire before the client kills the statement itself
+KILL_GRACE = 1.0
+# Threads sending KILL QUERY (each opens its own connection), so a slow connect never holds up other deadlines
+KILL_WORKERS = int(os.environ.get('F1_KILL_WORKERS', 2))
+
+# MySQL errors for a statement stopped by MAX_EXECUTION_TIME or KILL QUERY
+CANCELLED_ERRNOS = {3024, 1317}
+
+_SELECT_RE = re.compile(r'^(\s*\(?\s*SELECT)\b', re.I)
+
+
+class Workload:
+    """Budget (seconds, None = unlimited) and concurrency limit (None = unlimited) of one kind of statement"""
+
+    __slots__ = ('name', 'budget', 'slots', 'queue')
+
+    def __init__(self, name, budget=None, slots=None, queue=0):
+        self.name = name
+        self.budget = budget
+        self.slots = slots
+        self.queue = queue
+
+
+WORKLOADS = {
+    'write': Workload('write'),
+    'lookup': Workload('lookup', budget=LOOKUP_BUDGET),
+    'analytic': Workload('analytic', budget=ANALYTIC_BUDGET, slots=ANALYTIC_SLOTS, queue=ANALYTIC_QUEUE),
+    'export': Workload('export', slots=EXPORT_SLOTS, queue=2),
+}
+
+
+class AdmissionError(Error):
+    """A capped workload had no free slot: the queue was full or the wait ran out"""
+
+
+def with_time_limit(query, seconds):
+    """Add a MAX_EXECUTION_TIME hint to a SELECT (other statements are returned unchanged)"""
+    if not seconds:
+        return query
+    return _SELECT_RE.sub(lambda m: f"{m.group(1)} /*+ MAX_EXECUTION_TIME({int(seconds * 1000)}) */",
+                          query, count=1)
+
+
+class _Limiter:
+    """Counting slots with a bounded FIFO-ish wait queue"""
+
+    def __init__(self, workload):
+        self.workload = workload
+        self._cond = threading.Condition()
+        self.running = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+
+    def acquire(self, on_queued):
+        workload = self.workload
+        with self._cond:
+            if self.running < workload.slots and not self.waiting:
+                self.running += 1
+                self.admitted += 1
+                return
+            if self.waiting >= workload.queue:
+                self.rejected += 1
+                raise AdmissionError(
+                    msg=f"Too many {workload.name} queries are running ({self.running} running, "
+                        f"{self.waiting} queued) - try again in a moment"
+                )
+            self.waiting += 1
+            self.queued += 1
+            position = self.waiting
+        if on_queued is not None:
+            on_queued(f"Queued behind {self.running + position - 1} {workload.name} "
+                      f"{'query' if self.running + position - 1 == 1 else 'queries'}...")
+        deadline = time.monotonic() + QUEUE_WAIT
+        with self._cond:
+            try:
+                while self.running >= workload.slots:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        raise AdmissionError(
+                            msg=f"Gave up after waiting {QUEUE_WAIT:.0f}s for a free {workload.name} slot"
+                        )
+                    self._cond.wait(remaining)
+                self.running += 1
+                self.admitted += 1
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        with self._cond:
+            self.running -= 1
+            self._cond.notify()
+
+
+class _Watch:
+    """One running statement that the watchdog kills if it is still running at its deadline"""
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._connection_id = conn.connection_id
+        self._lock = threading.Lock()
+        self.active = True
+        self.fired = False
+
+    def kill(self):
+        # Under the lock, so the kill can never land after the connection went back to the pool
+        with self._lock:
+            if not self.active:
+                return
+            self.fired = True
+            try:
+                self._pool.kill_query(self._connection_id)
+            except Error:
+                pass
+
+    def stop(self):
+        with self._lock:
+            self.active = False
+
+
+class _Watchdog:
+    """A single thread that tracks every statement's deadline, instead of a timer thread per statement
+
+    Finished statements are not removed from the deadline heap; they are
+    skipped when they reach the top. Expired ones are handed to a small kill
+    pool, so the deadline loop itself never waits on MySQL.
+    """
+
+    def __init__(self, kill_workers=KILL_WORKERS):
+        self._cond = threading.Condition()
+        self._heap = []  # (deadline, tiebreak, _Watch)
+        self._order = itertools.count()
+        self._thread = None
+        self._killers = ThreadPoolExecutor(max_workers=kill_workers, thread_name_prefix='query-kill')
+
+    def add(self, watch, seconds):
+        deadline = time.monotonic() + seconds
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._order), watch))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='query-watchdog', daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is watch:
+                # New earliest deadline: wake the watchdog so it doesn't sleep past it
+                self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    while self._heap and not self._heap[0][2].active:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    remaining = self._heap[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        watch = heapq.heappop(self._heap)[2]
+                        break
+                    self._cond.wait(remaining)
+            self._killers.submit(watch.kill)
+
+
+class QueryGovernor:
+    """Admission control and budget enforcement for the workloads in WORKLOADS"""
+
+    def __init__(self, workloads=None):
+        self.workloads = workloads or WORKLOADS
+        self._limiters = {name: _Limiter(workload) for name, workload in self.workloads.items()
+                          if workload.slots is not None}
+        self._lock = threading.Lock()
+        self._watchdog = _Watchdog()
+        self.cancelled = {name: 0 for name in self.workloads}
+
+    @contextmanager
+    def admit(self, workload, on_queued=None):
+        """Hold a slot of `workload` for the duration (at once for uncapped workloads)
+
+        `on_queued(message)` is called if the statement has to wait. Raises
+        AdmissionError if the queue is full or the wait runs out.
+        """
+        limiter = self._limiters.get(workload)
+        if limiter is None:
+            yield
+            return
+        limiter.acquire(on_queued)
+        try:
+            yield
+        finally:
+            limiter.release()
+
+    def prepare(self, query, workload):
+        """The statement text to send: SELECTs get the workload's MAX_EXECUTION_TIME hint"""
+        return with_time_limit(query, self.workloads[workload].budget)
+
+    @contextmanager
+    def watch(self, workload, pool, conn):
+        """KILL QUERY the statement on `conn` if it runs KILL_GRACE past the workload's budget"""
+        budget = self.workloads[workload].budget
+        if not budget:
+            yield
+            return
+        watch = _Watch(pool, conn)
+        self._watchdog.add(watch, budget + KILL_GRACE)
+        try:
+            yield
+        finally:
+            watch.stop()
+
+    def explain(self, error, workload):
+        """User-facing message for a statement stopped by its budget (None for any other error)"""
+        if getattr(error, 'errno', None) not in CANCELLED_ERRNOS:
+            return None
+        with self._lock:
+            self.cancelled[workload] += 1
+        budget = self.workloads[workload].budget
+        return (f"Query cancelled: it ran past the {budget:g}s budget for {workload} queries"
+                if budget else "Query cancelled")
+
+    def stats(self):
+        """Per-workload running / queued / rejected / cancelled counters"""
+        with self._lock:
+            cancelled = dict(self.cancelled)
+        stats = {}
+        for name, workload in self.workloads.items():
+            limiter = self._limiters.get(name)
+            stats[name] = {
+                'budget': workload.budget,
+                'slots': workload.slots,
+                'running': limiter.running if limiter else None,
+                'waiting': limiter.waiting if limiter else None,
+                'queued': limiter.queued if limiter else 0,
+                'rejected': limiter.rejected if limiter else 0,
+                'cancelled': cancelled[name],
+            }
+        return stats
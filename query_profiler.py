@@ -0,0 +1,134 @@
+"""
+Per-statement timing instrumentation for execute_query() / call_procedure()
+"""
+
+import bisect
+import os
+import threading
+
+# Latency histogram bucket upper bounds, in milliseconds
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float('inf'))
+
+# Correlate with performance_schema on the profiler page (needs SELECT on performance_schema)
+SERVER_SIDE = os.environ.get('F1_PROFILE_SERVER_SIDE', '0') == '1'
+
+
+class StatementStats:
+    """Running totals and a latency histogram for one statement"""
+
+    __slots__ = ('statement', 'calls', 'errors', 'total', 'max', 'fetch', 'convert',
+                 'converts', 'rows', 'buckets', 'pages')
+
+    def __init__(self, statement):
+        self.statement = statement
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.fetch = 0.0
+        self.convert = 0.0
+        self.converts = 0
+        self.rows = 0
+        self.buckets = [0] * len(BUCKETS_MS)
+        self.pages = {}
+
+    def percentile(self, q):
+        """Latency percentile in ms, as the upper bound of the bucket it falls in"""
+        if not self.calls:
+            return 0.0
+        target = q * self.calls
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max * 1000)
+        return self.max * 1000
+
+    def as_row(self):
+        calls = self.calls or 1
+        return {
+            'Statement': self.statement,
+            'Calls': self.calls,
+            'Errors': self.errors,
+            'Avg_ms': round(self.total / calls * 1000, 2),
+            'p50_ms': round(self.percentile(0.50), 2),
+            'p95_ms': round(self.percentile(0.95), 2),
+            'p99_ms': round(self.percentile(0.99), 2),
+            'Max_ms': round(self.max * 1000, 2),
+            'Total_ms': round(self.total * 1000, 1),
+            'Fetch_ms': round(self.fetch / calls * 1000, 2),
+            'Convert_ms': round(self.convert / self.converts * 1000, 2) if self.converts else None,
+            'Avg_Rows': round(self.rows / calls, 1),
+            'Pages': ', '.join(sorted(self.pages, key=self.pages.get, reverse=True)),
+        }
+
+
+class QueryProfiler:
+    """Thread-safe collector of per-statement latency, row counts and fetch/convert time"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._local = threading.local()
+
+    def set_page(self, page):
+        """Attribute statements issued by the current script run to `page`"""
+        self._local.page = page
+
+    def current_page(self):
+        return getattr(self._local, 'page', None)
+
+    def _entry(self, statement):
+        entry = self._stats.get(statement)
+        if entry is None:
+            entry = self._stats[statement] = StatementStats(statement)
+        return entry
+
+    def record(self, statement, elapsed, fetch_time=0.0, rows=0, error=False, page=None):
+        """Record one execution; `elapsed` includes `fetch_time`, both in seconds"""
+        page = page or self.current_page() or 'unknown'
+        with self._lock:
+            entry = self._entry(statement)
+            entry.calls += 1
+            entry.errors += bool(error)
+            entry.total += elapsed
+            entry.max = max(entry.max, elapsed)
+            entry.fetch += fetch_time
+            entry.rows += rows
+            entry.buckets[bisect.bisect_left(BUCKETS_MS, elapsed * 1000)] += 1
+            entry.pages[page] = entry.pages.get(page, 0) + 1
+
+    def record_convert(self, statement, seconds):
+        """Record time spent turning a statement's rows into a DataFrame"""
+        with self._lock:
+            entry = self._entry(statement)
+            entry.convert += seconds
+            entry.converts += 1
+
+    def report(self):
+        """One summary row per statement, slowest (by total time) first"""
+        with self._lock:
+            rows = [entry.as_row() for entry in self._stats.values() if entry.calls]
+        return sorted(rows, key=lambda row: row['Total_ms'], reverse=True)
+
+    def histogram(self, statement):
+        """(bucket label, count) pairs for one statement"""
+        with self._lock:
+            entry = self._stats.get(statement)
+            counts = list(entry.buckets) if entry else [0] * len(BUCKETS_MS)
+        labels = [f"≤{b:g} ms" if b != float('inf') else f">{BUCKETS_MS[-2]:g} ms" for b in BUCKETS_MS]
+        return list(zip(labels, counts))
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+def procedure_statement(proc_name, params=()):
+    """Statement text a stored procedure call is profiled under"""
+    return f"CALL {proc_name}({', '.join(['%s'] * len(params))})"
+
+
+def digest_probe(statement):
+    """Literal-only version of a profiled statement, for MySQL's STATEMENT_DIGEST()"""
+    return statement.replace('%s', '0')
@@ -0,0 +1,156 @@
+"""
+Season standings engine: round-by-round cumulative driver and team standings for any season
+"""
+
+import os
+import threading
+import time
+from datetime import date
+
+import pandas as pd
+
+# One row per result (or per race with no results yet) of a season. Rounds are
+# numbered by the calendar order, falling back to Race_ID where Round is missing.
+SEASON_QUERY = """
+SELECT
+    DENSE_RANK() OVER (ORDER BY RA.Round, RA.Race_ID) AS Round,
+    RA.Race_ID,
+    RA.Race_Name,
+    RES.Driver_ID,
+    RES.Team_ID,
+    RES.Position,
+    RES.Points
+FROM RACE RA
+LEFT JOIN RESULT RES ON RES.Race_ID = RA.Race_ID
+WHERE RA.Year = %s
+"""
+
+SEASON_DTYPES = {'Round': 'int32', 'Race_ID': 'int32', 'Driver_ID': 'Int32', 'Team_ID': 'Int32'}
+
+# Seasons that are not complete yet are recomputed after this many seconds, so results written by
+# another worker, load_history.py or plain SQL show up without a restart
+CURRENT_SEASON_TTL = float(os.environ.get('F1_STANDINGS_CURRENT_TTL', 30))
+
+# Tables whose writes can change some season's standings
+SOURCE_TABLES = frozenset({'RESULT', 'RACE'})
+
+# Write procedures whose first parameter is the Race_ID they add results to
+RACE_WRITE_PROCEDURES = frozenset({'AddRaceResult', 'AddRaceResults'})
+
+
+class SeasonStandings:
+    """Final and per-round cumulative standings for one season"""
+
+    __slots__ = ('year', 'races', 'drivers', 'teams', 'driver_progression', 'team_progression', 'complete')
+
+    def __init__(self, year, frame):
+        self.year = year
+        self.races = (frame[['Round', 'Race_ID', 'Race_Name']]
+                      .drop_duplicates('Round').sort_values('Round').reset_index(drop=True))
+        results = frame.dropna(subset=['Driver_ID']).assign(
+            Win=lambda df: df['Position'].eq(1).fillna(False).astype('int32'),
+            Podium=lambda df: df['Position'].le(3).fillna(False).astype('int32'),
+        )
+        rounds = self.races['Round']
+
+        self.driver_progression = _progression(results, 'Driver_ID', rounds)
+        self.team_progression = _progression(results, 'Team_ID', rounds)
+        self.drivers = _table(results, 'Driver_ID')
+        # A driver is listed under the team of their latest race that season; the column
+        # exists (empty) before the season's first result too, so the schema never changes
+        latest_team = results.sort_values('Round').groupby('Driver_ID')['Team_ID'].last()
+        self.drivers.insert(2, 'Team_ID', self.drivers['Driver_ID'].map(latest_team).astype('Int32'))
+        self.teams = _table(results, 'Team_ID')
+
+        # Past seasons whose every race has results never change again
+        raced = frame.groupby('Race_ID')['Driver_ID'].count()
+        self.complete = year < date.today().year and len(raced) > 0 and bool((raced > 0).all())
+
+
+def _progression(results, key, rounds):
+    """Cumulative points after each round: rows are rounds, columns are `key` IDs"""
+    per_round = results.pivot_table(index='Round', columns=key, values='Points',
+                                    aggfunc='sum', fill_value=0, observed=True)
+    return per_round.reindex(rounds, fill_value=0).cumsum()
+
+
+def _table(results, key):
+    """Final standings by `key`, ranked on points, then wins, then podiums"""
+    table = (results.groupby(key)
+             .agg(Points=('Points', 'sum'), Wins=('Win', 'sum'), Podiums=('Podium', 'sum'),
+                  Races=('Race_ID', 'nunique'))
+             .reset_index()
+             .sort_values(['Points', 'Wins', 'Podiums'], ascending=False, kind='stable')
+             .reset_index(drop=True))
+    table['Points'] = table['Points'].round(1)
+    table.insert(0, 'Rank', range(1, len(table) + 1))
+    return table
+
+
+class StandingsEngine:
+    """Computes seasons on demand; complete seasons are kept for the life of the process,
+    the rest for `current_ttl` seconds
+
+    `load(query, params, dtypes)` returns a DataFrame, or None on failure.
+    """
+
+    def __init__(self, load, current_ttl=CURRENT_SEASON_TTL):
+        self._load = load
+        self._current_ttl = current_ttl
+        self._lock = threading.Lock()
+        self._seasons = {}
+        self._computed_at = {}  # year -> time.monotonic() when an incomplete season was computed
+        self._race_years = {}
+        self._generation = 0  # guards against caching a season computed across a write
+        self.computed = 0
+        self.hits = 0
+
+    def season(self, year):
+        """SeasonStandings for `year`, or None if it could not be loaded"""
+        with self._lock:
+            standings = self._seasons.get(year)
+            if standings is not None and (
+                standings.complete or time.monotonic() - self._computed_at[year] < self._current_ttl
+            ):
+                self.hits += 1
+                return standings
+            generation = self._generation
+
+        frame = self._load(SEASON_QUERY, (year,), SEASON_DTYPES)
+        if frame is None:
+            return None
+        standings = SeasonStandings(year, frame)
+
+        with self._lock:
+            self.computed += 1
+            if self._generation == generation:
+                self._seasons[year] = standings
+                self._computed_at[year] = time.monotonic()
+                self._race_years.update(dict.fromkeys(standings.races['Race_ID'].tolist(), year))
+        return standings
+
+    def invalidate(self, tables=None, race_id=None):
+        """Drop what a write made stale: the race's season if known, otherwise every affected season"""
+        with self._lock:
+            if race_id is not None:
+                self._generation += 1
+                year = self._race_years.get(race_id)
+                if year is not None:
+                    self._seasons.pop(year, None)
+                else:
+                    # A race we have not seen: only a season that is still running can gain one
+                    for year in [y for y, s in self._seasons.items() if not s.complete]:
+                        del self._seasons[year]
+            elif tables is None or SOURCE_TABLES.intersection(tables):
+                self._generation += 1
+                self._seasons.clear()
+                self._race_years.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'seasons': len(self._seasons),
+                'complete': sum(s.complete for s in self._seasons.values()),
+                'computed': self.computed,
+                'hits': self.hits,
+            }
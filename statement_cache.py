@@ -0,0 +1,92 @@
+"""
+Per-connection cache of server-side prepared statements
+
+A text-protocol query is parsed and planned by MySQL on every execution. A
+prepared statement is parsed once per connection and afterwards only executed
+with new parameter values over the binary protocol. Each pooled connection
+keeps its most recently used statements prepared, keyed on SQL text; the
+least recently used ones are deallocated beyond STATEMENT_CACHE_SIZE (the
+server caps all connections together at max_prepared_stmt_count, 16382 by
+default).
+"""
+
+import os
+from collections import OrderedDict
+
+from mysql.connector import Error
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+STATEMENT_CACHE_SIZE = int(os.environ.get('F1_STATEMENT_CACHE_SIZE', 64))
+
+# "This command is not supported in the prepared statement protocol yet"
+UNSUPPORTED_PS_ERRNO = 1295
+
+
+def _close(cursor):
+    try:
+        cursor.close()
+    except Error:
+        pass
+
+
+class StatementCache:
+    """LRU of prepared cursors for one connection; only used by whoever has the connection checked out"""
+
+    def __init__(self, conn, size=STATEMENT_CACHE_SIZE):
+        self._conn = conn
+        self.size = size
+        self._cursors = OrderedDict()  # SQL text -> (prepared cursor, the text object it was prepared from)
+        self._text_only = {}  # SQL text the server can't prepare -> its reused plain cursor (None until opened)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def execute(self, sql, params=()):
+        """Execute `sql` with bound `params`, prepared if possible; returns the tuple cursor holding the result
+
+        The caller must read the whole result before the connection runs
+        anything else, and must not close the cursor.
+        """
+        if sql in self._text_only:
+            cursor = self._text_only[sql]
+            if cursor is None:
+                cursor = self._text_only[sql] = self._conn.cursor()
+            try:
+                cursor.execute(sql, params)
+            except Error:
+                self._text_only[sql] = None
+                _close(cursor)
+                raise
+            return cursor
+
+        entry = self._cursors.get(sql)
+        if entry is not None:
+            self._cursors.move_to_end(sql)
+            self.hits += 1
+            cursor, prepared_sql = entry
+        else:
+            self.misses += 1
+            cursor, prepared_sql = self._conn.cursor(prepared=True), sql
+            self._cursors[sql] = (cursor, prepared_sql)
+            if len(self._cursors) > self.size:
+                _, (evicted, _) = self._cursors.popitem(last=False)
+                _close(evicted)
+                self.evictions += 1
+        try:
+            # The connector re-prepares unless handed the very same string object it prepared
+            cursor.execute(prepared_sql, params)
+        except Error as e:
+            # A failed or killed execution can leave the statement mid-result: prepare afresh next time
+            del self._cursors[sql]
+            _close(cursor)
+            if getattr(e, 'errno', None) != UNSUPPORTED_PS_ERRNO:
+                raise
+            self._text_only[sql] = None
+            return self.execute(sql, params)
+        return cursor
+
+    def stats(self):
+        return {'prepared': len(self._cursors), 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions}
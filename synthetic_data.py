@@ -0,0 +1,438 @@
+"""
+Deterministic synthetic F1 history at any multiple of the real 1950-2024 record
+
+Each unit of scale is one independent series run over the same 75 seasons as
+the real championship, shaped like it: calendars growing from 7 to 24 races,
+era-specific grid sizes, points systems and retirement rates, driver and team
+careers that carry over between seasons, and finishing orders driven by car
+and driver strength, so wins and points concentrate on a few names the way
+they really do. Scale 1 is about 1,150 races and 25,000 results; the same
+scale and seed always produce the same rows.
+
+Usage:
+    python synthetic_data.py --scale 10 [--database f1_synth] [--seed 1950]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import mysql.connector
+from mysql.connector import Error
+
+from db_pool import DB_CONFIG
+
+FIRST_SEASON = 1950
+LAST_SEASON = 2024
+
+# (first season, points for P1, P2, ...) - the major points-system eras
+POINTS_SYSTEMS = [
+    (1950, (8, 6, 4, 3, 2)),
+    (1960, (8, 6, 4, 3, 2, 1)),
+    (1961, (9, 6, 4, 3, 2, 1)),
+    (1991, (10, 6, 4, 3, 2, 1)),
+    (2003, (10, 8, 6, 5, 4, 3, 2, 1)),
+    (2010, (25, 18, 15, 12, 10, 8, 6, 4, 2, 1)),
+]
+
+# (first season, starters per race)
+GRID_SIZES = [(1950, 22), (1960, 18), (1970, 22), (1978, 26), (1995, 22), (2002, 20), (2010, 24), (2013, 22), (2016, 20)]
+
+# Classified finishers get a position; everything after LAPPED_STATUSES is a retirement (NULL position)
+FINISHED_STATUS = 'Finished'
+LAPPED_STATUSES = ('+1 Lap', '+2 Laps', '+3 Laps')
+RETIREMENT_STATUSES = (
+    'Engine', 'Accident', 'Gearbox', 'Collision', 'Transmission', 'Suspension', 'Hydraulics',
+    'Electrical', 'Spun off', 'Brakes', 'Fuel pressure', 'Overheating', 'Clutch', 'Oil leak',
+    'Wheel', 'Tyre', 'Disqualified', 'Retired',
+)
+STATUSES = (FINISHED_STATUS,) + LAPPED_STATUSES + RETIREMENT_STATUSES
+
+COUNTRIES = (
+    'British', 'Italian', 'Monaco', 'Belgian', 'French', 'German', 'Dutch', 'Spanish', 'Austrian',
+    'Hungarian', 'Brazilian', 'Argentine', 'Mexican', 'Canadian', 'United States', 'Japanese',
+    'Australian', 'Portuguese', 'Swedish', 'South African', 'San Marino', 'European', 'Malaysian',
+    'Bahrain', 'Chinese', 'Turkish', 'Singapore', 'Abu Dhabi', 'Korean', 'Indian', 'Russian',
+    'Azerbaijan', 'Saudi Arabian', 'Qatar', 'Miami', 'Las Vegas', 'Emilia Romagna', 'Pacific',
+)
+NATIONALITIES = (
+    'British', 'Italian', 'German', 'French', 'American', 'Brazilian', 'Finnish', 'Austrian',
+    'Australian', 'Spanish', 'Dutch', 'Belgian', 'Swiss', 'Argentine', 'Japanese', 'Mexican',
+    'Canadian', 'Swedish', 'New Zealander', 'Danish',
+)
+FIRST_NAMES = (
+    'Alan', 'Bruno', 'Carlos', 'Daniel', 'Emerson', 'Felipe', 'Gerhard', 'Hans', 'Ivan', 'Jack',
+    'Jean', 'Juan', 'Kimi', 'Lewis', 'Luigi', 'Max', 'Mika', 'Nelson', 'Niki', 'Oscar', 'Pedro',
+    'Riccardo', 'Sebastian', 'Stirling', 'Thierry', 'Valtteri', 'Wolfgang', 'Yuki',
+)
+LAST_NAMES = (
+    'Ascari', 'Brabham', 'Clark', 'Dumont', 'Ecclestone', 'Fangio', 'Gurney', 'Hill', 'Ickx',
+    'Jones', 'Kubica', 'Lauda', 'Moss', 'Nannini', 'Oliver', 'Piquet', 'Quester', 'Regazzoni',
+    'Stewart', 'Trulli', 'Unser', 'Villeneuve', 'Watson', 'Zanardi', 'Alesi', 'Berger', 'Coulthard',
+)
+
+# Column order of the tuples generated for each table, in foreign-key load order
+COLUMNS = {
+    'STATUS': ('Status_ID', 'Status_description'),
+    'TEAM': ('Team_ID', 'Team_Name', 'Nationality'),
+    'CIRCUIT': ('Circuit_ID', 'Circuit_Name', 'Location'),
+    'DRIVER': ('Driver_ID', 'First_Name', 'Last_Name', 'DOB', 'Team_ID'),
+    'RACE': ('Race_ID', 'Race_Name', 'Venue', 'Year', 'Round', 'Circuit_ID'),
+    'RESULT': ('Result_ID', 'Position', 'Grid', 'Points', 'Race_ID', 'Driver_ID', 'Team_ID', 'Status_ID'),
+    'AUDIT_LOG': ('Table_Name', 'Action', 'Record_ID', 'Old_Value', 'New_Value', 'Changed_By', 'Changed_At'),
+}
+
+# Audit entries are spread over the year before this instant, so they land in p_history
+AUDIT_END = datetime(2024, 12, 31, 23, 0, 0)
+
+
+def _era(table, year):
+    value = table[0][1]
+    for start, era_value in table:
+        if year >= start:
+            value = era_value
+    return value
+
+
+def races_in_season(year):
+    return round(7 + (year - FIRST_SEASON) * 17 / (LAST_SEASON - FIRST_SEASON))
+
+
+def retirement_rate(year):
+    """Share of starters that do not finish: ~45% in 1950 down to ~10% today"""
+    return 0.45 - 0.35 * (year - FIRST_SEASON) / (LAST_SEASON - FIRST_SEASON)
+
+
+class _Team:
+    __slots__ = ('id', 'strength')
+
+    def __init__(self, team_id, strength):
+        self.id = team_id
+        self.strength = strength
+
+
+class _Driver:
+    __slots__ = ('id', 'skill', 'team')
+
+    def __init__(self, driver_id, skill):
+        self.id = driver_id
+        self.skill = skill
+        self.team = None
+
+
+class SyntheticHistory:
+    """All generated rows for `scale` series; RESULT and AUDIT_LOG rows are streamed"""
+
+    def __init__(self, scale=1, seed=1950):
+        if scale < 1:
+            raise ValueError("scale must be at least 1")
+        self.scale = scale
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self.teams = []
+        self.drivers = []
+        self.circuits = []
+        self.races = []  # (Race_ID, Race_Name, Venue, Year, Round, Circuit_ID)
+        self._lineups = {}  # Race_ID -> [(driver, team), ...]
+        self._simulate_rosters()
+
+    # =============================================================
+    # ROSTERS
+    # =============================================================
+    def _new_team(self, rng):
+        team_id = len(self.teams) + 1
+        name = f"{rng.choice(LAST_NAMES)} {rng.choice(('Racing', 'Motorsport', 'F1 Team', 'Engineering', 'Grand Prix'))}"
+        self.teams.append((team_id, f"{name} #{team_id}", rng.choice(NATIONALITIES)))
+        # Log-normal car strength: a couple of dominant teams per era, a long tail of backmarkers
+        return _Team(team_id, rng.lognormvariate(0, 0.5))
+
+    def _new_driver(self, rng, year):
+        driver_id = len(self.drivers) + 1
+        dob = date(year - rng.randint(19, 30), rng.randint(1, 12), rng.randint(1, 28))
+        self.drivers.append([driver_id, rng.choice(FIRST_NAMES), f"{rng.choice(LAST_NAMES)}{driver_id}", dob, None])
+        return _Driver(driver_id, rng.gauss(0, 0.35))
+
+    def _simulate_rosters(self):
+        rng = self._rng
+        circuits_per_series = 80
+        for series in range(self.scale):
+            for i in range(circuits_per_series):
+                circuit_id = len(self.circuits) + 1
+                self.circuits.append((circuit_id, f"Circuit {circuit_id}", rng.choice(COUNTRIES)))
+
+        state = [{'teams': [], 'drivers': []} for _ in range(self.scale)]
+        for year in range(FIRST_SEASON, LAST_SEASON + 1):
+            grid = _era(GRID_SIZES, year)
+            for series in range(self.scale):
+                teams, drivers = self._next_season(rng, state[series], year, grid)
+                circuits = self.circuits[series * circuits_per_series:(series + 1) * circuits_per_series]
+                calendar = rng.sample(circuits, races_in_season(year))
+                for round_no, (circuit_id, _, country) in enumerate(calendar, start=1):
+                    race_id = len(self.races) + 1
+                    self.races.append((race_id, f"{country} Grand Prix", f"Venue {circuit_id}", year, round_no, circuit_id))
+                    # A few entries miss each race (injury, non-qualification, substitutes)
+                    entrants = [d for d in drivers if rng.random() > 0.04] or drivers
+                    self._lineups[race_id] = [(d, d.team) for d in entrants]
+
+    def _next_season(self, rng, state, year, grid):
+        """Carry teams and drivers over from last season, filling the grid with newcomers"""
+        team_count = max(8, (grid + 1) // 2)
+        teams = [t for t in state['teams'] if rng.random() < 0.8]
+        for team in teams:
+            team.strength = max(0.2, team.strength * rng.lognormvariate(0, 0.15))
+        while len(teams) < team_count:
+            teams.append(self._new_team(rng))
+        teams = teams[:team_count]
+
+        drivers = [d for d in state['drivers'] if d.team in teams and rng.random() < 0.72]
+        seats = sorted([t for t in teams for _ in range(2)], key=lambda t: -t.strength)[:grid]
+        while len(drivers) < len(seats):
+            drivers.append(self._new_driver(rng, year))
+        # Better drivers get the seats in stronger cars; a shrinking grid drops the slowest
+        drivers = sorted(drivers, key=lambda d: -(d.skill + rng.gauss(0, 0.25)))[:len(seats)]
+        for driver, team in zip(drivers, seats):
+            driver.team = team
+            self.drivers[driver.id - 1][4] = team.id
+        state['teams'], state['drivers'] = teams, drivers
+        return teams, drivers
+
+    # =============================================================
+    # ROWS
+    # =============================================================
+    def rows(self, table):
+        """Tuples for `table` in COLUMNS order"""
+        if table == 'STATUS':
+            return list(enumerate(STATUSES, start=1))
+        if table == 'TEAM':
+            return list(self.teams)
+        if table == 'CIRCUIT':
+            return list(self.circuits)
+        if table == 'DRIVER':
+            return [tuple(driver) for driver in self.drivers]
+        if table == 'RACE':
+            return list(self.races)
+        if table == 'RESULT':
+            return self._results()
+        if table == 'AUDIT_LOG':
+            return self._audit_log()
+        raise KeyError(table)
+
+    def _results(self):
+        rng = random.Random(self.seed + 1)
+        status_ids = {name: i for i, name in enumerate(STATUSES, start=1)}
+        result_id = 0
+        for race_id, _, _, year, _, _ in self.races:
+            lineup = self._lineups[race_id]
+            points = _era(POINTS_SYSTEMS, year)
+            dnf_rate = retirement_rate(year)
+            pace = {d.id: t.strength + d.skill for d, t in lineup}
+            grid = sorted(lineup, key=lambda e: -(pace[e[0].id] + rng.gauss(0, 0.3)))
+            grid_slot = {d.id: slot for slot, (d, _) in enumerate(grid, start=1)}
+            order = sorted(lineup, key=lambda e: -(pace[e[0].id] + rng.gauss(0, 0.7)))
+            classified, retired = [], []
+            for entry in order:
+                (retired if rng.random() < dnf_rate else classified).append(entry)
+
+            for position, (driver, team) in enumerate(classified, start=1):
+                result_id += 1
+                if position <= len(classified) * 0.6:
+                    status = FINISHED_STATUS
+                else:
+                    status = rng.choice(LAPPED_STATUSES)
+                yield (result_id, position, grid_slot[driver.id],
+                       float(points[position - 1]) if position <= len(points) else 0.0,
+                       race_id, driver.id, team.id, status_ids[status])
+            for driver, team in retired:
+                result_id += 1
+                yield (result_id, None, grid_slot[driver.id], 0.0, race_id, driver.id, team.id,
+                       status_ids[rng.choice(RETIREMENT_STATUSES)])
+
+    def _audit_log(self):
+        """What the audit triggers would have written: driver sign-ups plus result corrections"""
+        rng = random.Random(self.seed + 2)
+        span = 365 * 24 * 3600
+        entries = []
+        for driver_id, first, last, _, _ in self.drivers:
+            entries.append(('DRIVER', 'INSERT', driver_id, None, f"Name: {first} {last}"))
+        # Roughly one correction per forty results, as stewards' decisions and data fixes
+        results = sum(len(lineup) for lineup in self._lineups.values())
+        for _ in range(results // 40):
+            race_id = rng.randint(1, len(self.races))
+            driver_id = rng.randint(1, len(self.drivers))
+            value = f"Race_ID: {race_id}, Driver_ID: {driver_id}, Points: {rng.choice((0, 1, 2, 4, 6))}"
+            action = 'UPDATE' if rng.random() < 0.9 else 'DELETE'
+            entries.append(('RESULT', action, rng.randint(1, results), value, value if action == 'UPDATE' else None))
+        offsets = sorted(rng.randint(0, span) for _ in entries)
+        rng.shuffle(entries)
+        for (table, action, record_id, old, new), offset in zip(entries, offsets):
+            changed_at = AUDIT_END - timedelta(seconds=span - offset)
+            yield (table, action, record_id, old, new, 'synthetic', changed_at.strftime('%Y-%m-%d %H:%M:%S'))
+
+
+# =============================================================
+# LOADING
+# =============================================================
+_DEFINER_RE = re.compile(r'\sDEFINER\s*=\s*`[^`]*`@`[^`]*`', re.I)
+
+
+def _insert_batches(cursor, sql, rows, batch_size=5000):
+    """executemany in fixed-size batches so the generator never holds everything"""
+    batch = []
+    count = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            cursor.executemany(sql, batch)
+            count += len(batch)
+            batch.clear()
+    if batch:
+        cursor.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+def clone_schema(conn, source_db, target_db, routines=True):
+    """Recreate `target_db` with the tables and views of `source_db` (and its procedures/functions)
+
+    Triggers are left out so the synthetic load runs at full speed; add them
+    afterwards with clone_triggers().
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{target_db}`")
+    cursor.execute(f"CREATE DATABASE `{target_db}`")
+    cursor.execute(
+        "SELECT TABLE_NAME FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'",
+        (source_db,)
+    )
+    for (table,) in cursor.fetchall():
+        cursor.execute(f"CREATE TABLE `{target_db}`.`{table}` LIKE `{source_db}`.`{table}`")
+    cursor.execute(
+        "SELECT TABLE_NAME, VIEW_DEFINITION FROM information_schema.VIEWS WHERE TABLE_SCHEMA = %s",
+        (source_db,)
+    )
+    for view, definition in cursor.fetchall():
+        definition = definition.replace(f"`{source_db}`.", f"`{target_db}`.")
+        cursor.execute(f"CREATE VIEW `{target_db}`.`{view}` AS {definition}")
+    cursor.execute(f"USE `{target_db}`")
+
+    if routines:
+        cursor.execute(
+            "SELECT ROUTINE_NAME, ROUTINE_TYPE FROM information_schema.ROUTINES WHERE ROUTINE_SCHEMA = %s",
+            (source_db,)
+        )
+        for name, kind in cursor.fetchall():
+            cursor.execute(f"SHOW CREATE {kind} `{source_db}`.`{name}`")
+            create = cursor.fetchone()[2]
+            cursor.execute(_DEFINER_RE.sub('', create))
+    cursor.close()
+
+
+def clone_triggers(conn, source_db):
+    """Copy the triggers of `source_db` into the current database"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT TRIGGER_NAME FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = %s ORDER BY ACTION_ORDER",
+        (source_db,)
+    )
+    for (name,) in cursor.fetchall():
+        cursor.execute(f"SHOW CREATE TRIGGER `{source_db}`.`{name}`")
+        create = cursor.fetchone()[2]
+        cursor.execute(_DEFINER_RE.sub('', create))
+    cursor.close()
+
+
+def load(conn, history, batch_size=5000, log=print):
+    """Insert every table of `history` into the current database; returns {table: rows}"""
+    counts = {}
+    cursor = conn.cursor()
+    # In case triggers are present: skip per-row standings upkeep, rebuilt below
+    cursor.execute("SET @f1_bulk_load = 1")
+    for table, columns in COLUMNS.items():
+        started = time.perf_counter()
+        sql = (f"INSERT INTO {table} ({', '.join(columns)}) "
+               f"VALUES ({', '.join(['%s'] * len(columns))})")
+        counts[table] = _insert_batches(cursor, sql, history.rows(table), batch_size)
+        conn.commit()
+        log(f"  {table:<24} {counts[table]:>10,} rows ({time.perf_counter() - started:.1f}s)")
+
+    cursor.execute(
+        "INSERT INTO DIMENSION_VERSION (Table_Name, Version) VALUES "
+        "('DRIVER', 1), ('TEAM', 1), ('RACE', 1), ('STATUS', 1) "
+        "ON DUPLICATE KEY UPDATE Version = Version + 1"
+    )
+    # Same aggregation as RebuildSeasonStandings, which may not have been cloned
+    cursor.execute("DELETE FROM DRIVER_SEASON_STANDINGS")
+    cursor.execute("""
+        INSERT INTO DRIVER_SEASON_STANDINGS (Year, Driver_ID, Team_ID, Points, Wins, Podiums, Races)
+        SELECT RA.Year, RES.Driver_ID, RES.Team_ID, SUM(RES.Points),
+               SUM(CASE WHEN RES.Position = 1 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN RES.Position <= 3 THEN 1 ELSE 0 END), COUNT(*)
+        FROM RESULT RES JOIN RACE RA ON RES.Race_ID = RA.Race_ID
+        GROUP BY RA.Year, RES.Driver_ID, RES.Team_ID
+    """)
+    cursor.execute("DELETE FROM TEAM_SEASON_STANDINGS")
+    cursor.execute("""
+        INSERT INTO TEAM_SEASON_STANDINGS (Year, Team_ID, Points, Wins, Podiums, Races)
+        SELECT RA.Year, RES.Team_ID, SUM(RES.Points),
+               SUM(CASE WHEN RES.Position = 1 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN RES.Position <= 3 THEN 1 ELSE 0 END), COUNT(*)
+        FROM RESULT RES JOIN RACE RA ON RES.Race_ID = RA.Race_ID
+        GROUP BY RA.Year, RES.Team_ID
+    """)
+    cursor.execute("SET @f1_bulk_load = NULL")
+    conn.commit()
+
+    cursor.execute("SHOW TABLES")
+    for (table,) in cursor.fetchall():
+        cursor.execute(f"ANALYZE TABLE `{table}`")
+        cursor.fetchall()
+    cursor.close()
+    return counts
+
+
+def build_database(conn, source_db, target_db, scale=1, seed=1950, routines=True, log=print):
+    """Clone `source_db`'s schema into `target_db` and fill it with `scale`x synthetic history"""
+    clone_schema(conn, source_db, target_db, routines=routines)
+    counts = load(conn, SyntheticHistory(scale, seed), log=log)
+    if routines:
+        clone_triggers(conn, source_db)
+        cursor = conn.cursor()
+        cursor.callproc('RefreshDashboardSnapshot')
+        for result in cursor.stored_results():
+            result.fetchall()
+        cursor.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a database of synthetic F1 history")
+    parser.add_argument('--scale', type=int, default=1, help="multiple of the real 1950-2024 history")
+    parser.add_argument('--seed', type=int, default=1950, help="random seed (same seed = same data)")
+    parser.add_argument('--database', default=None, help="target database (default f1_synth_<scale>x)")
+    args = parser.parse_args()
+
+    source_db = DB_CONFIG['database']
+    target_db = args.database or f"f1_synth_{args.scale}x"
+    if target_db == source_db:
+        parser.error("--database must not be the application database")
+
+    config = {k: v for k, v in DB_CONFIG.items() if k != 'database'}
+    started = time.perf_counter()
+    try:
+        conn = mysql.connector.connect(**config)
+        print(f"Building {target_db} at {args.scale}x history (seed {args.seed})...")
+        build_database(conn, source_db, target_db, args.scale, args.seed)
+        conn.close()
+    except Error as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"✅ {target_db} ready in {time.perf_counter() - started:.0f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())